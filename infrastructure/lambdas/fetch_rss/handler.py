@@ -3,17 +3,31 @@ Lambda handler for fetching RSS feeds and scraping forums,
 then storing articles in DynamoDB.
 """
 
+import dataclasses
 import logging
 import os
 import time
+from typing import Optional
 
 import boto3
 from botocore.exceptions import ClientError
 
-from stonksfeed.config import RSS_FEEDS, SI_FORUMS
-from stonksfeed.nlp import SentimentAnalyzer, TickerExtractor
-from stonksfeed.rss.rss_reader import RSSReader
-from stonksfeed.web.siliconinvestor import SiliconInvestorPage
+from stonksfeed.config import FETCH_MAX_WORKERS
+from stonksfeed.deadline import Deadline
+from stonksfeed.dedup import DedupIndex
+from stonksfeed.fetch import (
+    FetchResult,
+    build_forum_readers,
+    build_rss_readers,
+    commit_all,
+    fetch_all,
+)
+from stonksfeed.models import ArticleBatch
+from stonksfeed.net import HedgePolicy, LatencyTracker, RetryPolicy, hedger, host_limiter
+from stonksfeed.nlp import HeadlineClusterer, SentimentAnalyzer, TickerExtractor, enrich_batch
+from stonksfeed.parse_cache import ParseCache
+from stonksfeed.scheduler import AdaptiveScheduler
+from stonksfeed.store import open_store
 
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
@@ -25,34 +39,39 @@ TABLE_NAME = os.environ.get("DYNAMODB_TABLE")
 TTL_DAYS = 30
 # Don't insert articles older than this many days
 MAX_AGE_DAYS = 30
+# Maximum number of sources fetched concurrently
+MAX_WORKERS = int(os.environ.get("FETCH_MAX_WORKERS", FETCH_MAX_WORKERS))
+# Attempts per feed fetch, including the first (1 disables retries)
+RETRY_ATTEMPTS = int(os.environ.get("FETCH_RETRY_ATTEMPTS", "3"))
+# Hedge feed fetches that run past their p95 latency ("0" disables)
+HEDGE_REQUESTS = os.environ.get("FETCH_HEDGE", "1") != "0"
+# Seconds kept back at the end of an invocation for committing reader state
+FINALIZE_RESERVE_SECONDS = 5
+# Seconds kept back after fetching for enriching and storing articles
+STORE_RESERVE_SECONDS = 15
 
 # Initialize NLP analyzers (reused across invocations)
 sentiment_analyzer = SentimentAnalyzer()
-ticker_extractor = TickerExtractor()
-
-
-def is_article_too_old(pubdate: int) -> bool:
-    """Check if an article is older than MAX_AGE_DAYS."""
-    now = int(time.time())
-    max_age_seconds = MAX_AGE_DAYS * 24 * 60 * 60
-    return (now - pubdate) > max_age_seconds
-
-
-def enrich_article(article) -> None:
-    """
-    Enrich an article with NLP data (sentiment and tickers).
-
-    Modifies the article in place.
-    """
-    headline = article.headline
-
-    # Sentiment analysis
-    sentiment = sentiment_analyzer.analyze(headline)
-    article.sentiment_score = sentiment["score"]
-    article.sentiment_label = sentiment["label"]
-
-    # Ticker extraction
-    article.tickers = ticker_extractor.extract(headline)
+# Ticker universe file (the bundled list if unset); compile it with
+# stonksfeed.nlp.tickers.compile_universe so cold starts don't rebuild it
+ticker_extractor = TickerExtractor(universe=os.environ.get("TICKER_UNIVERSE_FILE"))
+# Recent headlines, so near-duplicates share a cluster id (in memory, kept while warm)
+headline_clusterer = HeadlineClusterer()
+
+# Silicon Investor post dates (reused across invocations, persisted between runs)
+post_date_cache = open_store("si_post_dates", ttl_seconds=TTL_DAYS * 24 * 60 * 60)
+# ETag/Last-Modified validators for conditional GET
+validator_store = open_store("http_validators")
+# Newest item seen per feed, so already-seen items are skipped while parsing
+watermark_store = open_store("feed_watermarks")
+# Response latency per source, which sets when a request is hedged
+latency_tracker = LatencyTracker(open_store("feed_latency"))
+# Learned polling interval per source, so each tick only fetches what's due
+scheduler = AdaptiveScheduler(open_store("feed_schedule"))
+# Identities of stored articles, so a story is stored once across feeds
+dedup_index = DedupIndex(open_store("article_identities", ttl_seconds=TTL_DAYS * 24 * 60 * 60))
+# Last parse of each feed by body hash (in memory, so only warm invocations hit)
+parse_cache = ParseCache()
 
 
 def insert_item(client, table_name: str, item: dict) -> bool:
@@ -76,76 +95,117 @@ def insert_item(client, table_name: str, item: dict) -> bool:
         raise
 
 
-def fetch_rss_articles() -> list:
-    """Fetch articles from all configured RSS feeds."""
+def collect_articles(results: list[FetchResult]) -> list:
+    """Log per-source results and flatten the fetched articles."""
     articles = []
-    for feed_config in RSS_FEEDS:
-        try:
-            reader = RSSReader(
-                publisher=feed_config["publisher"],
-                feed_title=feed_config["feed_title"],
-                rss_url=feed_config["rss_url"],
-            )
-            feed_articles = reader.get_articles()
-            articles.extend(feed_articles)
-            logger.info(
-                f"Fetched {len(feed_articles)} articles from {feed_config['feed_title']}"
-            )
-        except Exception as e:
-            logger.error(f"Error fetching {feed_config['feed_title']}: {e}")
+    for result in results:
+        title = result.reader.title
+        if result.deferred:
+            logger.warning(f"Deferred {title}: not fetched before the deadline")
+            continue
+        if not result.ok:
+            logger.error(f"Error fetching {title}: {result.error}")
+            continue
+        if result.reader.not_modified:
+            logger.info(f"{title} not modified since last fetch")
+            continue
+        articles.extend(result.articles)
+        date_formats = dict(result.reader.date_parser.stats)
+        logger.info(
+            f"Fetched {len(result.articles)} new articles from {title} "
+            f"({result.reader.skipped_seen} already seen) "
+            f"in {result.elapsed:.2f}s (date formats: {date_formats})"
+        )
     return articles
 
 
-def fetch_forum_articles() -> list:
-    """Fetch articles from Silicon Investor forums."""
-    articles = []
+def build_readers() -> tuple[list, list]:
+    """Build RSS and forum readers wired to the persistent stores."""
+    options = {
+        "validator_store": validator_store,
+        "watermark_store": watermark_store,
+        "latency": latency_tracker,
+        "parse_cache": parse_cache,
+        "retry": RetryPolicy(attempts=RETRY_ATTEMPTS) if RETRY_ATTEMPTS > 1 else None,
+        "hedge": HedgePolicy() if HEDGE_REQUESTS else None,
+    }
+    rss_readers = build_rss_readers(**options)
+    forum_readers = build_forum_readers(date_cache=post_date_cache, **options)
+    return rss_readers, forum_readers
 
-    for forum_config in SI_FORUMS:
-        try:
-            scraper = SiliconInvestorPage(
-                title=forum_config["title"],
-                url=forum_config["url"],
-            )
-            forum_articles = scraper.get_articles()
-            articles.extend(forum_articles)
-            logger.info(f"Fetched {len(forum_articles)} posts from {forum_config['title']}")
-        except Exception as e:
-            logger.error(f"Error scraping {forum_config['title']}: {e}")
-    return articles
 
+def defer(results: list[FetchResult]) -> list[FetchResult]:
+    """Mark fetched sources deferred, so their state isn't committed."""
+    return [dataclasses.replace(r, deferred=True) if r.ok else r for r in results]
 
-def article_to_dynamodb_item(article: dict) -> dict:
-    """Convert an article dict to DynamoDB item format."""
-    # Calculate TTL: current time + 30 days (in seconds)
-    ttl = int(time.time()) + (TTL_DAYS * 24 * 60 * 60)
 
-    item = {
-        "headline": {"S": article["headline"]},
-        "pubdate": {"N": str(article["pubdate"])},
-        "feed_title": {"S": article["feed_title"]},
-        "link": {"S": article["link"]},
-        "source_type": {"S": article["source_type"]},
-        "author": {"S": article.get("author") or ""},
-        "publisher": {"S": article["publisher"]},
-        "ttl": {"N": str(ttl)},
-    }
+def store_results(
+    results: list[FetchResult], deadline: Optional[Deadline] = None
+) -> tuple[list[FetchResult], dict[str, int]]:
+    """
+    Enrich and insert the articles of each fetched source, in order.
+
+    The deadline is checked before each source is enriched and before
+    each insert. Once it has passed, the source being stored and all
+    after it are marked deferred so their state isn't committed and
+    they are fetched again (first) next run. Inserts are conditional, so
+    articles stored before the cut-off are not duplicated. Only articles
+    actually inserted are added to the dedup index.
+
+    :return: The results (with deferrals applied) and insert counts
+    """
+    counts = {"inserted": 0, "duplicates": 0, "too_old": 0, "same_story": 0}
+    # Calculate TTL once for the run: current time + TTL_DAYS (in seconds)
+    ttl = int(time.time()) + (TTL_DAYS * 24 * 60 * 60)
+    cutoff = int(time.time()) - (MAX_AGE_DAYS * 24 * 60 * 60)
+    stored = []
+    for i, result in enumerate(results):
+        if not result.ok:
+            stored.append(result)
+            continue
+        if deadline is not None and deadline.expired():
+            return stored + defer(results[i:]), counts
+        batch = ArticleBatch.from_articles(result.articles)
 
-    # Add NLP enrichment fields if present
-    if article.get("sentiment_score") is not None:
-        item["sentiment_score"] = {"N": str(article["sentiment_score"])}
-    if article.get("sentiment_label"):
-        item["sentiment_label"] = {"S": article["sentiment_label"]}
-    if article.get("tickers"):
-        item["tickers"] = {"SS": article["tickers"]}
+        # Skip articles older than MAX_AGE_DAYS
+        fresh = batch.newer_than(cutoff)
+        counts["too_old"] += len(batch) - len(fresh)
 
-    return item
+        # Skip stories already stored, from this feed or another
+        new = dedup_index.select_new(fresh)
+        counts["same_story"] += len(fresh) - len(new)
 
+        # Enrich with NLP data, then tag near-duplicate headlines
+        enrich_batch(new, sentiment_analyzer, ticker_extractor)
+        headline_clusterer.assign_batch(new)
 
-def lambda_handler(_event, _context):
+        inserted = [False] * len(new)
+        try:
+            for j, item in enumerate(new.to_dynamodb_items(ttl)):
+                if deadline is not None and deadline.expired():
+                    return stored + defer(results[i:]), counts
+                if insert_item(dynamodb_client, TABLE_NAME, item):
+                    counts["inserted"] += 1
+                    inserted[j] = True
+                else:
+                    counts["duplicates"] += 1
+        finally:
+            # Only stories that made it into the table count as stored
+            dedup_index.add(new.select(inserted))
+        stored.append(result)
+    return stored, counts
+
+
+def lambda_handler(event, context):
     """
     Fetch articles from RSS feeds and forums, store in DynamoDB.
 
-    :param event: Lambda event (not used)
+    Only sources the scheduler considers due are fetched, unless the
+    event contains ``{"force": true}``. The invocation's remaining time
+    is split between fetching, storing and committing state; sources that
+    don't make it are reported as deferred and fetched first next run.
+
+    :param event: Lambda event
     :param context: Lambda context
     :return: Response with status code and message
     """
@@ -156,39 +216,67 @@ def lambda_handler(_event, _context):
             "body": "Configuration error: DYNAMODB_TABLE not set",
         }
 
-    # Fetch from all sources
-    rss_articles = fetch_rss_articles()
-    forum_articles = fetch_forum_articles()
-    all_articles = rss_articles + forum_articles
+    deadline = fetch_deadline = store_deadline = None
+    # Local runs and tests may pass no context, or one without a time limit
+    if hasattr(context, "get_remaining_time_in_millis"):
+        deadline = Deadline.from_lambda_context(context)
+        store_deadline = deadline.minus(FINALIZE_RESERVE_SECONDS)
+        fetch_deadline = store_deadline.minus(STORE_RESERVE_SECONDS)
+
+    rss_readers, forum_readers = build_readers()
+    readers = rss_readers + forum_readers
+    if not (event or {}).get("force"):
+        readers = scheduler.due(readers)
+    logger.info(f"{len(readers)} of {len(rss_readers) + len(forum_readers)} sources due")
+
+    # Fetch the due sources concurrently, most overdue first
+    results = fetch_all(readers, max_workers=MAX_WORKERS, deadline=fetch_deadline)
+    all_articles = collect_articles(results)
+
+    for reader in forum_readers:
+        if reader not in readers:
+            continue
+        logger.info(
+            f"Post dates for {reader.title}: cache {reader.cache_stats}, "
+            f"{reader.dates_from_list} from list page, {reader.post_fetches} post pages fetched"
+        )
+    logger.info(f"Parse cache: {parse_cache.stats} ({len(parse_cache)} feeds cached)")
+    if host_limiter.stats:
+        logger.info(f"Host rate limits: {dict(host_limiter.stats)}")
+    retries = sum(r.reader.retries for r in results)
+    logger.info(f"Retries: {retries}, hedged requests: {hedger.hedges} ({hedger.hedge_wins} won)")
 
     logger.info(f"Total articles fetched: {len(all_articles)}")
 
     # Insert into DynamoDB
-    inserted_count = 0
-    skipped_count = 0
-    old_count = 0
-
-    for article in all_articles:
-        # Skip articles older than MAX_AGE_DAYS
-        if is_article_too_old(article.pubdate):
-            old_count += 1
-            continue
-
-        # Enrich with NLP data
-        enrich_article(article)
-
-        article_dict = article.asdict()
-        item = article_to_dynamodb_item(article_dict)
-
-        if insert_item(dynamodb_client, TABLE_NAME, item):
-            inserted_count += 1
-        else:
-            skipped_count += 1
-
-    message = f"Inserted {inserted_count} new, skipped {skipped_count} duplicates, {old_count} too old"
+    results, counts = store_results(results, store_deadline)
+    # Persist the identities of stored articles once all their writes have succeeded
+    dedup_index.flush()
+
+    logger.info(
+        f"Sentiment cache: {sentiment_analyzer.stats}, "
+        f"{sentiment_analyzer.throughput:.0f} headlines/s scored"
+    )
+
+    # Remember feed state only after the articles have been stored
+    commit_all(results)
+    scheduler.record(results)
+    latency_tracker.flush()
+
+    deferred = [r.reader.title for r in results if r.deferred]
+    message = (
+        f"Inserted {counts['inserted']} new, skipped {counts['duplicates']} duplicates, "
+        f"{counts['same_story']} already stored from another feed or link, "
+        f"{counts['too_old']} too old, deferred {len(deferred)} sources"
+    )
     logger.info(message)
+    if deferred:
+        logger.warning(f"Deferred to next run: {', '.join(deferred)}")
+    if deadline is not None:
+        logger.info(f"Finished with {deadline.remaining():.1f}s to spare")
 
     return {
         "statusCode": 200,
         "body": message,
+        "deferred": deferred,
     }
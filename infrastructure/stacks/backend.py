@@ -2,6 +2,7 @@
 Backend Stack for Stonksfeed
 
 Creates:
+- DynamoDB table for fetcher state kept between runs (caches, watermarks, dedup keys)
 - Lambda function for RSS fetching
 - EventBridge rule for scheduled execution
 """
@@ -17,7 +18,9 @@ from aws_cdk import (
     CfnOutput,
     Duration,
     ILocalBundling,
+    RemovalPolicy,
     Stack,
+    aws_dynamodb as dynamodb,
     aws_events as events,
     aws_events_targets as targets,
     aws_iam as iam,
@@ -107,6 +110,9 @@ class BackendStack(Stack):
         self.table_name = table_name
         self.table_arn = table_arn
 
+        # Create DynamoDB table for fetcher state
+        self.state_table = self._create_state_table()
+
         # Create Lambda function for RSS fetching
         self.fetch_rss_fn = self._create_fetch_rss_lambda()
 
@@ -116,6 +122,33 @@ class BackendStack(Stack):
         # Outputs
         self._create_outputs()
 
+    def _create_state_table(self) -> dynamodb.Table:
+        """
+        Create DynamoDB table for fetcher state.
+
+        Besides caches that only save work (e.g. Silicon Investor post
+        dates), it holds feed watermarks and article identities for
+        deduplication. Losing those makes the next runs re-insert up to a
+        month of articles, so like the articles table it is retained when
+        the stack is destroyed.
+        """
+        return dynamodb.Table(
+            self,
+            "FetcherStateTable",
+            table_name=f"stonksfeed_fetcher_state_{self.env_name}",
+            partition_key=dynamodb.Attribute(
+                name="namespace",
+                type=dynamodb.AttributeType.STRING,
+            ),
+            sort_key=dynamodb.Attribute(
+                name="key",
+                type=dynamodb.AttributeType.STRING,
+            ),
+            billing_mode=dynamodb.BillingMode.PAY_PER_REQUEST,
+            removal_policy=RemovalPolicy.RETAIN,
+            time_to_live_attribute="ttl",
+        )
+
     def _create_fetch_rss_lambda(self) -> lambda_.Function:
         """Create Lambda function for fetching RSS feeds."""
         # Use local bundling to install pip dependencies without Docker
@@ -136,6 +169,7 @@ class BackendStack(Stack):
             memory_size=256,
             environment={
                 "DYNAMODB_TABLE": self.table_name,
+                "STONKSFEED_STATE_TABLE": self.state_table.table_name,
             },
             log_retention=logs.RetentionDays.TWO_WEEKS,
         )
@@ -152,22 +186,23 @@ class BackendStack(Stack):
                 resources=[self.table_arn],
             )
         )
+        self.state_table.grant_read_write_data(fn)
 
         return fn
 
     def _create_schedule(self) -> None:
         """Create EventBridge schedule rule for RSS fetching."""
-        # Schedule: Every 3 hours on weekdays
+        # Schedule: Every 15 minutes on weekdays. Each run only fetches the
+        # sources whose learned polling interval has elapsed.
         schedule_rule = events.Rule(
             self,
             "FetchRssSchedule",
             rule_name=f"stonksfeed-fetch-rss-{self.env_name}",
             schedule=events.Schedule.cron(
-                minute="0",
-                hour="0-23/3",
+                minute="0/15",
                 week_day="MON-FRI",
             ),
-            description="Trigger RSS fetch Lambda every 3 hours on weekdays",
+            description="Trigger RSS fetch Lambda every 15 minutes on weekdays",
         )
 
         schedule_rule.add_target(targets.LambdaFunction(self.fetch_rss_fn))
@@ -0,0 +1 @@
+"""Benchmarks for stonksfeed (run with ``python -m benchmarks.<name>``)."""
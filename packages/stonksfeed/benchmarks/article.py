@@ -0,0 +1,129 @@
+"""
+Compare the slotted Article and its direct encoders with the old plain dataclass.
+
+Builds N enriched articles with each model, and an ArticleBatch holding
+the same articles as columns, and measures memory per article and the
+time to serialize them all as dicts, JSON and DynamoDB items. The old
+model is reproduced here with the encoding it used: ``dataclasses.asdict``
+followed by the handler's dict-to-item conversion.
+
+Usage: python -m benchmarks.article [N]
+"""
+
+import dataclasses
+import json
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Iterator, List, Optional
+
+from benchmarks.common import best_time, peak_memory, print_table
+from stonksfeed.models import Article, ArticleBatch
+
+TTL = int(time.time()) + 30 * 24 * 60 * 60
+
+
+@dataclass
+class LegacyArticle:
+    """The Article model before it was slotted."""
+
+    publisher: str
+    feed_title: str
+    headline: str
+    link: str
+    pubdate: int
+    source_type: str
+    author: Optional[str] = None
+    sentiment_score: Optional[float] = None
+    sentiment_label: Optional[str] = None
+    tickers: List[str] = field(default_factory=list)
+
+    def asdict(self) -> dict:
+        return dataclasses.asdict(self)
+
+
+def legacy_dynamodb_item(article: dict) -> dict:
+    """The handler's old conversion of an article dict to a DynamoDB item."""
+    item = {
+        "headline": {"S": article["headline"]},
+        "pubdate": {"N": str(article["pubdate"])},
+        "feed_title": {"S": article["feed_title"]},
+        "link": {"S": article["link"]},
+        "source_type": {"S": article["source_type"]},
+        "author": {"S": article.get("author") or ""},
+        "publisher": {"S": article["publisher"]},
+        "ttl": {"N": str(TTL)},
+    }
+    if article.get("sentiment_score") is not None:
+        item["sentiment_score"] = {"N": str(article["sentiment_score"])}
+    if article.get("sentiment_label"):
+        item["sentiment_label"] = {"S": article["sentiment_label"]}
+    if article.get("tickers"):
+        item["tickers"] = {"SS": article["tickers"]}
+    return item
+
+
+def iter_articles(model: type, n: int) -> Iterator:
+    """Yield n enriched articles with distinct headlines, links and authors."""
+    return (
+        model(
+            publisher="MarketWatch",
+            feed_title="Top Stories",
+            headline=f"Headline number {i} about NVDA and AMD",
+            link=f"https://example.com/articles/{i}",
+            pubdate=1700000000 + i,
+            source_type="rss",
+            author=f"Author {i % 50}",
+            sentiment_score=0.25,
+            sentiment_label="positive",
+            tickers=["NVDA", "AMD"],
+        )
+        for i in range(n)
+    )
+
+
+def encoders(model: type) -> dict[str, Callable[[object], object]]:
+    """The three encodings, as used by the CLI and the handler."""
+    if model is LegacyArticle:
+        return {
+            "asdict": lambda a: a.asdict(),
+            "json": lambda a: json.dumps(a.asdict()),
+            "dynamodb": lambda a: legacy_dynamodb_item(a.asdict()),
+        }
+    return {
+        "asdict": lambda a: a.asdict(),
+        "json": lambda a: a.to_json(),
+        "dynamodb": lambda a: a.to_dynamodb_item(TTL),
+    }
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    print(f"{n} articles\n")
+
+    rows = []
+    for name, model in [("dataclass", LegacyArticle), ("slotted", Article)]:
+        peak = peak_memory(lambda: list(iter_articles(model, n)))
+        articles = list(iter_articles(model, n))
+        row = [name, f"{peak / n:.0f}"]
+        for encode in encoders(model).values():
+            seconds = best_time(lambda: [encode(a) for a in articles], repeat=3)
+            row.append(f"{seconds * 1000:.0f}")
+        rows.append(row)
+
+    # Articles are built one at a time and dropped once their row is stored
+    peak = peak_memory(lambda: ArticleBatch.from_articles(iter_articles(Article, n)))
+    batch = ArticleBatch.from_articles(iter_articles(Article, n))
+    row = ["batch", f"{peak / n:.0f}"]
+    for encode in (batch.to_dicts, batch.to_json, lambda: batch.to_dynamodb_items(TTL)):
+        row.append(f"{best_time(encode, repeat=3) * 1000:.0f}")
+    rows.append(row)
+
+    print_table(
+        ["model", "bytes/article", "asdict ms", "json ms", "dynamodb ms"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
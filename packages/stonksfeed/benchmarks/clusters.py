@@ -0,0 +1,55 @@
+"""
+Time headline clustering as the rolling window fills up.
+
+Assigns synthetic headlines (a quarter of them rewordings of an earlier
+one) to a HeadlineClusterer and reports the time per headline at each
+window size, which should stay roughly flat.
+
+Usage: python -m benchmarks.clusters [N ...]
+"""
+
+import random
+import sys
+import time
+
+from benchmarks.common import print_table
+from stonksfeed.nlp import HeadlineClusterer
+
+SUBJECTS = ["Nvidia", "Apple", "Tesla", "Microsoft", "Amazon", "AMD", "Intel", "Meta"]
+VERBS = ["jumps", "falls", "surges", "slides", "rallies", "tumbles"]
+EVENTS = ["earnings", "guidance", "downgrade", "upgrade", "deal", "lawsuit", "recall", "launch"]
+
+
+def headlines(n: int, seed: int = 1) -> list[str]:
+    """n synthetic headlines, some of them rewordings of earlier ones."""
+    rng = random.Random(seed)
+    result: list[str] = []
+    for i in range(n):
+        if result and rng.random() < 0.25:
+            words = rng.choice(result).split()
+            words[1] = rng.choice(VERBS)
+            result.append(" ".join(words))
+        else:
+            subject, verb, event = rng.choice(SUBJECTS), rng.choice(VERBS), rng.choice(EVENTS)
+            result.append(f"{subject} {verb} {rng.randint(1, 20)}% on {event} story {i}")
+    return result
+
+
+def main() -> None:
+    sizes = [int(a) for a in sys.argv[1:]] or [1000, 10000, 20000]
+    clusterer = HeadlineClusterer(max_items=max(sizes))
+    items = headlines(max(sizes))
+    rows = []
+    done = 0
+    for size in sorted(sizes):
+        start = time.perf_counter()
+        for i in range(done, size):
+            clusterer.assign(items[i], str(i), now=i)
+        elapsed = time.perf_counter() - start
+        rows.append([size, f"{elapsed / (size - done) * 1e6:.0f}"])
+        done = size
+    print_table(["headlines held", "us/headline"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+"""Helpers shared by the benchmark scripts."""
+
+import time
+import tracemalloc
+from typing import Callable
+
+
+def best_time(fn: Callable[[], object], repeat: int = 5) -> float:
+    """Return the fastest of ``repeat`` runs of fn, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def peak_memory(fn: Callable[[], object]) -> int:
+    """Return the peak memory allocated while running fn, in bytes."""
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def print_table(headers: list[str], rows: list[list[object]]) -> None:
+    """Print rows as a plain aligned table."""
+    cells = [headers] + [[str(c) for c in row] for row in rows]
+    widths = [max(len(row[i]) for row in cells) for i in range(len(headers))]
+    for n, row in enumerate(cells):
+        print("  ".join(c.rjust(w) for c, w in zip(row, widths)))
+        if n == 0:
+            print("  ".join("-" * w for w in widths))
@@ -0,0 +1,63 @@
+"""
+Build a synthetic fixture corpus covering every configured source.
+
+A corpus recorded from the live sites (``stonksfeed --record DIR``) is
+better; this is for machines that have never had network access.
+
+Usage: python -m benchmarks.corpus DIR [ITEMS_PER_FEED]
+"""
+
+import re
+import sys
+from pathlib import Path
+
+from benchmarks.rss_parser import make_feed
+from stonksfeed.config import RSS_FEEDS, SI_FORUMS
+from stonksfeed.net.replay import Corpus, RecordedResponse
+from stonksfeed.web.siliconinvestor import SiliconInvestorPage
+
+SI_LIST_PAGE = Path(__file__).parent.parent / "tests" / "data" / "siliconinvestor.html"
+
+POST_PAGE_TEMPLATE = """<html><body>
+<div id="msgcontentDiv"><table>
+<tr><td>From:</td><td>Bench Poster</td></tr>
+<tr><td>To:</td><td>1/16/2026 10:{minute:02d}:34 AM</td></tr>
+</table><p>{body}</p></div>
+</body></html>"""
+
+
+def build_synthetic_corpus(path: str | Path, items_per_feed: int = 50) -> Corpus:
+    """
+    Write a corpus answering every request a full fetch makes.
+
+    :param path: Corpus directory
+    :param items_per_feed: Number of items in each synthetic RSS feed
+    """
+    corpus = Corpus(path)
+    headers = {"Content-Type": "application/rss+xml", "ETag": '"bench-1"'}
+    for feed in RSS_FEEDS:
+        body = make_feed(items_per_feed)
+        corpus.save("GET", RecordedResponse(feed["rss_url"], 200, headers, body))
+
+    list_page = SI_LIST_PAGE.read_bytes()
+    html = {"Content-Type": "text/html; charset=utf-8"}
+    for forum in SI_FORUMS:
+        corpus.save("GET", RecordedResponse(forum["url"], 200, html, list_page))
+
+    post_body = "Lorem ipsum dolor sit amet. " * 100
+    for n, msg_id in enumerate(_message_ids(list_page)):
+        page = POST_PAGE_TEMPLATE.format(minute=n % 60, body=post_body).encode()
+        url = f"{SiliconInvestorPage.ROOT_URL}readmsg.aspx?msgid={msg_id}"
+        corpus.save("GET", RecordedResponse(url, 200, html, page))
+    return corpus
+
+
+def _message_ids(page: bytes) -> list[str]:
+    ids = re.findall(rb"readmsg\.aspx\?msgid=(\d+)", page)
+    return list(dict.fromkeys(i.decode() for i in ids))
+
+
+if __name__ == "__main__":
+    items = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    corpus = build_synthetic_corpus(sys.argv[1], items)
+    print(f"Wrote {len(corpus.urls())} responses to {corpus.path}")
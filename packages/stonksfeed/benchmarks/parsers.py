@@ -0,0 +1,89 @@
+"""
+Compare the throughput of each installed HTML parser backend.
+
+Parses the recorded Silicon Investor pages in tests/data and a synthetic
+RSS feed (through the soup fallback), or, with --corpus, every response
+in a fixture corpus recorded with ``stonksfeed --record DIR``.
+
+Usage: python -m benchmarks.parsers [--corpus DIR] [--repeat N]
+"""
+
+import argparse
+import warnings
+from pathlib import Path
+from typing import Callable
+
+from bs4 import XMLParsedAsHTMLWarning
+
+from benchmarks.common import best_time, print_table
+from benchmarks.rss_parser import make_feed
+from stonksfeed.net.replay import Corpus
+from stonksfeed.parsers import available_backends
+from stonksfeed.rss.rss_reader import RSSReader
+from stonksfeed.web.siliconinvestor import SiliconInvestorPage
+
+DATA_DIR = Path(__file__).parent.parent / "tests" / "data"
+SI_URL = "https://www.siliconinvestor.com/subject.aspx?subjectid=58128"
+
+
+def fixture_inputs() -> list[tuple[str, str, bytes]]:
+    """(name, kind, body) of the recorded pages and a 500-item feed."""
+    return [
+        ("si list page", "si list", (DATA_DIR / "siliconinvestor.html").read_bytes()),
+        ("si post page", "si post", (DATA_DIR / "siliconinvestor_post.html").read_bytes()),
+        ("rss, 500 items", "rss", make_feed(500)),
+    ]
+
+
+def corpus_inputs(path: str) -> list[tuple[str, str, bytes]]:
+    """(name, kind, body) of every successful response in a corpus."""
+    corpus = Corpus(path)
+    inputs = []
+    for url in corpus.urls():
+        response = corpus.load("GET", url)
+        if response is None or response.status != 200:
+            continue
+        if "readmsg.aspx" in url:
+            kind = "si post"
+        elif "siliconinvestor.com" in url:
+            kind = "si list"
+        else:
+            kind = "rss"
+        inputs.append((url, kind, response.body))
+    return inputs
+
+
+def parse_fn(parser_type: str, kind: str) -> Callable[[bytes], object]:
+    """Return the reader method that parses one kind of input."""
+    if kind == "rss":
+        reader = RSSReader("Bench", "Bench", "https://example.com/rss", parser_type=parser_type)
+        return reader._soup_entries
+    page = SiliconInvestorPage(title="Bench", url=SI_URL, parser_type=parser_type)
+    return page._find_message_rows if kind == "si list" else page._extract_post_date
+
+
+def main(inputs: list[tuple[str, str, bytes]], repeat: int) -> None:
+    warnings.filterwarnings("ignore", category=XMLParsedAsHTMLWarning)
+    rows = []
+    for name, kind, body in inputs:
+        for parser_type in available_backends():
+            parse = parse_fn(parser_type, kind)
+            seconds = best_time(lambda: parse(body), repeat=repeat)
+            rows.append(
+                [
+                    name[-40:],
+                    f"{len(body) / 1024:.0f} KiB",
+                    parser_type,
+                    f"{seconds * 1000:.2f} ms",
+                    f"{len(body) / seconds / 1024 / 1024:.1f} MiB/s",
+                ]
+            )
+    print_table(["input", "size", "backend", "parse time", "throughput"], rows)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--corpus", metavar="DIR", help="Parse a recorded fixture corpus")
+    parser.add_argument("--repeat", type=int, default=10, help="Runs per input (default: 10)")
+    args = parser.parse_args()
+    main(corpus_inputs(args.corpus) if args.corpus else fixture_inputs(), args.repeat)
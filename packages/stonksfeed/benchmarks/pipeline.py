@@ -0,0 +1,131 @@
+"""
+Run the full fetch pipeline against a replayed fixture corpus.
+
+Every configured RSS feed and forum is fetched through the real readers,
+with responses served from the corpus under synthetic network conditions.
+
+Each run gets a fresh host limiter, either with the configured per-host
+limits or with rate limits lifted. Under the configured limits the
+Silicon Investor host (5 requests/s for the list and post pages) sets
+the wall time, so the gain from fetching sources concurrently only shows
+with the limits lifted; the second table shows where the time goes.
+
+Usage: python -m benchmarks.pipeline [--corpus DIR] [--latency-ms N] [--bandwidth-kbps N]
+"""
+
+import argparse
+import tempfile
+import time
+from collections import defaultdict
+from typing import Optional
+
+from benchmarks.common import print_table
+from benchmarks.corpus import build_synthetic_corpus
+from stonksfeed.fetch import (
+    FetchResult,
+    build_forum_readers,
+    build_rss_readers,
+    commit_all,
+    fetch_all,
+)
+from stonksfeed.net.hosts import HostLimiter, host_of
+from stonksfeed.net.replay import use_corpus
+from stonksfeed.net.session import session_manager
+from stonksfeed.parse_cache import ParseCache
+from stonksfeed.store import MemoryStore
+
+# Rate limits of each run: the configured ones, or none (concurrency per host still applies)
+LIMITS: dict[str, Optional[dict]] = {
+    "configured": None,
+    "lifted": {"rate": 1e9, "host_rates": {}, "burst": 1000},
+}
+
+
+def run(
+    max_workers: int, limits: str, validators=None, date_cache=None, parse_cache=None
+) -> tuple[float, list[FetchResult], int, int]:
+    """Fetch every source once; return seconds, results, requests and bytes."""
+    session_manager.reset()
+    limiter = HostLimiter(**(LIMITS[limits] or {}))
+    options = {"validator_store": validators, "parse_cache": parse_cache, "limiter": limiter}
+    readers = build_rss_readers(**options) + build_forum_readers(
+        max_workers=max_workers, date_cache=date_cache, **options
+    )
+    start = time.perf_counter()
+    results = fetch_all(readers, max_workers=max_workers)
+    seconds = time.perf_counter() - start
+    commit_all(results)
+
+    adapter = session_manager.session.get_adapter("https://")
+    return seconds, results, adapter.requests, adapter.bytes_sent
+
+
+def host_times(results: list[FetchResult]) -> list[list[object]]:
+    """Return hosts, sources and the slowest source's time for each source type."""
+    hosts: dict[str, set[str]] = defaultdict(set)
+    elapsed: dict[str, list[float]] = defaultdict(list)
+    for result in results:
+        hosts[result.reader.source_type].add(host_of(result.reader.url))
+        elapsed[result.reader.source_type].append(result.elapsed)
+    return [
+        [kind, len(hosts[kind]), len(times), f"{max(times):.2f} s"]
+        for kind, times in sorted(elapsed.items())
+    ]
+
+
+def main(corpus_dir: str, latency: float, bandwidth: float) -> None:
+    use_corpus(corpus_dir, "replay", latency=latency, bandwidth=bandwidth)
+
+    validators = MemoryStore()
+    date_cache = MemoryStore()
+    parse_cache = ParseCache()
+    scenarios = [
+        ("sequential", 1, "configured", None, None, None),
+        ("concurrent", 8, "configured", None, None, None),
+        ("sequential", 1, "lifted", None, None, None),
+        ("concurrent", 8, "lifted", None, None, None),
+        ("concurrent, cold caches", 8, "configured", validators, date_cache, parse_cache),
+        ("concurrent, warm caches", 8, "configured", validators, date_cache, parse_cache),
+        # A server that ignores conditional GET: every body is sent again
+        ("warm, no validators", 8, "configured", None, date_cache, None),
+        ("warm, parse cache only", 8, "configured", None, date_cache, parse_cache),
+    ]
+    rows = []
+    host_rows = []
+    for name, workers, limits, *caches in scenarios:
+        seconds, results, requests, sent = run(workers, limits, *caches)
+        articles = sum(len(r.articles) for r in results)
+        rows.append(
+            [
+                name,
+                limits,
+                workers,
+                articles,
+                requests,
+                f"{sent / 1024:.0f} KiB",
+                f"{seconds:.2f} s",
+            ]
+        )
+        if not any(caches):
+            host_rows += [[name, limits, *row] for row in host_times(results)]
+    print_table(
+        ["scenario", "host limits", "workers", "articles", "requests", "transferred", "wall time"],
+        rows,
+    )
+    print()
+    print_table(
+        ["scenario", "host limits", "source type", "hosts", "sources", "slowest source"],
+        host_rows,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--corpus", help="Corpus directory (default: build a synthetic one)")
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--bandwidth-kbps", type=float, default=1024.0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        corpus_dir = args.corpus or build_synthetic_corpus(tmp).path
+        main(str(corpus_dir), args.latency_ms / 1000, args.bandwidth_kbps * 1024)
@@ -0,0 +1,61 @@
+"""
+Compare the streaming RSS parser against the BeautifulSoup parser.
+
+Usage: python -m benchmarks.rss_parser [ITEMS ...]
+"""
+
+import sys
+import warnings
+
+from bs4 import XMLParsedAsHTMLWarning
+
+from benchmarks.common import best_time, peak_memory, print_table
+from stonksfeed.rss.rss_reader import RSSReader
+
+ITEM_TEMPLATE = """
+    <item>
+        <title>Company {n} shares jump after quarterly earnings beat estimates</title>
+        <link>https://example.com/news/{n}</link>
+        <guid isPermaLink="false">example-{n}</guid>
+        <author>Staff Writer</author>
+        <description><![CDATA[<p>{body}</p>]]></description>
+        <pubDate>Wed, 18 Nov 2020 06:{m:02d}:00 GMT</pubDate>
+    </item>"""
+
+
+def make_feed(items: int) -> bytes:
+    """Build a synthetic RSS 2.0 feed with the given number of items."""
+    body = "Lorem ipsum dolor sit amet. " * 20
+    parts = ['<?xml version="1.0"?>\n<rss version="2.0"><channel><title>Bench</title>']
+    parts += [ITEM_TEMPLATE.format(n=n, m=n % 60, body=body) for n in range(items)]
+    parts.append("</channel></rss>")
+    return "".join(parts).encode()
+
+
+def main(sizes: list[int]) -> None:
+    warnings.filterwarnings("ignore", category=XMLParsedAsHTMLWarning)
+    reader = RSSReader(publisher="Bench", feed_title="Bench", rss_url="https://example.com/rss")
+    rows = []
+    for size in sizes:
+        feed = make_feed(size)
+        for name, parse in (
+            ("soup", reader._soup_entries),
+            ("streaming", reader._streaming_entries),
+        ):
+            seconds = best_time(lambda: parse(feed), repeat=3)
+            peak = peak_memory(lambda: parse(feed))
+            rows.append(
+                [
+                    size,
+                    f"{len(feed) / 1024:.0f} KiB",
+                    name,
+                    f"{seconds * 1000:.1f} ms",
+                    f"{size / seconds:,.0f}",
+                    f"{peak / 1024 / 1024:.1f} MiB",
+                ]
+            )
+    print_table(["items", "feed size", "parser", "parse time", "items/s", "peak mem"], rows)
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [100, 1000, 5000])
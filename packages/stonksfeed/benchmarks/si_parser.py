@@ -0,0 +1,48 @@
+"""
+Compare scoped (SoupStrainer) and full parsing of Silicon Investor pages.
+
+Runs against the recorded list page and post page in tests/data.
+
+Usage: python -m benchmarks.si_parser
+"""
+
+from pathlib import Path
+
+from benchmarks.common import best_time, peak_memory, print_table
+from stonksfeed.web.siliconinvestor import SiliconInvestorPage
+
+DATA_DIR = Path(__file__).parent.parent / "tests" / "data"
+
+
+def main() -> None:
+    list_page = (DATA_DIR / "siliconinvestor.html").read_bytes()
+    post_page = (DATA_DIR / "siliconinvestor_post.html").read_bytes()
+    url = "https://www.siliconinvestor.com/subject.aspx?subjectid=58128"
+
+    readers = {
+        mode: SiliconInvestorPage(title="Bench", url=url, scoped_parsing=mode == "scoped")
+        for mode in ("full", "scoped")
+    }
+    rows = []
+    for name, page, method in (
+        ("list page", list_page, "_find_message_rows"),
+        ("post page", post_page, "_extract_post_date"),
+    ):
+        for mode, reader in readers.items():
+            parse = getattr(reader, method)
+            seconds = best_time(lambda: parse(page), repeat=20)
+            peak = peak_memory(lambda: parse(page))
+            rows.append(
+                [
+                    name,
+                    f"{len(page) / 1024:.0f} KiB",
+                    mode,
+                    f"{seconds * 1000:.2f} ms",
+                    f"{peak / 1024:.0f} KiB",
+                ]
+            )
+    print_table(["page", "size", "parse", "cpu time", "peak mem"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Measure what sentiment analysis adds to a cold start.
+
+Each variant runs in a fresh interpreter, as a Lambda cold start would,
+and reports the time to import ``stonksfeed.nlp``, to create the
+analyzer, and to score the first headline (which is when a lazy analyzer
+loads VADER):
+
+- eager: VADER imported and constructed with the analyzer, as before
+- lazy, text lexicon: VADER parses its text files on first use
+- lazy, compiled lexicon: VADER's lexicon is loaded from its compiled form on first use
+
+Usage: python -m benchmarks.startup [--repeat N]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+from benchmarks.common import print_table
+from stonksfeed.nlp.sentiment import compile_lexicon
+
+HEADLINE = "Nvidia beats estimates as data center sales soar"
+
+# How the analyzer was created before lazy loading
+EAGER = """
+from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+analyzer = SentimentAnalyzer(lexicon=None)
+analyzer._vader = SentimentIntensityAnalyzer()
+"""
+
+LAZY = """
+analyzer = SentimentAnalyzer(lexicon={lexicon!r})
+"""
+
+SCRIPT = """
+import json, time
+start = time.perf_counter()
+from stonksfeed.nlp import SentimentAnalyzer
+imported = time.perf_counter()
+{setup}
+created = time.perf_counter()
+analyzer.analyze({headline!r})
+scored = time.perf_counter()
+print(json.dumps([imported - start, created - imported, scored - created]))
+"""
+
+
+def run(setup: str) -> list[float]:
+    """Time import, setup and one score in a fresh interpreter, in seconds."""
+    script = SCRIPT.format(setup=setup, headline=HEADLINE)
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    output = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True, env=env
+    ).stdout
+    return json.loads(output)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        compiled = str(compile_lexicon(os.path.join(tmp, "vader_lexicon.bin")))
+        variants = [
+            ("eager", EAGER),
+            ("lazy, text lexicon", LAZY.format(lexicon=None)),
+            ("lazy, compiled lexicon", LAZY.format(lexicon=compiled)),
+        ]
+        rows = []
+        for name, setup in variants:
+            runs = [run(setup) for _ in range(args.repeat)]
+            # Fastest of each step, to leave out noise from the rest of the machine
+            steps = [min(r[i] for r in runs) for i in range(3)]
+            rows.append([name, *(f"{t * 1000:.1f}" for t in steps + [sum(steps)])])
+
+    print_table(["variant", "import ms", "create ms", "first score ms", "total ms"], rows)
+
+
+if __name__ == "__main__":
+    main()
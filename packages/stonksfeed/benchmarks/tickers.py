@@ -0,0 +1,110 @@
+"""
+Time the ticker universe matcher: building it, loading it from cache and matching.
+
+For each size N, writes a universe of the bundled symbols plus synthetic
+ones up to N symbols, each with a company-name alias; a US listing of
+every stock and ETF is around 10k symbols. Reports how long the matcher
+takes to build and to load from its compiled cache, and the extraction
+time per headline compared with the regex and set lookup used before
+the universe existed (which finds bare symbols only, not names). Half of
+the headlines mention a symbol or a name from the universe.
+
+Usage: python -m benchmarks.tickers [N ...]
+"""
+
+import random
+import re
+import string
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.clusters import headlines
+from benchmarks.common import best_time, print_table
+from stonksfeed.nlp.tickers import (
+    DEFAULT_UNIVERSE,
+    FALSE_POSITIVES,
+    TickerExtractor,
+    TickerMatcher,
+    load_universe,
+)
+
+
+def write_universe(path: Path, n: int, seed: int = 1) -> None:
+    """Write the bundled universe plus random symbols with made-up names, n in all."""
+    rng = random.Random(seed)
+    universe = load_universe(DEFAULT_UNIVERSE)
+    while len(universe) < n:
+        symbol = "".join(rng.choices(string.ascii_uppercase, k=rng.randint(2, 5)))
+        name = "".join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 9))).capitalize()
+        universe.setdefault(symbol, [f"{name} Holdings"])
+    lines = ["\t".join([symbol, *aliases]) for symbol, aliases in sorted(universe.items())]
+    path.write_text("\n".join(lines))
+
+
+def mentioning(texts: list[str], universe: dict[str, list[str]], seed: int = 1) -> list[str]:
+    """Prefix half of the texts with a symbol or a company name from the universe."""
+    rng = random.Random(seed)
+    symbols = sorted(universe)
+    result = []
+    for text in texts:
+        if rng.random() < 0.5:
+            symbol = rng.choice(symbols)
+            mention = rng.choice([symbol, *universe[symbol]])
+            text = f"{mention}: {text}"
+        result.append(text)
+    return result
+
+
+def regex_extract(symbols: set[str]):
+    """The extraction used before: uppercase words looked up in a set."""
+    pattern = re.compile(r"\b([A-Z]{2,5})\b")
+
+    def extract(text: str) -> list[str]:
+        return sorted(
+            {m for m in pattern.findall(text) if m in symbols and m not in FALSE_POSITIVES}
+        )
+
+    return extract
+
+
+def main() -> None:
+    sizes = [int(a) for a in sys.argv[1:]] or [1000, 10000, 100000]
+    rows = []
+    for n in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "universe.tsv"
+            write_universe(path, n)
+            universe = load_universe(path)
+            texts = mentioning(headlines(2000), universe)
+
+            start = time.perf_counter()
+            matcher = TickerMatcher.build(universe)
+            build_seconds = time.perf_counter() - start
+            data = matcher.dumps()
+            load_seconds = best_time(lambda: TickerMatcher.loads(data), repeat=3)
+
+            extractor = TickerExtractor(universe=path, cache_dir=tmp)
+            regex = regex_extract(set(universe))
+            matcher_seconds = best_time(lambda: [extractor.extract(t) for t in texts], repeat=3)
+            regex_seconds = best_time(lambda: [regex(t) for t in texts], repeat=3)
+
+        rows.append(
+            [
+                n,
+                f"{len(data) >> 10} KiB",
+                f"{build_seconds * 1000:.0f} ms",
+                f"{load_seconds * 1000:.1f} ms",
+                f"{matcher_seconds / len(texts) * 1e6:.1f} us",
+                f"{regex_seconds / len(texts) * 1e6:.1f} us",
+            ]
+        )
+    print_table(
+        ["symbols", "compiled", "build", "load compiled", "extract", "regex + set"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
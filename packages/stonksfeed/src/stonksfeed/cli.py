@@ -1,48 +1,59 @@
 """Command-line interface for stonksfeed."""
 
 import argparse
-import json
 import sys
-from typing import Optional
-
-from stonksfeed.config import RSS_FEEDS, SI_FORUMS
-from stonksfeed.rss.rss_reader import RSSReader
+import time
+from typing import Any, Optional
+
+from stonksfeed.config import FETCH_MAX_WORKERS, POST_DATE_TTL_SECONDS
+from stonksfeed.fetch import (
+    FetchResult,
+    build_forum_readers,
+    build_rss_readers,
+    commit_all,
+    fetch_all,
+)
+from stonksfeed.models import ArticleBatch
+from stonksfeed.net.latency import LatencyTracker
+from stonksfeed.net.replay import use_corpus
+from stonksfeed.net.retry import HedgePolicy, RetryPolicy
+from stonksfeed.nlp import SentimentAnalyzer, TickerExtractor, enrich_batch
+from stonksfeed.rss.base import BaseReader
+from stonksfeed.scheduler import AdaptiveScheduler
+from stonksfeed.store import open_store
 from stonksfeed.web.siliconinvestor import SiliconInvestorPage
 
 
-def fetch_rss_articles() -> list[dict]:
-    """Fetch articles from all configured RSS feeds."""
-    articles = []
-    for feed in RSS_FEEDS:
-        try:
-            reader = RSSReader(
-                publisher=feed["publisher"],
-                feed_title=feed["feed_title"],
-                rss_url=feed["rss_url"],
-            )
-            feed_articles = reader.get_articles()
-            articles.extend([a.asdict() for a in feed_articles])
-            print(f"Fetched {len(feed_articles)} articles from {feed['feed_title']}")
-        except Exception as e:
-            print(f"Error fetching {feed['feed_title']}: {e}", file=sys.stderr)
+def _collect(results: list[FetchResult]) -> ArticleBatch:
+    """Report per-source results and gather the fetched articles into one batch."""
+    articles = ArticleBatch()
+    for result in results:
+        reader = result.reader
+        if not result.ok:
+            print(f"Error fetching {reader.title}: {result.error}", file=sys.stderr)
+            continue
+        if reader.not_modified:
+            print(f"{reader.title} not modified since last fetch")
+            continue
+        articles.extend(result.articles)
+        noun = "posts" if isinstance(reader, SiliconInvestorPage) else "articles"
+        print(f"Fetched {len(result.articles)} {noun} from {reader.title}")
     return articles
 
 
-def fetch_forum_posts() -> list[dict]:
-    """Fetch posts from all configured Silicon Investor forums."""
-    articles = []
-    for forum in SI_FORUMS:
-        try:
-            scraper = SiliconInvestorPage(
-                title=forum["title"],
-                url=forum["url"],
-            )
-            forum_articles = scraper.get_articles()
-            articles.extend([a.asdict() for a in forum_articles])
-            print(f"Fetched {len(forum_articles)} posts from {forum['title']}")
-        except Exception as e:
-            print(f"Error fetching {forum['title']}: {e}", file=sys.stderr)
-    return articles
+def print_schedule(readers: list) -> None:
+    """Print the learned polling schedule of each source."""
+    now = time.time()
+    for entry in AdaptiveScheduler(open_store("feed_schedule")).snapshot(readers):
+        if not entry["fetches"]:
+            print(f"{entry['title']}: never fetched (due)")
+            continue
+        due = "due" if entry["due"] else f"due in {(entry['next_due'] - now) / 60:.0f} min"
+        print(
+            f"{entry['title']}: every {entry['interval'] / 60:.0f} min, {due} "
+            f"({entry['changes']}/{entry['fetches']} fetches had new items, "
+            f"{entry['errors']} errors)"
+        )
 
 
 def main(args: Optional[list[str]] = None) -> int:
@@ -74,24 +85,132 @@ def main(args: Optional[list[str]] = None) -> int:
         default="text",
         help="Output format (default: text)",
     )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=FETCH_MAX_WORKERS,
+        help=f"Maximum number of sources fetched concurrently (default: {FETCH_MAX_WORKERS})",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Don't read or write persistent caches",
+    )
+    parser.add_argument(
+        "--new-only",
+        action="store_true",
+        help=(
+            "Only show items not seen by a previous --new-only run, and skip feeds "
+            "unchanged since then (conditional GET)"
+        ),
+    )
+    parser.add_argument(
+        "--retries",
+        type=int,
+        default=0,
+        help="Retry failed feed fetches up to N times with jittered backoff (default: 0)",
+    )
+    parser.add_argument(
+        "--hedge",
+        action="store_true",
+        help="Send a second request when a feed is slower than its usual p95 latency",
+    )
+    corpus = parser.add_mutually_exclusive_group()
+    corpus.add_argument(
+        "--record",
+        metavar="DIR",
+        help="Save every HTTP response into a fixture corpus",
+    )
+    corpus.add_argument(
+        "--replay",
+        metavar="DIR",
+        help="Answer HTTP requests from a fixture corpus instead of the network",
+    )
+    parser.add_argument(
+        "--latency-ms",
+        type=float,
+        default=0.0,
+        help="Synthetic latency per request when replaying (default: 0)",
+    )
+    parser.add_argument(
+        "--bandwidth-kbps",
+        type=float,
+        help="Synthetic bandwidth per connection when replaying, in KiB/s (default: unlimited)",
+    )
+    parser.add_argument(
+        "--enrich",
+        action="store_true",
+        help="Add sentiment and tickers to each article",
+    )
+    parser.add_argument(
+        "--show-schedule",
+        action="store_true",
+        help="Print each source's learned polling schedule and exit",
+    )
 
     parsed = parser.parse_args(args)
 
-    articles = []
+    if parsed.record:
+        use_corpus(parsed.record, "record")
+    elif parsed.replay:
+        bandwidth = parsed.bandwidth_kbps * 1024 if parsed.bandwidth_kbps else None
+        use_corpus(parsed.replay, "replay", parsed.latency_ms / 1000, bandwidth)
+
+    if parsed.show_schedule:
+        print_schedule(build_rss_readers() + build_forum_readers())
+        return 0
+
+    options: dict[str, Any] = {}
+    date_cache = None
+    if not parsed.no_cache:
+        options["latency"] = LatencyTracker(open_store("feed_latency"))
+        date_cache = open_store("si_post_dates", ttl_seconds=POST_DATE_TTL_SECONDS)
+    if parsed.retries:
+        options["retry"] = RetryPolicy(attempts=parsed.retries + 1)
+    if parsed.hedge:
+        options["hedge"] = HedgePolicy()
+    if parsed.new_only:
+        # A 304 returns no articles, so only ask for changes when that's what's wanted
+        options["validator_store"] = open_store("http_validators")
+        options["watermark_store"] = open_store("feed_watermarks")
+
+    readers: list[BaseReader] = []
 
     if not parsed.forums_only:
-        articles.extend(fetch_rss_articles())
+        readers.extend(build_rss_readers(**options))
 
+    forum_readers: list[SiliconInvestorPage] = []
     if not parsed.rss_only:
-        articles.extend(fetch_forum_posts())
+        forum_readers = build_forum_readers(date_cache=date_cache, **options)
+        readers.extend(forum_readers)
+
+    # Fetch every source at once; results come back in the order above
+    results = fetch_all(readers, max_workers=parsed.max_workers)
+    articles = _collect(results)
+
+    for reader in forum_readers:
+        print(
+            f"Post dates for {reader.title}: cache {reader.cache_stats}, "
+            f"{reader.dates_from_list} from list page, {reader.post_fetches} post pages fetched",
+            file=sys.stderr,
+        )
+
+    if parsed.enrich:
+        analyzer = SentimentAnalyzer()
+        enrich_batch(articles, analyzer, TickerExtractor())
+        print(
+            f"Sentiment cache: {analyzer.stats}, {analyzer.throughput:.0f} headlines/s scored",
+            file=sys.stderr,
+        )
 
     # Output results
     if parsed.format == "json":
-        output = json.dumps(articles, indent=2)
+        output = articles.to_json(indent=2)
     else:
         output = f"\nTotal articles fetched: {len(articles)}\n"
-        for article in articles[:10]:  # Show first 10
-            output += f"  - {article['headline'][:60]}... ({article['publisher']})\n"
+        for i in range(min(len(articles), 10)):  # Show first 10
+            article = articles[i]
+            output += f"  - {article.headline[:60]}... ({article.publisher})\n"
         if len(articles) > 10:
             output += f"  ... and {len(articles) - 10} more\n"
 
@@ -102,6 +221,11 @@ def main(args: Optional[list[str]] = None) -> int:
     else:
         print(output)
 
+    # Only remember what we've seen once the output has been written
+    commit_all(results)
+    if "latency" in options:
+        options["latency"].flush()
+
     return 0
 
 
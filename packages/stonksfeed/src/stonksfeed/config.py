@@ -1,5 +1,109 @@
 """Configuration for RSS feeds and forum sources."""
 
+# Maximum number of sources fetched concurrently
+FETCH_MAX_WORKERS = 8
+
+# Maximum number of Silicon Investor post pages fetched concurrently per forum
+POST_FETCH_WORKERS = 8
+
+# How long a Silicon Investor post's date is cached; older posts have long
+# dropped off the list pages, so keeping them only grows the local store
+POST_DATE_TTL_SECONDS = 30 * 24 * 60 * 60
+
+# Maximum number of in-flight requests to any single host
+MAX_REQUESTS_PER_HOST = 6
+
+# Sustained request rate allowed to any single host, in requests per second
+HOST_REQUESTS_PER_SECOND = 10.0
+
+# Per-host overrides of HOST_REQUESTS_PER_SECOND for origins that need care.
+# Silicon Investor serves the list page and every post page from one host.
+HOST_RATE_LIMITS = {
+    "www.siliconinvestor.com": 5.0,
+}
+
+# Requests a host may receive back-to-back before the rate limit applies
+HOST_BURST = 6
+
+# Longest Retry-After we honour before trying a host again, in seconds
+MAX_RETRY_AFTER_SECONDS = 120
+
+# Maximum feed requests (first attempts plus hedges) run by the hedging pool
+HEDGE_MAX_WORKERS = 16
+
+# Number of hosts to keep a keep-alive connection pool for
+HTTP_POOL_CONNECTIONS = 20
+
+# Maximum keep-alive connections kept per host
+HTTP_POOL_MAXSIZE = MAX_REQUESTS_PER_HOST
+
+# How far (in seconds) behind a feed's newest item an unseen item may be
+# dated and still be treated as new
+WATERMARK_GRACE_SECONDS = 6 * 60 * 60
+
+# How often the scheduled fetch runs; no source is polled more often than this
+SCHEDULE_TICK_SECONDS = 15 * 60
+
+# Polling interval for a source until its update rate has been learned
+SCHEDULE_INITIAL_INTERVAL_SECONDS = 60 * 60
+
+# Longest a source goes without being polled, however quiet it is
+SCHEDULE_MAX_INTERVAL_SECONDS = 6 * 60 * 60
+
+# Largest response body read from a source, measured after decompression. A
+# source can set its own with a "max_bytes" key below. Downloads are abandoned
+# as soon as they pass the limit.
+MAX_RESPONSE_BYTES = 5 * 1024 * 1024
+
+# Number of feeds whose last parsed response is kept in memory, so that an
+# identical body (from a server that ignores conditional GET) isn't parsed again
+PARSE_CACHE_MAX_URLS = 64
+
+# Parser backend (see stonksfeed.parsers) for sources that don't name their own
+# with a "parser" key below. Falls back to html.parser if it isn't installed.
+HTML_PARSER = "lxml"
+
+# How long (in seconds) an article's identity is remembered, so the same story
+# from another feed, or with a new pubdate, is recognised as a duplicate
+DEDUP_WINDOW_SECONDS = 30 * 24 * 60 * 60
+
+# How long a headline on its own identifies a story. Syndicated copies turn up
+# within hours, while some headlines ("Stocks making the biggest moves
+# premarket") recur daily for new stories, so this is much shorter
+DEDUP_HEADLINE_WINDOW_SECONDS = 12 * 60 * 60
+
+# Headlines shorter than this many words ("Market update") are too generic to
+# identify a story on their own; such articles are matched by link only
+DEDUP_MIN_HEADLINE_WORDS = 5
+
+# Query parameters that only track where a reader came from; stripped from
+# links before they are compared
+TRACKING_PARAMS = {
+    "cmpid",
+    "fbclid",
+    "gclid",
+    "mc_cid",
+    "mc_eid",
+    "mod",
+    "ref",
+    "siteid",
+    "src",
+    "yptr",
+}
+
+# Estimated word overlap (Jaccard similarity) at which two headlines are
+# treated as the same story and given the same cluster id
+CLUSTER_THRESHOLD = 0.5
+
+# Headlines are clustered against those seen in the last CLUSTER_WINDOW_SECONDS,
+# up to CLUSTER_MAX_ITEMS of them
+CLUSTER_WINDOW_SECONDS = 48 * 60 * 60
+CLUSTER_MAX_ITEMS = 20000
+
+# Number of distinct headlines whose sentiment score is kept in memory, so
+# repeated (e.g. syndicated) headlines aren't scored again
+SENTIMENT_CACHE_SIZE = 4096
+
 # RSS feeds to fetch
 RSS_FEEDS = [
     {
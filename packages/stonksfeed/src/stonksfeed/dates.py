@@ -0,0 +1,169 @@
+"""Fast pubdate parsing for the date formats our sources actually use."""
+
+import re
+import threading
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Iterable, Optional
+
+from dateutil import parser as date_parser
+
+MONTHS = {
+    name: number
+    for number, name in enumerate(
+        ["jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"],
+        start=1,
+    )
+}
+
+# Zone names allowed by RFC 822, as offsets from UTC in hours
+RFC822_ZONES = {
+    "GMT": 0, "UT": 0, "UTC": 0, "Z": 0,
+    "EST": -5, "EDT": -4, "CST": -6, "CDT": -5,
+    "MST": -7, "MDT": -6, "PST": -8, "PDT": -7,
+}  # fmt: skip
+
+# e.g. "Wed, 18 Nov 2020 06:00:00 GMT" or "18 Nov 2020 06:00 -0500"
+_RFC822_RE = re.compile(
+    r"^\s*(?:[A-Za-z]{3},?\s*)?(\d{1,2})\s+([A-Za-z]{3})[a-z]*\s+(\d{4})\s+"
+    r"(\d{1,2}):(\d{2})(?::(\d{2}))?\s*([+-]\d{4}|[A-Za-z]{1,3})?\s*$"
+)
+
+# Silicon Investor, e.g. "1/16/2026 10:29:34 AM"
+_US_DATETIME_RE = re.compile(
+    r"^\s*(\d{1,2})/(\d{1,2})/(\d{4})\s+(\d{1,2}):(\d{2})(?::(\d{2}))?\s*([AaPp][Mm])\s*$"
+)
+
+
+def parse_rfc822(text: str) -> Optional[datetime]:
+    """Parse an RFC 822 date; naive if the string has no zone."""
+    match = _RFC822_RE.match(text)
+    if not match:
+        return None
+    day, month_name, year, hour, minute, second, zone = match.groups()
+    month = MONTHS.get(month_name.lower())
+    if month is None:
+        return None
+
+    tzinfo = None
+    if zone:
+        if zone[0] in "+-":
+            minutes = int(zone[1:3]) * 60 + int(zone[3:5])
+            offset = timedelta(minutes=-minutes if zone[0] == "-" else minutes)
+        elif zone.upper() in RFC822_ZONES:
+            offset = timedelta(hours=RFC822_ZONES[zone.upper()])
+        else:
+            return None
+        tzinfo = timezone.utc if not offset else timezone(offset)
+
+    try:
+        return datetime(
+            int(year), month, int(day), int(hour), int(minute), int(second or 0), 0, tzinfo
+        )
+    except ValueError:
+        return None
+
+
+def parse_iso8601(text: str) -> Optional[datetime]:
+    """Parse an ISO 8601 date such as Atom's "2020-11-18T06:00:00Z"."""
+    text = text.strip()
+    # Cheap guard so non-ISO strings don't pay for an exception
+    if len(text) < 10 or text[4] != "-" or not text[:4].isdigit():
+        return None
+    try:
+        return datetime.fromisoformat(text)
+    except ValueError:
+        return None
+
+
+def parse_us_datetime(text: str) -> Optional[datetime]:
+    """Parse "M/D/YYYY h:mm:ss AM" as used by Silicon Investor (naive)."""
+    match = _US_DATETIME_RE.match(text)
+    if not match:
+        return None
+    month, day, year, hour, minute, second, meridiem = match.groups()
+    hour_24 = int(hour) % 12 + (12 if meridiem.upper() == "PM" else 0)
+    try:
+        return datetime(int(year), int(month), int(day), hour_24, int(minute), int(second or 0))
+    except ValueError:
+        return None
+
+
+# Fast parsers, in the order they're tried when nothing else is known
+FORMATS: dict[str, Callable[[str], Optional[datetime]]] = {
+    "rfc822": parse_rfc822,
+    "iso8601": parse_iso8601,
+    "us_datetime": parse_us_datetime,
+}
+
+
+class PubdateParser:
+    """
+    Parse pubdate strings, trying known fixed formats before dateutil.
+
+    A source almost always uses a single date format, so the format that
+    last succeeded is tried first. ``dateutil`` is only used when none of
+    the fast formats match. One parser is meant to be kept per source.
+    """
+
+    def __init__(self) -> None:
+        self.last_format: Optional[str] = None
+        self.stats: Counter[str] = Counter()
+        self._lock = threading.Lock()
+
+    def _record(self, name: str) -> None:
+        with self._lock:
+            self.stats[name] += 1
+
+    def replay(self, counts: Iterable[tuple[str, int]]) -> None:
+        """
+        Count dates that were parsed earlier and served from a cache.
+
+        The most used fast format becomes the one tried first, as if the
+        dates had been parsed again.
+
+        :param counts: (format name, dates parsed) pairs from the first parse
+        """
+        replayed = Counter(dict(counts))
+        with self._lock:
+            self.stats.update(replayed)
+        fast = [(n, name) for name, n in replayed.items() if name in FORMATS]
+        if fast:
+            self.last_format = max(fast)[1]
+
+    def parse(self, text: str) -> datetime:
+        """
+        Parse a date string.
+
+        The result is naive if the string carries no timezone, the same
+        as ``dateutil.parser.parse``.
+
+        :raises ValueError: if no parser understands the string
+        """
+        last = self.last_format
+        if last is not None:
+            dt = FORMATS[last](text)
+            if dt is not None:
+                self._record(last)
+                return dt
+
+        for name, parse in FORMATS.items():
+            if name == last:
+                continue
+            dt = parse(text)
+            if dt is not None:
+                self.last_format = name
+                self._record(name)
+                return dt
+
+        try:
+            parsed: datetime = date_parser.parse(text)
+        except (ValueError, OverflowError):
+            self._record("failed")
+            raise
+        self._record("dateutil")
+        return parsed
+
+    def to_epoch(self, text: str) -> int:
+        """Parse a date string to a Unix epoch timestamp."""
+        return int(self.parse(text).timestamp())
@@ -0,0 +1,40 @@
+"""Time budgets for work that must finish before a hard deadline."""
+
+import time
+from typing import Callable
+
+
+class Deadline:
+    """
+    A point in time that work has to be finished by.
+
+    Built from a number of seconds left, e.g. what a Lambda context reports,
+    and split into earlier deadlines for each phase with ``minus``.
+    """
+
+    def __init__(self, seconds: float, clock: Callable[[], float] = time.monotonic) -> None:
+        """
+        Initialize the deadline.
+
+        :param seconds: Seconds from now until the deadline
+        :param clock: Monotonic clock, in seconds
+        """
+        self.clock = clock
+        self.at = clock() + seconds
+
+    @classmethod
+    def from_lambda_context(cls, context, clock: Callable[[], float] = time.monotonic):
+        """Deadline at the end of a Lambda invocation."""
+        return cls(context.get_remaining_time_in_millis() / 1000, clock)
+
+    def remaining(self) -> float:
+        """Seconds left, never negative."""
+        return max(0.0, self.at - self.clock())
+
+    def expired(self) -> bool:
+        """True once the deadline has passed."""
+        return self.clock() >= self.at
+
+    def minus(self, seconds: float) -> "Deadline":
+        """Return a deadline ``seconds`` earlier, leaving that much for later work."""
+        return Deadline(self.at - seconds - self.clock(), self.clock)
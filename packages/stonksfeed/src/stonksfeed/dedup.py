@@ -0,0 +1,154 @@
+"""Canonical article identities, so each story is stored once across feeds."""
+
+import hashlib
+import re
+import threading
+import time
+import unicodedata
+from typing import Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from stonksfeed.config import (
+    DEDUP_HEADLINE_WINDOW_SECONDS,
+    DEDUP_MIN_HEADLINE_WORDS,
+    DEDUP_WINDOW_SECONDS,
+    TRACKING_PARAMS,
+)
+from stonksfeed.models import ArticleBatch
+from stonksfeed.store import BaseStore, MemoryStore
+
+_NON_WORD = re.compile(r"[^\w\s]+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_link(url: str) -> str:
+    """
+    Reduce a link to the parts that identify the page.
+
+    Lowercases the host and treats http as https, drops ``www.``, the port,
+    the fragment, a trailing slash and tracking parameters (``utm_*`` and
+    TRACKING_PARAMS), and sorts the parameters that remain.
+    """
+    parts = urlsplit(url.strip())
+    host = (parts.hostname or "").removeprefix("www.")
+    query = sorted(
+        (k, v)
+        for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not k.lower().startswith("utm_") and k.lower() not in TRACKING_PARAMS
+    )
+    scheme = parts.scheme.lower()
+    if scheme == "http":
+        scheme = "https"
+    return urlunsplit((scheme, host, parts.path.rstrip("/"), urlencode(query), ""))
+
+
+def normalize_headline(headline: str) -> str:
+    """Casefold a headline and drop its punctuation and extra whitespace."""
+    text = unicodedata.normalize("NFKC", headline).casefold()
+    return _WHITESPACE.sub(" ", _NON_WORD.sub(" ", text)).strip()
+
+
+def _digest(kind: str, text: str) -> str:
+    return kind + hashlib.blake2b(text.encode(), digest_size=8).hexdigest()
+
+
+def identity_keys(headline: str, link: str) -> tuple[str, ...]:
+    """
+    Return the keys identifying an article.
+
+    One key comes from the normalized link, which catches re-fetches with
+    a drifted pubdate and links that differ only by tracking parameters.
+    The other comes from the normalized headline, which catches the same
+    story syndicated under another publisher's link; it is left out for
+    headlines of fewer than DEDUP_MIN_HEADLINE_WORDS words. Headline keys
+    start with "h:" so the index can remember them for less time.
+    """
+    keys = [_digest("l:", normalize_link(link))]
+    headline = normalize_headline(headline)
+    if headline.count(" ") + 1 >= DEDUP_MIN_HEADLINE_WORDS:
+        keys.append(_digest("h:", headline))
+    return tuple(keys)
+
+
+class DedupIndex:
+    """
+    Identity keys of the articles already stored, kept between runs.
+
+    An article is a duplicate if any of its identity keys was stored
+    recently: within ``window`` seconds for link keys, but only within
+    ``headline_window`` seconds for headline keys, so a headline that
+    recurs daily with a new link is stored each day. Keys live in a hash set in memory (so
+    warm invocations don't ask the store again) backed by a persistent
+    store holding the time each key was first seen; only keys of
+    articles actually stored are added, so articles from a source that
+    was deferred aren't mistaken for duplicates when they come back.
+    """
+
+    def __init__(
+        self,
+        store: Optional[BaseStore] = None,
+        window: int = DEDUP_WINDOW_SECONDS,
+        headline_window: int = DEDUP_HEADLINE_WINDOW_SECONDS,
+    ) -> None:
+        """
+        Initialize the index.
+
+        :param store: Where keys persist between runs (in memory only if None)
+        :param window: How long a link key is remembered, in seconds
+        :param headline_window: How long a headline key is remembered, in seconds
+        """
+        self.store = store if store is not None else MemoryStore()
+        self.window = window
+        self.headline_window = min(headline_window, window)
+        self._seen: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def _cutoff(self, key: str, now: int) -> int:
+        """Return the earliest time at which a key seen counts as recent."""
+        return now - (self.headline_window if key.startswith("h:") else self.window)
+
+    def _recent(self, key: str, now: int) -> bool:
+        seen = self._seen.get(key)
+        return seen is not None and seen >= self._cutoff(key, now)
+
+    def _lookup(self, keys: set[str], now: int) -> set[str]:
+        """Return which of the keys were seen within their window."""
+        with self._lock:
+            missing = [k for k in keys if k not in self._seen]
+        if missing:
+            found = self.store.get_many(missing)
+            with self._lock:
+                self._seen.update(found)
+        with self._lock:
+            return {k for k in keys if self._recent(k, now)}
+
+    def select_new(self, batch: ArticleBatch) -> ArticleBatch:
+        """
+        Return the articles of a batch that haven't been stored before.
+
+        Of several articles in the batch sharing an identity, only the
+        first is kept.
+        """
+        rows = [identity_keys(h, link) for h, link in zip(batch.headline, batch.link)]
+        seen = self._lookup({k for keys in rows for k in keys}, int(time.time()))
+        mask = []
+        for keys in rows:
+            mask.append(seen.isdisjoint(keys))
+            seen.update(keys)
+        return batch.select(mask)
+
+    def add(self, batch: ArticleBatch) -> None:
+        """Remember the identities of articles that have been stored."""
+        now = int(time.time())
+        keys = {k for h, link in zip(batch.headline, batch.link) for k in identity_keys(h, link)}
+        with self._lock:
+            added = {k: now for k in keys if not self._recent(k, now)}
+            self._seen.update(added)
+        self.store.set_many(added)
+
+    def flush(self) -> None:
+        """Persist keys added since the last flush, and forget expired ones."""
+        now = int(time.time())
+        with self._lock:
+            self._seen = {k: t for k, t in self._seen.items() if self._recent(k, now)}
+        self.store.flush()
@@ -0,0 +1,140 @@
+"""Concurrent fetching of articles from RSS feeds and forums."""
+
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Iterable, Optional
+
+from stonksfeed.config import FETCH_MAX_WORKERS, RSS_FEEDS, SI_FORUMS
+from stonksfeed.deadline import Deadline
+from stonksfeed.models.article import Article
+from stonksfeed.rss.base import BaseReader
+from stonksfeed.rss.rss_reader import RSSReader
+from stonksfeed.web.siliconinvestor import SiliconInvestorPage
+
+
+@dataclass
+class FetchResult:
+    """
+    Outcome of fetching a single source.
+
+    A source is ``deferred`` if it didn't finish before the deadline (or
+    its articles couldn't be stored in time); it should be fetched first
+    on the next run.
+    """
+
+    reader: BaseReader
+    articles: list[Article] = field(default_factory=list)
+    error: Optional[Exception] = None
+    elapsed: float = 0.0
+    deferred: bool = False
+
+    @property
+    def ok(self) -> bool:
+        """True if the source was fetched completely, without an error."""
+        return self.error is None and not self.deferred
+
+
+# Optional keys of a source config, and the reader option each one sets
+SOURCE_OPTIONS = {"parser": "parser_type", "max_bytes": "max_bytes"}
+
+
+def _source_options(source: dict, options: dict) -> dict:
+    """Add a source's own settings (parser, byte cap) to the shared reader options."""
+    configured = {option: source[key] for key, option in SOURCE_OPTIONS.items() if key in source}
+    return {**configured, **options}
+
+
+def build_rss_readers(feeds: Iterable[dict] = RSS_FEEDS, **options) -> list[RSSReader]:
+    """
+    Create an RSSReader for each feed config.
+
+    :param feeds: Feed configs
+    :param options: Passed to every reader (shared stores, session); a
+                    ``parser_type`` or ``max_bytes`` here overrides the
+                    feed's own
+    """
+    return [
+        RSSReader(
+            publisher=feed["publisher"],
+            feed_title=feed["feed_title"],
+            rss_url=feed["rss_url"],
+            **_source_options(feed, options),
+        )
+        for feed in feeds
+    ]
+
+
+def build_forum_readers(forums: Iterable[dict] = SI_FORUMS, **options) -> list[SiliconInvestorPage]:
+    """
+    Create a SiliconInvestorPage for each forum config.
+
+    :param forums: Forum configs
+    :param options: Passed to every reader (shared stores, session); a
+                    ``parser_type`` or ``max_bytes`` here overrides the
+                    forum's own
+    """
+    return [
+        SiliconInvestorPage(
+            title=forum["title"], url=forum["url"], **_source_options(forum, options)
+        )
+        for forum in forums
+    ]
+
+
+def fetch_one(reader: BaseReader) -> FetchResult:
+    """
+    Fetch articles from a single reader.
+
+    Any exception raised by the reader is captured on the result so that
+    one failing source never affects the others.
+    """
+    start = time.monotonic()
+    try:
+        articles = reader.get_articles()
+    except Exception as e:
+        return FetchResult(reader=reader, error=e, elapsed=time.monotonic() - start)
+    return FetchResult(reader=reader, articles=articles, elapsed=time.monotonic() - start)
+
+
+def commit_all(results: Iterable[FetchResult]) -> None:
+    """Persist reader state for every source that was fetched successfully."""
+    for result in results:
+        if result.ok:
+            result.reader.commit_state()
+
+
+def fetch_all(
+    readers: Iterable[BaseReader],
+    max_workers: int = FETCH_MAX_WORKERS,
+    deadline: Optional[Deadline] = None,
+) -> list[FetchResult]:
+    """
+    Fetch articles from all readers concurrently.
+
+    Readers are started in the order given, so put the most important
+    first. Sources still queued or running when the deadline passes are
+    returned as deferred; running fetches are abandoned, not waited for.
+
+    :param readers: Readers to fetch from
+    :param max_workers: Maximum number of sources fetched at the same time
+    :param deadline: When to stop waiting for stragglers (no limit if None)
+    :return: One FetchResult per reader, in the same order as ``readers``
+    """
+    readers = list(readers)
+    if not readers:
+        return []
+    workers = max(1, min(max_workers, len(readers)))
+    pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="stonksfeed-fetch")
+    try:
+        futures = [pool.submit(fetch_one, reader) for reader in readers]
+        wait(futures, timeout=deadline.remaining() if deadline else None)
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    return [
+        future.result()
+        if future.done() and not future.cancelled()
+        else FetchResult(reader=reader, deferred=True)
+        for reader, future in zip(readers, futures)
+    ]
@@ -1,5 +1,6 @@
 """Data models for stonksfeed."""
 
 from stonksfeed.models.article import Article
+from stonksfeed.models.batch import ArticleBatch
 
-__all__ = ["Article"]
+__all__ = ["Article", "ArticleBatch"]
@@ -1,12 +1,19 @@
 """Article model for stonksfeed."""
 
-from dataclasses import asdict, dataclass, field
-from typing import List, Optional
+import json
+from dataclasses import dataclass, field
+from typing import Any, List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Article:
-    """Represents a news article or forum post."""
+    """
+    Represents a news article or forum post.
+
+    Slotted, so each instance carries no ``__dict__``. The encoders below
+    build their output straight from the attributes in a single pass;
+    keep them in step with the fields.
+    """
 
     publisher: str
     feed_title: str
@@ -19,10 +26,56 @@ class Article:
     sentiment_score: Optional[float] = None
     sentiment_label: Optional[str] = None
     tickers: List[str] = field(default_factory=list)
+    # Shared by near-duplicate headlines (see stonksfeed.nlp.clusters)
+    cluster_id: Optional[str] = None
 
     def asdict(self) -> dict:
-        """Convert article to dictionary."""
-        return asdict(self)
+        """Convert article to dictionary (with its own copy of ``tickers``)."""
+        return {
+            "publisher": self.publisher,
+            "feed_title": self.feed_title,
+            "headline": self.headline,
+            "link": self.link,
+            "pubdate": self.pubdate,
+            "source_type": self.source_type,
+            "author": self.author,
+            "sentiment_score": self.sentiment_score,
+            "sentiment_label": self.sentiment_label,
+            "tickers": list(self.tickers),
+            "cluster_id": self.cluster_id,
+        }
+
+    def to_json(self) -> str:
+        """Encode the article as a JSON object."""
+        return json.dumps(self.asdict())
+
+    def to_dynamodb_item(self, ttl: int) -> dict:
+        """
+        Encode the article in DynamoDB's attribute value format.
+
+        NLP fields are only included once the article has been enriched.
+
+        :param ttl: Epoch time at which DynamoDB may expire the item
+        """
+        item: dict[str, dict[str, Any]] = {
+            "headline": {"S": self.headline},
+            "pubdate": {"N": str(self.pubdate)},
+            "feed_title": {"S": self.feed_title},
+            "link": {"S": self.link},
+            "source_type": {"S": self.source_type},
+            "author": {"S": self.author or ""},
+            "publisher": {"S": self.publisher},
+            "ttl": {"N": str(ttl)},
+        }
+        if self.sentiment_score is not None:
+            item["sentiment_score"] = {"N": str(self.sentiment_score)}
+        if self.sentiment_label:
+            item["sentiment_label"] = {"S": self.sentiment_label}
+        if self.tickers:
+            item["tickers"] = {"SS": list(self.tickers)}
+        if self.cluster_id:
+            item["cluster_id"] = {"S": self.cluster_id}
+        return item
 
     def __repr__(self) -> str:
         return f"Article(headline='{self.headline[:25]}...' publisher={self.publisher})"
@@ -0,0 +1,267 @@
+"""Column-wise storage for many articles at once."""
+
+import json
+import math
+import sys
+from array import array
+from itertools import compress
+from typing import Any, Iterable, Iterator, Optional, Sequence
+
+from stonksfeed.models.article import Article
+
+# Code stored for a missing string (no sentiment label yet)
+MISSING = -1
+
+
+class ArticleBatch:
+    """
+    Articles stored as columns rather than as one object each.
+
+    Publisher, feed title, source type and sentiment label repeat across
+    a batch, so they are stored as small integer codes into a shared
+    table of interned strings. Publication dates and sentiment scores are
+    machine-typed arrays (a missing score is NaN), and the tickers of all
+    articles share one flat list, with ``offsets[i]:offsets[i + 1]`` the
+    slice belonging to article i.
+
+    Filters take a boolean mask over the rows and return a new batch
+    sharing the string table; nothing is built per article until an
+    Article, dict or DynamoDB item is asked for.
+
+    This is a compact container for passing a source's articles through
+    dedup, enrichment and storage and serializing them in one loop, not a
+    vectorized engine. Readers still build an Article per row, which
+    ``from_articles`` copies into the columns, and the filters compute
+    their masks with Python loops over a column (there is no numpy here).
+    benchmarks/article.py measures about 315 bytes per article against
+    466 for slotted Articles, with serialization about as fast as theirs.
+    """
+
+    __slots__ = (
+        "_strings",
+        "_codes",
+        "_publisher",
+        "_feed_title",
+        "_source_type",
+        "headline",
+        "link",
+        "author",
+        "pubdate",
+        "_score",
+        "_label",
+        "_ticker_offsets",
+        "_tickers",
+        "cluster_id",
+    )
+
+    def __init__(self, _table: Optional[tuple[list[str], dict[str, int]]] = None) -> None:
+        """Create an empty batch."""
+        self._strings, self._codes = _table if _table is not None else ([], {})
+        self._publisher = array("i")
+        self._feed_title = array("i")
+        self._source_type = array("i")
+        self.headline: list[str] = []
+        self.link: list[str] = []
+        self.author: list[Optional[str]] = []
+        self.pubdate = array("q")
+        self._score = array("d")
+        self._label = array("i")
+        self._ticker_offsets = array("I", [0])
+        self._tickers: list[str] = []
+        self.cluster_id: list[Optional[str]] = []
+
+    @classmethod
+    def from_articles(cls, articles: Iterable[Article]) -> "ArticleBatch":
+        """Build a batch holding copies of the given articles' fields."""
+        batch = cls()
+        batch.extend(articles)
+        return batch
+
+    def __len__(self) -> int:
+        return len(self.pubdate)
+
+    def __getitem__(self, i: int) -> Article:
+        label = self._label[i]
+        score = self._score[i]
+        return Article(
+            publisher=self._strings[self._publisher[i]],
+            feed_title=self._strings[self._feed_title[i]],
+            headline=self.headline[i],
+            link=self.link[i],
+            pubdate=self.pubdate[i],
+            source_type=self._strings[self._source_type[i]],
+            author=self.author[i],
+            sentiment_score=None if math.isnan(score) else score,
+            sentiment_label=None if label == MISSING else self._strings[label],
+            tickers=self.tickers(i),
+            cluster_id=self.cluster_id[i],
+        )
+
+    def __iter__(self) -> Iterator[Article]:
+        return (self[i] for i in range(len(self)))
+
+    def __repr__(self) -> str:
+        return f"ArticleBatch({len(self)} articles)"
+
+    def _code(self, value: str) -> int:
+        """Return the code of a string, adding it to the table if it's new."""
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self._strings)
+            self._strings.append(sys.intern(value))
+        return code
+
+    def append(self, article: Article) -> None:
+        """Add an article's fields as a new row."""
+        self._publisher.append(self._code(article.publisher))
+        self._feed_title.append(self._code(article.feed_title))
+        self._source_type.append(self._code(article.source_type))
+        self.headline.append(article.headline)
+        self.link.append(article.link)
+        self.author.append(article.author)
+        self.pubdate.append(article.pubdate)
+        score = article.sentiment_score
+        self._score.append(math.nan if score is None else score)
+        label = article.sentiment_label
+        self._label.append(MISSING if label is None else self._code(label))
+        self._tickers.extend(self._strings[self._code(t)] for t in article.tickers)
+        self._ticker_offsets.append(len(self._tickers))
+        self.cluster_id.append(article.cluster_id)
+
+    def extend(self, articles: Iterable[Article]) -> None:
+        """Add many articles."""
+        for article in articles:
+            self.append(article)
+
+    def tickers(self, i: int) -> list[str]:
+        """Return the tickers of article i."""
+        return self._tickers[self._ticker_offsets[i] : self._ticker_offsets[i + 1]]
+
+    def set_enrichment(
+        self,
+        scores: Sequence[Optional[float]],
+        labels: Sequence[Optional[str]],
+        tickers: Sequence[list[str]],
+    ) -> None:
+        """
+        Replace the NLP columns of every row at once.
+
+        :param scores: Sentiment score per article
+        :param labels: Sentiment label per article
+        :param tickers: Tickers per article
+        :raises ValueError: if a column doesn't have one value per article
+        """
+        if not len(scores) == len(labels) == len(tickers) == len(self):
+            raise ValueError(f"Expected {len(self)} values per column")
+        self._score = array("d", (math.nan if s is None else s for s in scores))
+        self._label = array("i", (MISSING if lb is None else self._code(lb) for lb in labels))
+        self._tickers = [self._strings[self._code(t)] for row in tickers for t in row]
+        offsets = array("I", [0])
+        total = 0
+        for row in tickers:
+            total += len(row)
+            offsets.append(total)
+        self._ticker_offsets = offsets
+
+    def select(self, mask: Sequence[bool]) -> "ArticleBatch":
+        """
+        Return a new batch holding the rows where mask is true.
+
+        :param mask: One flag per article
+        """
+        batch = ArticleBatch((self._strings, self._codes))
+        batch._publisher = array("i", compress(self._publisher, mask))
+        batch._feed_title = array("i", compress(self._feed_title, mask))
+        batch._source_type = array("i", compress(self._source_type, mask))
+        batch.headline = list(compress(self.headline, mask))
+        batch.link = list(compress(self.link, mask))
+        batch.author = list(compress(self.author, mask))
+        batch.pubdate = array("q", compress(self.pubdate, mask))
+        batch._score = array("d", compress(self._score, mask))
+        batch._label = array("i", compress(self._label, mask))
+        batch.cluster_id = list(compress(self.cluster_id, mask))
+        offsets = self._ticker_offsets
+        for i in compress(range(len(self)), mask):
+            batch._tickers.extend(self._tickers[offsets[i] : offsets[i + 1]])
+            batch._ticker_offsets.append(len(batch._tickers))
+        return batch
+
+    def newer_than(self, cutoff: int) -> "ArticleBatch":
+        """Return the articles published at or after ``cutoff`` (epoch seconds)."""
+        return self.select([pubdate >= cutoff for pubdate in self.pubdate])
+
+    def from_source(self, source_type: str) -> "ArticleBatch":
+        """Return the articles of one source type (e.g. "rss")."""
+        code = self._codes.get(source_type, MISSING)
+        return self.select([c == code for c in self._source_type])
+
+    def from_publisher(self, publisher: str) -> "ArticleBatch":
+        """Return the articles of one publisher."""
+        code = self._codes.get(publisher, MISSING)
+        return self.select([c == code for c in self._publisher])
+
+    def to_dicts(self) -> list[dict]:
+        """Return every article as a dict, like Article.asdict()."""
+        strings = self._strings
+        offsets = self._ticker_offsets
+        headline, link, pubdate, author = self.headline, self.link, self.pubdate, self.author
+        dicts = []
+        for i, (publisher, feed_title, source_type, score, label) in enumerate(
+            zip(self._publisher, self._feed_title, self._source_type, self._score, self._label)
+        ):
+            dicts.append(
+                {
+                    "publisher": strings[publisher],
+                    "feed_title": strings[feed_title],
+                    "headline": headline[i],
+                    "link": link[i],
+                    "pubdate": pubdate[i],
+                    "source_type": strings[source_type],
+                    "author": author[i],
+                    "sentiment_score": None if math.isnan(score) else score,
+                    "sentiment_label": None if label == MISSING else strings[label],
+                    "tickers": self._tickers[offsets[i] : offsets[i + 1]],
+                    "cluster_id": self.cluster_id[i],
+                }
+            )
+        return dicts
+
+    def to_json(self, indent: Optional[int] = None) -> str:
+        """Encode the batch as a JSON array of article objects."""
+        return json.dumps(self.to_dicts(), indent=indent)
+
+    def to_dynamodb_items(self, ttl: int) -> list[dict]:
+        """
+        Return every article as a DynamoDB item, like Article.to_dynamodb_item().
+
+        :param ttl: Epoch time at which DynamoDB may expire the items
+        """
+        strings = self._strings
+        offsets = self._ticker_offsets
+        headline, link, pubdate, author = self.headline, self.link, self.pubdate, self.author
+        expires = str(ttl)
+        items = []
+        for i, (publisher, feed_title, source_type, score, label) in enumerate(
+            zip(self._publisher, self._feed_title, self._source_type, self._score, self._label)
+        ):
+            item: dict[str, dict[str, Any]] = {
+                "headline": {"S": headline[i]},
+                "pubdate": {"N": str(pubdate[i])},
+                "feed_title": {"S": strings[feed_title]},
+                "link": {"S": link[i]},
+                "source_type": {"S": strings[source_type]},
+                "author": {"S": author[i] or ""},
+                "publisher": {"S": strings[publisher]},
+                "ttl": {"N": expires},
+            }
+            if not math.isnan(score):
+                item["sentiment_score"] = {"N": str(score)}
+            if label != MISSING and strings[label]:
+                item["sentiment_label"] = {"S": strings[label]}
+            start, end = offsets[i], offsets[i + 1]
+            if start != end:
+                item["tickers"] = {"SS": self._tickers[start:end]}
+            if self.cluster_id[i]:
+                item["cluster_id"] = {"S": self.cluster_id[i]}
+            items.append(item)
+        return items
@@ -0,0 +1,27 @@
+"""Shared HTTP plumbing used by all readers."""
+
+from stonksfeed.net.download import ResponseTooLarge, read_body
+from stonksfeed.net.hosts import HostLimiter, host_limiter
+from stonksfeed.net.latency import LatencyTracker, latency_tracker
+from stonksfeed.net.replay import Corpus, RecordingAdapter, ReplayAdapter, use_corpus
+from stonksfeed.net.retry import HedgePolicy, RetryPolicy, hedger
+from stonksfeed.net.session import SessionManager, get_session, session_manager
+
+__all__ = [
+    "Corpus",
+    "HedgePolicy",
+    "HostLimiter",
+    "LatencyTracker",
+    "RecordingAdapter",
+    "ReplayAdapter",
+    "ResponseTooLarge",
+    "RetryPolicy",
+    "SessionManager",
+    "get_session",
+    "hedger",
+    "host_limiter",
+    "latency_tracker",
+    "read_body",
+    "session_manager",
+    "use_corpus",
+]
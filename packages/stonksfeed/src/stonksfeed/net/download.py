@@ -0,0 +1,53 @@
+"""Size-capped reading of streamed response bodies."""
+
+from typing import Optional
+
+import requests
+
+# Bytes read from the connection at a time
+CHUNK_SIZE = 64 * 1024
+
+
+class ResponseTooLarge(requests.RequestException):
+    """A response body was bigger than its source allows."""
+
+
+def read_body(response: requests.Response, max_bytes: Optional[int] = None) -> bytes:
+    """
+    Read a response made with ``stream=True``, giving up once it passes ``max_bytes``.
+
+    Compressed bodies are decoded chunk by chunk as they arrive and the cap
+    applies to the decoded size, so a small download that inflates to
+    something huge is stopped just as early. A Content-Length over the cap
+    aborts before anything is read. The body is also kept on the response
+    so ``response.content`` works afterwards.
+
+    :param response: Response whose body hasn't been read yet
+    :param max_bytes: Largest body accepted (unlimited if None)
+    :raises ResponseTooLarge: if the body is bigger than ``max_bytes``;
+                              the connection is closed
+    """
+    if max_bytes is not None:
+        length = response.headers.get("Content-Length", "")
+        if length.isdigit() and int(length) > max_bytes:
+            response.close()
+            raise ResponseTooLarge(
+                f"{response.url} is {length} bytes, over the {max_bytes} byte limit",
+                response=response,
+            )
+
+    chunks = []
+    total = 0
+    for chunk in response.iter_content(CHUNK_SIZE):
+        total += len(chunk)
+        if max_bytes is not None and total > max_bytes:
+            response.close()
+            raise ResponseTooLarge(
+                f"{response.url} passed the {max_bytes} byte limit", response=response
+            )
+        chunks.append(chunk)
+
+    body = b"".join(chunks)
+    # What requests itself does when it reads the body, so .content and .text work
+    response._content = body
+    return body
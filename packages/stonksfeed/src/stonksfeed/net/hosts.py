@@ -0,0 +1,182 @@
+"""Per-host politeness: concurrency limits, rate limits and Retry-After."""
+
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable, Iterator, Optional
+from urllib.parse import urlsplit
+
+import requests
+
+from stonksfeed.config import (
+    HOST_BURST,
+    HOST_RATE_LIMITS,
+    HOST_REQUESTS_PER_SECOND,
+    MAX_REQUESTS_PER_HOST,
+    MAX_RETRY_AFTER_SECONDS,
+)
+
+# Statuses whose Retry-After header asks us to back off the whole host
+THROTTLE_STATUSES = {429, 503}
+
+
+def host_of(url: str) -> str:
+    """Return the lowercase host name of a URL."""
+    return (urlsplit(url).hostname or "").lower()
+
+
+def parse_retry_after(value: str) -> Optional[float]:
+    """
+    Parse a Retry-After header into seconds from now.
+
+    :param value: Either a number of seconds or an HTTP date
+    :return: Seconds to wait, or None if the header is malformed
+    """
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class TokenBucket:
+    """
+    Token bucket that hands out reservations instead of blocking.
+
+    Not thread-safe on its own; HostLimiter serializes access.
+    """
+
+    def __init__(self, rate: float, burst: int, now: float) -> None:
+        """
+        Initialize the bucket full.
+
+        :param rate: Tokens added per second
+        :param burst: Maximum tokens held
+        :param now: Current clock reading
+        """
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = now
+
+    def reserve(self, now: float) -> float:
+        """Take a token, returning how many seconds to wait before using it."""
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= 1
+        return max(0.0, -self.tokens / self.rate)
+
+
+class _HostState:
+    def __init__(self, max_in_flight: int, bucket: TokenBucket) -> None:
+        self.semaphore = threading.BoundedSemaphore(max_in_flight)
+        self.bucket = bucket
+        self.blocked_until = 0.0
+
+
+class HostLimiter:
+    """
+    Keep every reader polite to each origin it talks to.
+
+    Requests to a host hold one of ``max_per_host`` slots while in flight
+    and take a token from the host's bucket before starting, so a host
+    sees at most ``burst`` back-to-back requests and then a steady
+    ``rate`` per second. A 429 or 503 with a Retry-After header pauses
+    every request to that host until the time given has passed.
+
+    One limiter is shared by every reader so that concurrent sources
+    hitting the same origin (e.g. several Silicon Investor forums) share
+    a single budget for that host.
+    """
+
+    def __init__(
+        self,
+        max_per_host: int = MAX_REQUESTS_PER_HOST,
+        rate: float = HOST_REQUESTS_PER_SECOND,
+        host_rates: Optional[dict[str, float]] = None,
+        burst: int = HOST_BURST,
+        max_retry_after: float = MAX_RETRY_AFTER_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """
+        Initialize the limiter.
+
+        :param max_per_host: Maximum concurrent requests per host
+        :param rate: Sustained requests per second allowed to a host
+        :param host_rates: Per-host overrides of ``rate``
+        :param burst: Requests a host may receive before the rate applies
+        :param max_retry_after: Cap on how long a Retry-After may pause a host
+        :param clock: Monotonic clock, in seconds
+        :param sleep: Function used to wait
+        """
+        self.max_per_host = max_per_host
+        self.rate = rate
+        self.host_rates = HOST_RATE_LIMITS if host_rates is None else host_rates
+        self.burst = burst
+        self.max_retry_after = max_retry_after
+        self.clock = clock
+        self.sleep = sleep
+        self.stats: Counter[str] = Counter()
+        self._lock = threading.Lock()
+        self._hosts: dict[str, _HostState] = {}
+
+    def _state(self, host: str) -> _HostState:
+        with self._lock:
+            state = self._hosts.get(host)
+            if state is None:
+                rate = self.host_rates.get(host, self.rate)
+                state = _HostState(self.max_per_host, TokenBucket(rate, self.burst, self.clock()))
+                self._hosts[host] = state
+            return state
+
+    def _delay(self, host: str, state: _HostState) -> float:
+        with self._lock:
+            now = self.clock()
+            delay = max(state.bucket.reserve(now), state.blocked_until - now)
+            if delay > 0:
+                self.stats[f"{host} waits"] += 1
+            return delay
+
+    @contextmanager
+    def slot(self, url: str) -> Iterator[None]:
+        """Wait for the host's limits, then hold a request slot for the block."""
+        host = host_of(url)
+        state = self._state(host)
+        with state.semaphore:
+            delay = self._delay(host, state)
+            if delay > 0:
+                self.sleep(delay)
+            yield
+
+    def observe(self, url: str, response: requests.Response) -> None:
+        """Pause the response's host if it asked us to back off."""
+        if response.status_code not in THROTTLE_STATUSES:
+            return
+        retry_after = parse_retry_after(response.headers.get("Retry-After", ""))
+        if retry_after is None:
+            return
+        host = host_of(url)
+        state = self._state(host)
+        with self._lock:
+            until = self.clock() + min(retry_after, self.max_retry_after)
+            state.blocked_until = max(state.blocked_until, until)
+            self.stats[f"{host} throttled"] += 1
+
+    def retry_after(self, url: str) -> float:
+        """Seconds until the URL's host may be contacted again (0 if now)."""
+        state = self._state(host_of(url))
+        with self._lock:
+            return max(0.0, state.blocked_until - self.clock())
+
+
+# Limiter shared by all readers in the process
+host_limiter = HostLimiter()
@@ -0,0 +1,119 @@
+"""Per-source response latency histograms."""
+
+import bisect
+import math
+import threading
+from typing import Optional
+
+from stonksfeed.store import BaseStore
+
+# Bucket upper bounds in seconds: 10ms growing by 25% per bucket, up to ~60s
+BUCKET_BOUNDS = [0.01 * 1.25**i for i in range(40)]
+
+
+class LatencyHistogram:
+    """
+    Fixed log-scale histogram of request latencies.
+
+    Old observations are halved away once ``max_count`` is reached, so
+    quantiles follow a source's recent behaviour rather than its history.
+    """
+
+    def __init__(self, counts: Optional[list[int]] = None, max_count: int = 1000) -> None:
+        """
+        Initialize the histogram.
+
+        :param counts: Observations per bucket (a bucket past the last bound
+                       counts anything slower)
+        :param max_count: Total at which all counts are halved
+        """
+        self.counts = list(counts or [0] * (len(BUCKET_BOUNDS) + 1))
+        self.max_count = max_count
+
+    @property
+    def total(self) -> int:
+        """Number of observations held."""
+        return sum(self.counts)
+
+    def record(self, seconds: float) -> None:
+        """Add one observation."""
+        self.counts[bisect.bisect_left(BUCKET_BOUNDS, seconds)] += 1
+        if self.total >= self.max_count:
+            self.counts = [c // 2 for c in self.counts]
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Return an upper bound on the ``q`` quantile, or None if empty.
+
+        Observations past the last bucket report as infinity.
+        """
+        total = self.total
+        if not total:
+            return None
+        rank = math.ceil(q * total)
+        seen = 0
+        for i, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return BUCKET_BOUNDS[i] if i < len(BUCKET_BOUNDS) else math.inf
+        return math.inf
+
+
+class LatencyTracker:
+    """
+    Latency histograms for every source, keyed by URL.
+
+    Histograms are kept in memory (so they survive warm Lambda invocations)
+    and, if a store is given, loaded from and flushed back to it.
+    """
+
+    def __init__(self, store: Optional[BaseStore] = None) -> None:
+        """
+        Initialize the tracker.
+
+        :param store: Where histograms are persisted between runs
+        """
+        self.store = store
+        self._histograms: dict[str, LatencyHistogram] = {}
+        self._dirty: set[str] = set()
+        self._lock = threading.Lock()
+
+    def histogram(self, url: str) -> LatencyHistogram:
+        """Return the histogram for a URL, loading it on first use."""
+        with self._lock:
+            histogram = self._histograms.get(url)
+        if histogram is None:
+            stored = self.store.get(url) if self.store is not None else None
+            with self._lock:
+                histogram = self._histograms.setdefault(url, LatencyHistogram(stored))
+        return histogram
+
+    def record(self, url: str, seconds: float) -> None:
+        """Add a latency observation for a URL."""
+        histogram = self.histogram(url)
+        with self._lock:
+            histogram.record(seconds)
+            self._dirty.add(url)
+
+    def quantile(self, url: str, q: float, min_samples: int = 1) -> Optional[float]:
+        """Return the URL's ``q`` latency quantile, or None with too few samples."""
+        histogram = self.histogram(url)
+        with self._lock:
+            if histogram.total < min_samples:
+                return None
+            return histogram.quantile(q)
+
+    def flush(self) -> None:
+        """Persist histograms changed since the last flush."""
+        if self.store is None:
+            return
+        with self._lock:
+            changed = {url: list(self._histograms[url].counts) for url in self._dirty}
+            self._dirty.clear()
+        if changed:
+            self.store.set_many(changed)
+            self.store.flush()
+
+
+# Tracker shared by all readers in the process
+latency_tracker = LatencyTracker()
@@ -0,0 +1,232 @@
+"""Record real HTTP responses to a fixture corpus and replay them offline."""
+
+import hashlib
+import io
+import json
+import os
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, field
+from functools import partial
+from pathlib import Path
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3 import HTTPResponse
+
+from stonksfeed.net.session import SessionManager, session_manager
+
+# Hop-by-hop/encoding headers that no longer describe the stored (decoded) body
+_DROPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection"}
+
+# Argument types of HTTPAdapter.send
+Timeout = float | tuple[float | None, float | None] | None
+Cert = str | tuple[str, str] | None
+
+
+@dataclass
+class RecordedResponse:
+    """A response as stored in the corpus."""
+
+    url: str
+    status: int = 200
+    headers: dict[str, str] = field(default_factory=dict)
+    body: bytes = b""
+
+
+class Corpus:
+    """
+    Directory of recorded responses, one pair of files per request.
+
+    ``<key>.json`` holds the URL, status and headers; ``<key>.body`` holds
+    the decoded body. The key is a hash of the method and full URL, so
+    the corpus can be committed and shared without path-escaping issues.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """
+        Initialize the corpus.
+
+        :param path: Directory holding the recorded responses
+        """
+        self.path = Path(path)
+
+    @staticmethod
+    def key(method: str, url: str) -> str:
+        """Return the file name stem for a request."""
+        return hashlib.sha1(f"{method.upper()} {url}".encode()).hexdigest()
+
+    def save(self, method: str, response: RecordedResponse) -> None:
+        """Store a response, replacing any earlier recording of the request."""
+        self.path.mkdir(parents=True, exist_ok=True)
+        key = self.key(method, response.url)
+        meta = {"url": response.url, "status": response.status, "headers": response.headers}
+        self._write(self.path / f"{key}.body", response.body)
+        self._write(self.path / f"{key}.json", json.dumps(meta, indent=2).encode())
+
+    def load(self, method: str, url: str) -> Optional[RecordedResponse]:
+        """Return the recorded response for a request, or None if there is none."""
+        key = self.key(method, url)
+        try:
+            meta = json.loads((self.path / f"{key}.json").read_text())
+            body = (self.path / f"{key}.body").read_bytes()
+        except FileNotFoundError:
+            return None
+        return RecordedResponse(meta["url"], meta["status"], meta["headers"], body)
+
+    def urls(self) -> list[str]:
+        """Return the URL of every recorded request."""
+        return sorted(json.loads(p.read_text())["url"] for p in self.path.glob("*.json"))
+
+    @staticmethod
+    def _write(path: Path, data: bytes) -> None:
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+
+
+class RecordingAdapter(HTTPAdapter):
+    """Transport adapter that performs real requests and saves each response."""
+
+    def __init__(self, corpus: Corpus, **kwargs) -> None:
+        """
+        Initialize the adapter.
+
+        :param corpus: Where responses are saved
+        :param kwargs: Passed to HTTPAdapter (pool settings)
+        """
+        super().__init__(**kwargs)
+        self.corpus = corpus
+
+    def send(
+        self,
+        request: requests.PreparedRequest,
+        stream: bool = False,
+        timeout: Timeout = None,
+        verify: bool | str = True,
+        cert: Cert = None,
+        proxies: Optional[dict[str, str]] = None,
+    ) -> requests.Response:
+        response = super().send(request, stream, timeout, verify, cert, proxies)
+        # 304s depend on the validators sent, so only full responses are kept
+        if response.status_code != 304:
+            headers = {
+                k: v for k, v in response.headers.items() if k.lower() not in _DROPPED_HEADERS
+            }
+            recorded = RecordedResponse(
+                response.url, response.status_code, headers, response.content
+            )
+            self.corpus.save(request.method or "GET", recorded)
+        return response
+
+
+class ReplayAdapter(HTTPAdapter):
+    """
+    Transport adapter that answers requests from a corpus without any network.
+
+    Each response is delayed by ``latency`` seconds plus its size divided
+    by ``bandwidth`` (bytes per second, per connection), so concurrency and
+    caching changes can be benchmarked under realistic network conditions.
+    Requests carrying a matching If-None-Match or If-Modified-Since get a
+    304, as a real server would.
+    """
+
+    def __init__(
+        self,
+        corpus: Corpus,
+        latency: float = 0.0,
+        bandwidth: Optional[float] = None,
+        **kwargs,
+    ) -> None:
+        """
+        Initialize the adapter.
+
+        :param corpus: Where responses are read from
+        :param latency: Seconds added to every request (time to first byte)
+        :param bandwidth: Bytes per second each response is delivered at
+                          (unlimited if None)
+        :param kwargs: Passed to HTTPAdapter (pool settings)
+        """
+        super().__init__(**kwargs)
+        self.corpus = corpus
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.requests = 0
+        self.bytes_sent = 0
+        self._lock = threading.Lock()
+
+    def _not_modified(self, request: requests.PreparedRequest, recorded: RecordedResponse) -> bool:
+        headers = {k.lower(): v for k, v in recorded.headers.items()}
+        etag = request.headers.get("If-None-Match")
+        if etag is not None:
+            return etag == headers.get("etag")
+        since = request.headers.get("If-Modified-Since")
+        return since is not None and since == headers.get("last-modified")
+
+    def send(
+        self,
+        request: requests.PreparedRequest,
+        stream: bool = False,
+        timeout: Timeout = None,
+        verify: bool | str = True,
+        cert: Cert = None,
+        proxies: Optional[dict[str, str]] = None,
+    ) -> requests.Response:
+        recorded = self.corpus.load(request.method or "GET", request.url or "")
+        if recorded is None:
+            raise requests.ConnectionError(
+                f"No recorded response for {request.method} {request.url}", request=request
+            )
+
+        status, body = recorded.status, recorded.body
+        if self._not_modified(request, recorded):
+            status, body = 304, b""
+
+        delay = self.latency
+        if self.bandwidth:
+            delay += len(body) / self.bandwidth
+        if delay:
+            time.sleep(delay)
+        with self._lock:
+            self.requests += 1
+            self.bytes_sent += len(body)
+
+        raw = HTTPResponse(
+            body=io.BytesIO(body),
+            headers=recorded.headers,
+            status=status,
+            preload_content=False,
+            decode_content=False,
+        )
+        return self.build_response(request, raw)
+
+
+def use_corpus(
+    path: str | Path,
+    mode: str = "replay",
+    latency: float = 0.0,
+    bandwidth: Optional[float] = None,
+    manager: SessionManager = session_manager,
+) -> None:
+    """
+    Route every reader's requests through a fixture corpus.
+
+    :param path: Corpus directory
+    :param mode: "record" to fetch live and save responses, "replay" to
+                 answer from the corpus only
+    :param latency: Synthetic latency per request when replaying, in seconds
+    :param bandwidth: Synthetic bandwidth when replaying, in bytes per second
+    :param manager: Session manager to configure (the shared one by default)
+    """
+    corpus = Corpus(path)
+    if mode == "record":
+        manager.configure(adapter_factory=partial(RecordingAdapter, corpus))
+    elif mode == "replay":
+        manager.configure(
+            adapter_factory=partial(ReplayAdapter, corpus, latency=latency, bandwidth=bandwidth)
+        )
+    else:
+        raise ValueError(f"Unknown corpus mode: {mode!r}")
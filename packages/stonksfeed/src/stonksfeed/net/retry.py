@@ -0,0 +1,136 @@
+"""Retry and hedging policies for slow or flaky sources."""
+
+import random
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+import requests
+
+from stonksfeed.config import HEDGE_MAX_WORKERS
+
+# Statuses worth trying again; anything else is the server's final answer
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+@dataclass
+class RetryPolicy:
+    """
+    Retry failed requests with exponential backoff and full jitter.
+
+    Attempt ``n`` (from 0) waits a random time between zero and
+    ``min(max_delay, base_delay * 2**n)``, so sources that fail together
+    don't retry together. Connection errors, timeouts and RETRY_STATUSES
+    are retried; other errors are returned as they are.
+    """
+
+    attempts: int = 3
+    base_delay: float = 0.5
+    max_delay: float = 8.0
+    rng: random.Random = field(default_factory=random.Random)
+    sleep: Callable[[float], None] = time.sleep
+
+    def should_retry(
+        self,
+        attempt: int,
+        response: Optional[requests.Response] = None,
+        error: Optional[Exception] = None,
+    ) -> bool:
+        """
+        Return True if a request that ended this way should be tried again.
+
+        :param attempt: Zero-based number of the attempt that just finished
+        :param response: The response, if one was received
+        :param error: The exception raised, if any
+        """
+        if attempt + 1 >= self.attempts:
+            return False
+        if error is not None:
+            return isinstance(error, (requests.ConnectionError, requests.Timeout))
+        return response is not None and response.status_code in RETRY_STATUSES
+
+    def backoff(self, attempt: int, at_least: float = 0.0) -> float:
+        """
+        Sleep before the next attempt and return how long was slept.
+
+        :param attempt: Zero-based number of the attempt that just failed
+        :param at_least: Minimum wait, e.g. what the host asked for in Retry-After
+        """
+        delay = max(
+            at_least, self.rng.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))
+        )
+        self.sleep(delay)
+        return delay
+
+
+@dataclass
+class HedgePolicy:
+    """
+    Send a duplicate request when the first is slower than usual.
+
+    The hedge fires once the first attempt has run for longer than the
+    source's ``quantile`` latency (from its latency histogram); whichever
+    finishes first wins. Nothing is hedged until ``min_samples`` latencies
+    have been seen, and the threshold never drops below ``min_delay``.
+    """
+
+    quantile: float = 0.95
+    min_samples: int = 20
+    min_delay: float = 0.25
+
+
+class Hedger:
+    """Runs hedged requests on a small shared thread pool."""
+
+    def __init__(self, max_workers: int = HEDGE_MAX_WORKERS) -> None:
+        """
+        Initialize the hedger.
+
+        :param max_workers: Maximum requests running on the pool at once
+        """
+        self.max_workers = max_workers
+        self.hedges = 0
+        self.hedge_wins = 0
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    @property
+    def pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="stonksfeed-hedge"
+                )
+            return self._pool
+
+    def run(self, attempt: Callable[[], requests.Response], after: float) -> requests.Response:
+        """
+        Run ``attempt``, starting a second copy if the first takes over ``after`` seconds.
+
+        The slower copy is left to finish on its own; its result is ignored.
+        If both fail, the first copy's exception is raised.
+        """
+        first = self.pool.submit(attempt)
+        done, _ = wait([first], timeout=after)
+        if done:
+            return first.result()
+
+        second = self.pool.submit(attempt)
+        with self._lock:
+            self.hedges += 1
+        pending: set[Future] = {first, second}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    if future is second:
+                        with self._lock:
+                            self.hedge_wins += 1
+                    return future.result()
+        return first.result()
+
+
+# Hedger shared by all readers in the process
+hedger = Hedger()
@@ -0,0 +1,103 @@
+"""Shared, pooled HTTP sessions."""
+
+import threading
+from typing import Callable, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+
+from stonksfeed.config import HTTP_POOL_CONNECTIONS, HTTP_POOL_MAXSIZE
+
+USER_AGENT = "stonksfeed (+https://stonksfeed.com)"
+
+
+class SessionManager:
+    """
+    Owns the process-wide requests.Session used by all readers.
+
+    The session keeps a pool of keep-alive connections per host, so
+    back-to-back requests to the same origin (e.g. dozens of Silicon
+    Investor post pages) reuse one TCP+TLS connection instead of doing
+    a fresh handshake each time. Because the session lives at module
+    level it also survives warm Lambda invocations.
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = HTTP_POOL_CONNECTIONS,
+        pool_maxsize: int = HTTP_POOL_MAXSIZE,
+        compression: bool = True,
+        adapter_factory: Callable[..., HTTPAdapter] = HTTPAdapter,
+    ) -> None:
+        """
+        Initialize the session manager.
+
+        :param pool_connections: Number of per-host connection pools to keep
+        :param pool_maxsize: Maximum keep-alive connections kept per host
+        :param compression: Advertise every content encoding urllib3 can decode
+                            (gzip and deflate, plus br/zstd when available)
+        :param adapter_factory: Builds the transport adapter from the pool
+                                settings (e.g. a record/replay adapter)
+        """
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.compression = compression
+        self.adapter_factory = adapter_factory
+        self._session: Optional[requests.Session] = None
+        self._lock = threading.Lock()
+
+    def _create_session(self) -> requests.Session:
+        session = requests.Session()
+        adapter = self.adapter_factory(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers["User-Agent"] = USER_AGENT
+        session.headers["Accept-Encoding"] = ACCEPT_ENCODING if self.compression else "identity"
+        return session
+
+    @property
+    def session(self) -> requests.Session:
+        """Return the shared session, creating it on first use."""
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    self._session = self._create_session()
+        return self._session
+
+    def configure(
+        self,
+        pool_connections: Optional[int] = None,
+        pool_maxsize: Optional[int] = None,
+        compression: Optional[bool] = None,
+        adapter_factory: Optional[Callable[..., HTTPAdapter]] = None,
+    ) -> None:
+        """Change pool or transport settings; the session is rebuilt on next use."""
+        if pool_connections is not None:
+            self.pool_connections = pool_connections
+        if pool_maxsize is not None:
+            self.pool_maxsize = pool_maxsize
+        if compression is not None:
+            self.compression = compression
+        if adapter_factory is not None:
+            self.adapter_factory = adapter_factory
+        self.reset()
+
+    def reset(self) -> None:
+        """Close the current session and its pooled connections."""
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+            self._session = None
+
+
+# Manager shared by all readers in the process
+session_manager = SessionManager()
+
+
+def get_session() -> requests.Session:
+    """Return the process-wide shared session."""
+    return session_manager.session
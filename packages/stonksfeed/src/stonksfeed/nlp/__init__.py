@@ -1,6 +1,8 @@
 """NLP utilities for stonksfeed."""
 
+from stonksfeed.nlp.clusters import HeadlineClusterer
+from stonksfeed.nlp.enrich import enrich_batch
 from stonksfeed.nlp.sentiment import SentimentAnalyzer
 from stonksfeed.nlp.tickers import TickerExtractor
 
-__all__ = ["SentimentAnalyzer", "TickerExtractor"]
+__all__ = ["HeadlineClusterer", "SentimentAnalyzer", "TickerExtractor", "enrich_batch"]
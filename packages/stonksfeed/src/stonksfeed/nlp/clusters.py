@@ -0,0 +1,231 @@
+"""Near-duplicate headline clustering with MinHash and LSH."""
+
+import hashlib
+import random
+import re
+import threading
+import time
+from array import array
+from collections import deque
+from functools import lru_cache
+from heapq import nlargest
+from operator import eq, itemgetter
+from typing import Iterable, Optional
+
+from stonksfeed.config import CLUSTER_MAX_ITEMS, CLUSTER_THRESHOLD, CLUSTER_WINDOW_SECONDS
+from stonksfeed.models import ArticleBatch
+
+# Mersenne prime used for the MinHash permutations
+_PRIME = (1 << 61) - 1
+# Seed of the permutations, so signatures are comparable between processes
+_SEED = 0x5704C5
+
+_WORD = re.compile(r"[a-z0-9]+")
+
+# Words that carry no information about which story a headline is about
+STOPWORDS = {
+    "a", "after", "amid", "an", "and", "are", "as", "at", "by", "for", "from", "has",
+    "in", "into", "is", "it", "its", "of", "on", "over", "says", "than", "that",
+    "the", "this", "to", "up", "was", "with",
+}  # fmt: skip
+
+# Words that headlines use interchangeably, mapped to one of them
+SYNONYMS = {
+    "share": "stock",
+    "soar": "jump",
+    "surge": "jump",
+    "rally": "jump",
+    "plunge": "fall",
+    "sink": "fall",
+    "tumble": "fall",
+    "slide": "fall",
+}
+
+
+def _stem(word: str) -> str:
+    """Crudely drop a plural or third-person "s" ("earnings", "jumps")."""
+    if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+        word = word[:-1]
+    return SYNONYMS.get(word, word)
+
+
+def shingles(headline: str, tickers: Iterable[str] = ()) -> set[str]:
+    """
+    Return the set of terms a headline is compared on.
+
+    Headlines are too short for character or multi-word shingles to
+    survive rewording, so each shingle is one stemmed content word. The
+    article's tickers are added as words, so "Nvidia" in one headline
+    meets "NVDA" in another once the extractor maps them to the same
+    symbol.
+    """
+    words = {_stem(w) for w in _WORD.findall(headline.lower()) if w not in STOPWORDS}
+    words.update(t.lower() for t in tickers)
+    return words
+
+
+def _token_hash(token: str) -> int:
+    return int.from_bytes(hashlib.blake2b(token.encode(), digest_size=8).digest())
+
+
+class HeadlineClusterer:
+    """
+    Incremental near-duplicate detector over a rolling window of headlines.
+
+    Each headline's shingles get a MinHash signature, which is split into
+    ``bands`` bands. Headlines sharing any band are candidates, and a
+    candidate whose signature agrees on at least ``threshold`` of its
+    positions (an estimate of the Jaccard similarity of the shingles) is
+    the same story: the new headline joins its cluster. Otherwise the
+    headline starts a cluster of its own.
+
+    Each LSH bucket keeps only its ``bucket_size`` most recent headlines,
+    so a headline has at most ``bands * bucket_size`` candidates, and only
+    the ``max_compared`` sharing the most bands get a full signature
+    comparison. The work per headline is therefore bounded rather than
+    proportional to the window: benchmarks/clusters.py measures about
+    100 us per headline with 1,000 held, creeping up to about 150 us with
+    50,000 held as the buckets and token cache outgrow the CPU caches.
+    Headlines older than ``window`` seconds, or beyond the ``max_items``
+    most recent, are forgotten.
+
+    The window lives in memory, so it carries across warm invocations but
+    starts empty after a cold start.
+    """
+
+    def __init__(
+        self,
+        threshold: float = CLUSTER_THRESHOLD,
+        window: int = CLUSTER_WINDOW_SECONDS,
+        max_items: int = CLUSTER_MAX_ITEMS,
+        num_perm: int = 32,
+        bands: int = 16,
+        bucket_size: int = 8,
+        max_compared: int = 8,
+        token_cache_size: int = 16384,
+    ) -> None:
+        """
+        Initialize the clusterer.
+
+        :param threshold: Estimated Jaccard similarity at which headlines match
+        :param window: How long a headline can be matched against, in seconds
+        :param max_items: Most headlines held at once
+        :param num_perm: Length of the MinHash signatures
+        :param bands: Number of LSH bands; ``num_perm`` must be a multiple
+        :param bucket_size: Most recent headlines kept per LSH bucket
+        :param max_compared: Most candidates whose full signatures are compared
+        :param token_cache_size: Most words whose permuted hashes are kept
+        :raises ValueError: if ``num_perm`` isn't a multiple of ``bands``
+        """
+        if num_perm % bands:
+            raise ValueError(f"num_perm ({num_perm}) must be a multiple of bands ({bands})")
+        self.threshold = threshold
+        self.window = window
+        self.max_items = max_items
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.bucket_size = bucket_size
+        self.max_compared = max_compared
+        rng = random.Random(_SEED)
+        self._perms = [
+            (rng.randrange(1, _PRIME), rng.randrange(0, _PRIME)) for _ in range(num_perm)
+        ]
+        # Headlines reuse a small vocabulary, so each word is hashed and permuted once
+        self._token_values = lru_cache(maxsize=token_cache_size)(self._permute)
+        # (band, band values) -> most recent entries in that bucket
+        self._buckets: dict[tuple, deque] = {}
+        # Entries in the order they were added: (seen_at, signature, cluster id, bucket keys)
+        self._entries: deque = deque()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _permute(self, token: str) -> array:
+        """Return a token's hash under each of the permutations."""
+        h = _token_hash(token)
+        return array("Q", [(a * h + b) % _PRIME for a, b in self._perms])
+
+    def signature(self, terms: set[str]) -> tuple[int, ...]:
+        """Return the MinHash signature of a non-empty set of shingles."""
+        rows = [self._token_values(t) for t in terms]
+        if len(rows) == 1:
+            return tuple(rows[0])
+        # Minimum of each permutation across the terms
+        return tuple(map(min, *rows))
+
+    def _bucket_keys(self, signature: tuple[int, ...]) -> list[tuple]:
+        rows = self.rows
+        return [(band, signature[band * rows : (band + 1) * rows]) for band in range(self.bands)]
+
+    def _expire(self, now: float) -> None:
+        """Forget entries that left the window, and make room for one more."""
+        cutoff = now - self.window
+        entries = self._entries
+        while entries and (entries[0][0] < cutoff or len(entries) >= self.max_items):
+            entry = entries.popleft()
+            for key in entry[3]:
+                bucket = self._buckets.get(key)
+                # Buckets are in insertion order too, so the entry is at the left if present
+                if bucket and bucket[0] is entry:
+                    bucket.popleft()
+                    if not bucket:
+                        del self._buckets[key]
+
+    def assign(
+        self, headline: str, key: str, tickers: Iterable[str] = (), now: Optional[float] = None
+    ) -> str:
+        """
+        Return the cluster id of a headline, adding it to the window.
+
+        :param headline: Headline to cluster
+        :param key: Unique identifier of the article (its link); a new
+                    cluster's id is derived from it
+        :param tickers: Tickers found in the article
+        :param now: Current epoch time (defaults to time.time())
+        """
+        new_id = hashlib.blake2b(key.encode(), digest_size=8).hexdigest()
+        terms = shingles(headline, tickers)
+        if not terms:
+            return new_id
+        signature = self.signature(terms)
+        keys = self._bucket_keys(signature)
+        now = time.time() if now is None else now
+        with self._lock:
+            self._expire(now)
+            cluster_id = self._best_match(signature, keys) or new_id
+            entry = (now, signature, cluster_id, keys)
+            self._entries.append(entry)
+            for bucket_key in keys:
+                bucket = self._buckets.get(bucket_key)
+                if bucket is None:
+                    bucket = self._buckets[bucket_key] = deque(maxlen=self.bucket_size)
+                bucket.append(entry)
+        return cluster_id
+
+    def _best_match(self, signature: tuple[int, ...], keys: list[tuple]) -> Optional[str]:
+        """Return the cluster of the most similar candidate over the threshold."""
+        # Count the bands each candidate shares; the most similar share the most
+        shared: dict[int, int] = {}
+        candidates = {}
+        for bucket_key in keys:
+            for entry in self._buckets.get(bucket_key, ()):
+                shared[id(entry)] = shared.get(id(entry), 0) + 1
+                candidates[id(entry)] = entry
+        if len(shared) > self.max_compared:
+            shared = dict(nlargest(self.max_compared, shared.items(), key=itemgetter(1)))
+        best, best_score = None, self.threshold
+        for entry_id in shared:
+            entry = candidates[entry_id]
+            score = sum(map(eq, signature, entry[1])) / self.num_perm
+            if score >= best_score:
+                best, best_score = entry[2], score
+        return best
+
+    def assign_batch(self, batch: ArticleBatch, now: Optional[float] = None) -> None:
+        """Set the cluster id of every article in a batch, in order."""
+        batch.cluster_id = [
+            self.assign(batch.headline[i], batch.link[i], batch.tickers(i), now)
+            for i in range(len(batch))
+        ]
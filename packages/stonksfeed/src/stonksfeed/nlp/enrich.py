@@ -0,0 +1,23 @@
+"""NLP enrichment of whole article batches."""
+
+from stonksfeed.models import ArticleBatch
+from stonksfeed.nlp.sentiment import SentimentAnalyzer
+from stonksfeed.nlp.tickers import TickerExtractor
+
+
+def enrich_batch(
+    batch: ArticleBatch, sentiment: SentimentAnalyzer, tickers: TickerExtractor
+) -> None:
+    """
+    Set the sentiment and tickers of every article in a batch from its headline.
+
+    :param batch: Articles to enrich, in place
+    :param sentiment: Analyzer scoring the headlines (in one ``analyze_many`` call)
+    :param tickers: Extractor finding ticker symbols in the headlines
+    """
+    sentiments = sentiment.analyze_many(batch.headline)
+    batch.set_enrichment(
+        [s["score"] for s in sentiments],
+        [s["label"] for s in sentiments],
+        [tickers.extract(headline) for headline in batch.headline],
+    )
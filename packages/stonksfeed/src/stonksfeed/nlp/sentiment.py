@@ -1,6 +1,75 @@
 """Sentiment analysis using VADER."""
 
-from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+import marshal
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Iterable, Optional
+
+from stonksfeed.config import SENTIMENT_CACHE_SIZE
+from stonksfeed.store import CacheStats
+
+# VADER's lexicon parsed ahead of time by compile_lexicon() (run by scripts/build-lambda.sh)
+COMPILED_LEXICON = Path(__file__).parent / "data" / "vader_lexicon.bin"
+# Bumped when the compiled layout changes
+LEXICON_FORMAT = 1
+# Text files VADER parses when it's constructed
+_LEXICON_FILES = ("vader_lexicon.txt", "emoji_utf8_lexicon.txt")
+
+
+def _lexicon_key(vader_dir: Path) -> tuple[int, ...]:
+    """Identify the installed lexicon cheaply, by the sizes of its files."""
+    return (LEXICON_FORMAT, *(os.path.getsize(vader_dir / name) for name in _LEXICON_FILES))
+
+
+def compile_lexicon(target: str | Path = COMPILED_LEXICON) -> Path:
+    """
+    Parse the installed VADER lexicon once and save it in binary form.
+
+    :param target: File to write
+    :return: Path of the compiled lexicon
+    """
+    from vaderSentiment import vaderSentiment as vader
+
+    analyzer = vader.SentimentIntensityAnalyzer()
+    key = _lexicon_key(Path(vader.__file__).parent)
+    target = Path(target)
+    target.write_bytes(marshal.dumps((key, analyzer.lexicon, analyzer.emojis)))
+    return target
+
+
+def load_vader(compiled: Optional[str | Path] = COMPILED_LEXICON):
+    """
+    Return a VADER analyzer, skipping the text parse if a compiled lexicon matches.
+
+    :param compiled: Lexicon written by ``compile_lexicon``; None, missing
+                     or stale means VADER parses its text files as usual
+    """
+    from vaderSentiment import vaderSentiment as vader
+
+    if compiled is not None:
+        try:
+            key, lexicon, emojis = marshal.loads(Path(compiled).read_bytes())
+        except (OSError, EOFError, TypeError, ValueError):
+            key = None
+        if key == _lexicon_key(Path(vader.__file__).parent):
+            analyzer = vader.SentimentIntensityAnalyzer.__new__(vader.SentimentIntensityAnalyzer)
+            analyzer.lexicon = lexicon
+            analyzer.emojis = emojis
+            return analyzer
+    return vader.SentimentIntensityAnalyzer()
+
+
+def normalize_text(text: str) -> str:
+    """
+    Return the cache key of a text: its words separated by single spaces.
+
+    Case and punctuation are kept, since VADER scores ALL CAPS and
+    exclamation marks as more intense.
+    """
+    return " ".join(text.split())
 
 
 class SentimentAnalyzer:
@@ -13,10 +82,48 @@ class SentimentAnalyzer:
     - Punctuation (exclamation marks)
     - Negation
     - Financial terminology
+
+    ``analyze_many`` keeps the results of the last ``cache_size`` distinct
+    texts, so syndicated headlines are only scored once.
+
+    VADER is imported and its lexicon loaded on first use, not when the
+    analyzer is created, so creating one at import time costs nothing.
     """
 
-    def __init__(self) -> None:
-        self._analyzer = SentimentIntensityAnalyzer()
+    def __init__(
+        self,
+        cache_size: int = SENTIMENT_CACHE_SIZE,
+        lexicon: Optional[str | Path] = COMPILED_LEXICON,
+    ) -> None:
+        """
+        Initialize the analyzer.
+
+        :param cache_size: Number of distinct texts whose result is kept
+        :param lexicon: Compiled lexicon to load VADER from (see ``load_vader``)
+        """
+        self.lexicon = lexicon
+        self._vader = None
+        self.cache_size = cache_size
+        self.stats = CacheStats()
+        # Texts scored by VADER and the time spent scoring them
+        self.scored = 0
+        self.score_seconds = 0.0
+        self._cache: OrderedDict[str, dict] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def _analyzer(self):
+        """The VADER analyzer, loaded on first use."""
+        if self._vader is None:
+            with self._lock:
+                if self._vader is None:
+                    self._vader = load_vader(self.lexicon)
+        return self._vader
+
+    @property
+    def throughput(self) -> float:
+        """Texts scored per second of VADER time."""
+        return self.scored / self.score_seconds if self.score_seconds else 0.0
 
     def analyze(self, text: str) -> dict:
         """
@@ -41,3 +148,44 @@ class SentimentAnalyzer:
             "score": round(compound, 3),
             "label": label,
         }
+
+    def analyze_many(self, texts: Iterable[str]) -> list[dict]:
+        """
+        Analyze many texts, scoring each distinct one at most once.
+
+        Texts that normalize the same (see ``normalize_text``) share one
+        result, and results are kept in an LRU cache between calls. The
+        returned dicts are shared, so callers must not modify them.
+
+        :param texts: Texts to analyze
+        :return: One result per text, in order, as from ``analyze``
+        """
+        keys = [normalize_text(t) for t in texts]
+        results: dict[str, dict] = {}
+        with self._lock:
+            for key in keys:
+                if key in results:
+                    continue
+                cached = self._cache.get(key)
+                if cached is not None:
+                    self._cache.move_to_end(key)
+                    results[key] = cached
+        missing = [key for key in dict.fromkeys(keys) if key not in results]
+
+        if missing:
+            # Load VADER first, so throughput measures scoring alone
+            self._analyzer
+        start = time.perf_counter()
+        scored = {key: self.analyze(key) for key in missing}
+        elapsed = time.perf_counter() - start
+
+        with self._lock:
+            self.scored += len(scored)
+            self.score_seconds += elapsed
+            self.stats.misses += len(scored)
+            self.stats.hits += len(keys) - len(scored)
+            self._cache.update(scored)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        results.update(scored)
+        return [results[key] for key in keys]
@@ -1,37 +1,24 @@
 """Ticker symbol extraction from text."""
 
+import hashlib
+import marshal
 import re
-from typing import List, Set
-
-# Common stock tickers that appear frequently in financial news
-# This helps catch tickers without $ prefix
-COMMON_TICKERS: Set[str] = {
-    # Mega caps
-    "AAPL", "MSFT", "GOOGL", "GOOG", "AMZN", "NVDA", "META", "TSLA", "BRK",
-    # Tech
-    "AMD", "INTC", "AVGO", "QCOM", "CRM", "ORCL", "IBM", "CSCO", "ADBE",
-    "NFLX", "PYPL", "SQ", "SHOP", "SNOW", "PLTR", "UBER", "LYFT", "ABNB",
-    # Finance
-    "JPM", "BAC", "WFC", "GS", "MS", "C", "AXP", "V", "MA", "BLK",
-    # Healthcare
-    "UNH", "JNJ", "PFE", "ABBV", "MRK", "LLY", "TMO", "ABT", "BMY", "AMGN",
-    # Consumer
-    "WMT", "HD", "MCD", "NKE", "SBUX", "TGT", "COST", "LOW", "DIS", "CMCSA",
-    # Energy
-    "XOM", "CVX", "COP", "SLB", "EOG", "MPC", "PSX", "VLO", "OXY", "HAL",
-    # Industrial
-    "CAT", "DE", "BA", "HON", "UPS", "FDX", "LMT", "RTX", "GE", "MMM",
-    # Semiconductors
-    "TSM", "ASML", "MU", "LRCX", "KLAC", "AMAT", "MRVL", "ON", "ADI", "TXN",
-    # ETFs
-    "SPY", "QQQ", "IWM", "DIA", "VTI", "VOO", "ARKK", "XLF", "XLE", "XLK",
-    # Crypto-related
-    "COIN", "MSTR", "RIOT", "MARA", "HUT",
-    # Meme stocks
-    "GME", "AMC", "BB", "BBBY", "WISH", "CLOV", "SOFI",
-    # ARM
-    "ARM", "ARMH",
-}
+from itertools import chain
+from pathlib import Path
+from typing import List, Optional, Set
+
+from stonksfeed.store import default_state_dir
+
+# Bundled universe of common symbols and company names
+DEFAULT_UNIVERSE = Path(__file__).parent / "data" / "tickers.tsv"
+# Where scripts/build-lambda.sh puts compiled matchers; checked before the state dir
+PREBUILT_DIR = Path(__file__).parent / "data"
+# Bumped when the compiled layout changes, so old caches are rebuilt
+FORMAT_VERSION = 3
+# A word: a run of letters and digits
+_WORD = re.compile(r"[^\W_]+")
+# A word starting with a capital letter (ASCII or Latin-1) or a digit
+_CAPITALIZED = re.compile(r"(?<![^\W_])[A-Z0-9\u00c0-\u00d6\u00d8-\u00de][^\W_]*")
 
 # Words that look like tickers but aren't
 FALSE_POSITIVES: Set[str] = {
@@ -45,25 +32,238 @@ FALSE_POSITIVES: Set[str] = {
 }
 
 
+def load_universe(path: str | Path) -> dict[str, List[str]]:
+    """
+    Read a universe file: each line a symbol, then its aliases, tab-separated.
+
+    :param path: Universe file (see data/tickers.tsv)
+    :return: Aliases of each symbol, by symbol
+    """
+    universe: dict[str, List[str]] = {}
+    for line in Path(path).read_text(encoding="utf-8").splitlines():
+        if not line.strip() or line.startswith("#"):
+            continue
+        symbol, *aliases = (field.strip() for field in line.split("\t"))
+        universe.setdefault(symbol.upper(), []).extend(a for a in aliases if a)
+    return universe
+
+
+def _cache_name(universe: bytes) -> str:
+    """File name of the compiled matcher for a universe file's contents."""
+    digest = hashlib.blake2b(universe + bytes([FORMAT_VERSION]), digest_size=8).hexdigest()
+    return f"tickers-{digest}.matcher"
+
+
+class TickerMatcher:
+    """
+    Word-level matcher for every symbol and alias in a universe.
+
+    Symbols and aliases only count as whole words (runs of letters and
+    digits), and a mention almost always starts with a capitalized word:
+    symbols are written in capitals ("NVDA", not "nvda") and aliases must
+    start with a capital or a digit ("Nvidia" or "3M", not "nvidia"). So
+    only the capitalized words of the text are looked up, in hash tables,
+    and the cost per headline depends on its length, not on the size of
+    the universe. The exception is brands the universe file writes in
+    lowercase ("onsemi"), which match in any case; a small regex of their
+    first words finds where they start.
+
+    - ``symbols``: symbols that are a single word, as written.
+    - ``first_words``: lowercased first word of every alias (and of symbols
+      like "BRK.B"), with the most words any pattern starting with it has.
+      Phrases starting there are looked up in ``phrases`` (lowercased words
+      joined by spaces -> (symbol, is_alias) pairs), so punctuation between
+      words is ignored ("McDonald's" also matches "McDonald s").
+    - ``anycase_words``: lowercased first words of the aliases written in
+      lowercase.
+
+    Symbols shorter than two letters or in FALSE_POSITIVES are never
+    matched bare.
+    """
+
+    def __init__(
+        self,
+        symbols: frozenset[str],
+        phrases: dict[str, tuple[tuple[str, bool], ...]],
+        first_words: dict[str, int],
+        anycase_words: frozenset[str] = frozenset(),
+    ) -> None:
+        """
+        Initialize the matcher.
+
+        :param symbols: Single-word symbols, as written
+        :param phrases: (symbol, is_alias) of each other pattern, by its lowercased words
+        :param first_words: Most words in a phrase, by its lowercased first word
+        :param anycase_words: First words of aliases matched in any case
+        """
+        self.symbols = symbols
+        self.phrases = phrases
+        self.first_words = first_words
+        self.anycase_words = anycase_words
+        self._anycase: Optional[re.Pattern[str]] = None
+        if anycase_words:
+            alternatives = "|".join(map(re.escape, sorted(anycase_words, key=len, reverse=True)))
+            self._anycase = re.compile(rf"(?<![^\W_])(?:{alternatives})(?![^\W_])", re.IGNORECASE)
+        # Where the tables came from: "built", or the cache file they were loaded from
+        self.source = "built"
+
+    @classmethod
+    def build(cls, universe: dict[str, List[str]]) -> "TickerMatcher":
+        """Build a matcher for a universe read by ``load_universe``."""
+        symbols: Set[str] = set()
+        targets: dict[str, list[tuple[str, bool]]] = {}
+        first_words: dict[str, int] = {}
+        anycase: Set[str] = set()
+        for symbol, aliases in universe.items():
+            patterns = [(a, True) for a in aliases]
+            if len(symbol) >= 2 and symbol not in FALSE_POSITIVES:
+                if _WORD.fullmatch(symbol):
+                    symbols.add(symbol)
+                else:
+                    patterns.append((symbol, False))
+            for pattern, is_alias in patterns:
+                words = _WORD.findall(pattern.lower())
+                if not words:
+                    continue
+                targets.setdefault(" ".join(words), []).append((symbol, is_alias))
+                first_words[words[0]] = max(first_words.get(words[0], 0), len(words))
+                if is_alias and pattern[0].islower():
+                    anycase.add(words[0])
+        phrases = {key: tuple(dict.fromkeys(hits)) for key, hits in targets.items()}
+        return cls(frozenset(symbols), phrases, first_words, frozenset(anycase))
+
+    def dumps(self) -> bytes:
+        """Serialize the matcher."""
+        return marshal.dumps(
+            (FORMAT_VERSION, self.symbols, self.phrases, self.first_words, self.anycase_words)
+        )
+
+    @classmethod
+    def loads(cls, data: bytes) -> "TickerMatcher":
+        """
+        Load a matcher written by ``dumps``.
+
+        :raises ValueError: if the data isn't a serialized matcher of this version
+        """
+        try:
+            version, *tables = marshal.loads(data)
+        except (EOFError, TypeError, ValueError) as e:
+            raise ValueError(f"Not a serialized ticker matcher: {e}") from None
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Ticker matcher format {version}, expected {FORMAT_VERSION}")
+        return cls(*tables)
+
+    @classmethod
+    def load(
+        cls, universe: Optional[str | Path] = None, cache_dir: Optional[str | Path] = None
+    ) -> "TickerMatcher":
+        """
+        Return the matcher for a universe file, compiling it only if no cache has it.
+
+        Compiled matchers are looked up by a hash of the universe file in
+        PREBUILT_DIR and then in ``cache_dir``; a freshly built one is
+        written to ``cache_dir`` for the next cold start.
+
+        :param universe: Universe file (defaults to DEFAULT_UNIVERSE)
+        :param cache_dir: Writable cache directory (defaults to one in the state dir)
+        """
+        path = Path(universe) if universe is not None else DEFAULT_UNIVERSE
+        content = path.read_bytes()
+        name = _cache_name(content)
+        cache_dir = Path(cache_dir) if cache_dir is not None else default_state_dir()
+        for directory in (PREBUILT_DIR, cache_dir):
+            try:
+                matcher = cls.loads((directory / name).read_bytes())
+            except (OSError, ValueError):
+                continue
+            matcher.source = str(directory / name)
+            return matcher
+
+        matcher = cls.build(load_universe(path))
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            (cache_dir / name).write_bytes(matcher.dumps())
+        except OSError:
+            pass
+        return matcher
+
+    def find(self, text: str) -> Set[str]:
+        """Return the symbols mentioned in text, by symbol or by alias."""
+        found: Set[str] = set()
+        symbols, first_words, phrases = self.symbols, self.first_words, self.phrases
+        # Nearly every match starts with a capitalized word, and most words of a headline aren't
+        starts = _CAPITALIZED.finditer(text)
+        if self._anycase is not None:
+            # A substring test is much cheaper than a second scan, and rarely passes
+            lowered = text.lower()
+            for word in self.anycase_words:
+                if word in lowered:
+                    starts = chain(starts, self._anycase.finditer(text))
+                    break
+        for match in starts:
+            word = match.group()
+            if word in symbols:
+                found.add(word)
+            key = word.lower()
+            most = first_words.get(key)
+            if most is None:
+                continue
+            # Patterns of one word are all aliases
+            for symbol, _ in phrases.get(key, ()):
+                found.add(symbol)
+            if most == 1:
+                continue
+            following = _WORD.findall(text, match.end())
+            for n, next_word in enumerate(following[: most - 1], 2):
+                key += " " + next_word.lower()
+                for symbol, is_alias in phrases.get(key, ()):
+                    if is_alias or [word, *following[: n - 1]] == _WORD.findall(symbol):
+                        found.add(symbol)
+        return found
+
+
+def compile_universe(
+    universe: Optional[str | Path] = None, cache_dir: str | Path = PREBUILT_DIR
+) -> Path:
+    """
+    Compile a universe's matcher into ``cache_dir`` ahead of time.
+
+    :return: Path of the compiled matcher
+    """
+    path = Path(universe) if universe is not None else DEFAULT_UNIVERSE
+    target = Path(cache_dir) / _cache_name(path.read_bytes())
+    target.write_bytes(TickerMatcher.build(load_universe(path)).dumps())
+    return target
+
+
 class TickerExtractor:
     """
     Extract stock ticker symbols from text.
 
     Uses multiple strategies:
     1. $SYMBOL pattern (explicit ticker mentions)
-    2. Known ticker lookup (common stocks)
+    2. Symbols and company names from the ticker universe (see TickerMatcher)
     3. Pattern matching for potential tickers (1-5 uppercase letters)
     """
 
-    def __init__(self, include_potential: bool = False) -> None:
+    def __init__(
+        self,
+        include_potential: bool = False,
+        universe: Optional[str | Path] = None,
+        cache_dir: Optional[str | Path] = None,
+    ) -> None:
         """
         Initialize ticker extractor.
 
         :param include_potential: If True, include potential tickers that match
-                                  the pattern but aren't in the known list.
+                                  the pattern but aren't in the universe.
                                   Can increase false positives.
+        :param universe: Universe file of symbols and aliases (defaults to
+                         the bundled one)
+        :param cache_dir: Where the compiled universe is cached between runs
         """
         self._include_potential = include_potential
+        self.matcher = TickerMatcher.load(universe, cache_dir)
         # Pattern for $SYMBOL format
         self._dollar_pattern = re.compile(r"\$([A-Z]{1,5})\b")
         # Pattern for potential tickers (1-5 uppercase letters as whole word)
@@ -84,16 +284,13 @@ class TickerExtractor:
             if match not in FALSE_POSITIVES:
                 tickers.add(match)
 
-        # Strategy 2 & 3: Find uppercase words that could be tickers
-        potential_matches = self._ticker_pattern.findall(text)
-        for match in potential_matches:
-            if match in FALSE_POSITIVES:
-                continue
-            # If it's a known ticker, always include it
-            if match in COMMON_TICKERS:
-                tickers.add(match)
-            # If include_potential is True, include any valid pattern
-            elif self._include_potential and len(match) >= 2:
-                tickers.add(match)
+        # Strategy 2: Symbols and aliases from the universe, in one pass
+        tickers.update(self.matcher.find(text))
+
+        # Strategy 3: Any other uppercase word that could be a ticker
+        if self._include_potential:
+            for match in self._ticker_pattern.findall(text):
+                if match not in FALSE_POSITIVES:
+                    tickers.add(match)
 
         return sorted(tickers)
@@ -0,0 +1,84 @@
+"""In-memory cache of parse results, keyed by a hash of the response body."""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Optional, TypeVar
+
+from stonksfeed.config import PARSE_CACHE_MAX_URLS
+from stonksfeed.store import CacheStats
+
+T = TypeVar("T")
+
+
+def content_hash(content: bytes) -> bytes:
+    """Return a short digest identifying a response body."""
+    return hashlib.blake2b(content, digest_size=16).digest()
+
+
+class ParseCache:
+    """
+    What each URL's last response body parsed into.
+
+    Many servers ignore conditional GET but send back the same bytes; a
+    body whose hash matches the URL's last one reuses that parse instead
+    of being parsed again. Only the latest body is kept per URL, and the
+    least recently used URL is dropped once ``max_urls`` are held.
+
+    Results are shared between fetches, so they must never be mutated:
+    readers cache plain tuples and build fresh Articles from them, and
+    apply their watermark afterwards.
+    """
+
+    def __init__(self, max_urls: int = PARSE_CACHE_MAX_URLS) -> None:
+        """
+        Initialize the cache.
+
+        :param max_urls: Maximum number of URLs with a cached parse
+        """
+        self.max_urls = max_urls
+        self.stats = CacheStats()
+        self._entries: OrderedDict[str, tuple[bytes, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, url: str, digest: bytes) -> Optional[Any]:
+        """Return the cached parse of a body, or None if the URL's last body differed."""
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is None or entry[0] != digest:
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(url)
+            self.stats.hits += 1
+            return entry[1]
+
+    def put(self, url: str, digest: bytes, result: Any) -> None:
+        """Cache the parse of a URL's body, replacing its previous one."""
+        with self._lock:
+            self._entries[url] = (digest, result)
+            self._entries.move_to_end(url)
+            while len(self._entries) > self.max_urls:
+                self._entries.popitem(last=False)
+
+    def parse(self, url: str, content: bytes, parse: Callable[[bytes], T]) -> T:
+        """
+        Return ``parse(content)``, reusing the last result if the body is unchanged.
+
+        :param url: URL the body was fetched from
+        :param content: Response body
+        :param parse: Function turning the body into an immutable result
+        """
+        digest = content_hash(content)
+        result = self.get(url, digest)
+        if result is None:
+            result = parse(content)
+            self.put(url, digest, result)
+        return result
+
+    def clear(self) -> None:
+        """Drop every cached parse."""
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,110 @@
+"""HTML parser backends for the readers that use BeautifulSoup."""
+
+import importlib
+from dataclasses import dataclass
+from functools import cache
+from typing import Callable, Optional
+
+from bs4 import BeautifulSoup, SoupStrainer, Tag, UnicodeDammit
+
+# Backend used when none is configured, or the configured one isn't installed
+FALLBACK_PARSER = "html.parser"
+
+
+@cache
+def _importable(module: str) -> bool:
+    """Return True if a backend's module can actually be imported."""
+    try:
+        importlib.import_module(module)
+    except (ImportError, RuntimeError):
+        # html5-parser raises RuntimeError when its libxml2 differs from lxml's
+        return False
+    return True
+
+
+@dataclass(frozen=True)
+class ParserBackend:
+    """
+    A way of turning markup into a BeautifulSoup tree.
+
+    Readers only ever walk the tree through the BeautifulSoup API, so any
+    backend that produces a bs4 tree can be swapped in without touching
+    their parsing code.
+    """
+
+    name: str
+    build: Callable[[bytes, Optional[SoupStrainer]], Tag]
+    requires: Optional[str] = None
+    scoped: bool = True
+
+    @property
+    def available(self) -> bool:
+        """True if the backend's parser is installed."""
+        return self.requires is None or _importable(self.requires)
+
+    def parse(self, markup: bytes, parse_only: Optional[SoupStrainer] = None) -> Tag:
+        """
+        Parse markup into a tree.
+
+        :param markup: Document to parse
+        :param parse_only: Build only the matching elements; backends that
+                           can't scope (``scoped`` False) build the whole
+                           document, which callers must tolerate
+        """
+        return self.build(markup, parse_only if self.scoped else None)
+
+
+def _soup_builder(features: str) -> Callable[[bytes, Optional[SoupStrainer]], Tag]:
+    def build(markup: bytes, parse_only: Optional[SoupStrainer]) -> Tag:
+        return BeautifulSoup(markup, features=features, parse_only=parse_only)
+
+    return build
+
+
+def _html5_parser(markup: bytes, parse_only: Optional[SoupStrainer]) -> Tag:
+    from html5_parser import parse
+
+    # Decode the way BeautifulSoup does for the other backends; html5-parser's
+    # own sniffing falls back to chardet, which costs more than the parse
+    soup: Tag = parse(UnicodeDammit(markup, is_html=True).unicode_markup, treebuilder="soup")
+    return soup
+
+
+# Registered backends, by the name used in config
+BACKENDS: dict[str, ParserBackend] = {}
+
+
+def register_backend(backend: ParserBackend) -> ParserBackend:
+    """Make a backend selectable by name."""
+    BACKENDS[backend.name] = backend
+    return backend
+
+
+# Pure Python, always available
+register_backend(ParserBackend("html.parser", _soup_builder("html.parser")))
+# libxml2 via lxml
+register_backend(ParserBackend("lxml", _soup_builder("lxml"), requires="lxml"))
+# gumbo (C) building the BeautifulSoup tree directly; parses whole documents only
+register_backend(
+    ParserBackend("html5-parser", _html5_parser, requires="html5_parser", scoped=False)
+)
+
+
+def get_backend(name: str) -> ParserBackend:
+    """
+    Return the named backend, or FALLBACK_PARSER's if it isn't installed.
+
+    :raises ValueError: if no backend has that name
+    """
+    try:
+        backend = BACKENDS[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown parser backend {name!r}; choose from {', '.join(BACKENDS)}"
+        ) from None
+    return backend if backend.available else BACKENDS[FALLBACK_PARSER]
+
+
+def available_backends() -> list[str]:
+    """Names of the registered backends that are installed."""
+    return [name for name, backend in BACKENDS.items() if backend.available]
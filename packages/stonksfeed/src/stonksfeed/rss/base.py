@@ -1,35 +1,229 @@
 """Base reader class for fetching and parsing content."""
 
+import math
+import time
+from typing import Callable, Iterable, Optional, TypeVar
+
 import requests
-from bs4 import BeautifulSoup
-from dateutil import parser
+from bs4 import SoupStrainer, Tag
+
+from stonksfeed.config import HTML_PARSER, MAX_RESPONSE_BYTES, WATERMARK_GRACE_SECONDS
+from stonksfeed.dates import PubdateParser
+from stonksfeed.net.download import read_body
+from stonksfeed.net.hosts import HostLimiter, host_limiter
+from stonksfeed.net.latency import LatencyTracker, latency_tracker
+from stonksfeed.net.retry import HedgePolicy, RetryPolicy, hedger
+from stonksfeed.net.session import get_session
+from stonksfeed.parse_cache import ParseCache
+from stonksfeed.parsers import get_backend
+from stonksfeed.store import BaseStore
+from stonksfeed.watermark import FeedWatermark
+
+T = TypeVar("T")
 
 
 class BaseReader:
     """Base class for content readers (RSS feeds, web scrapers)."""
 
-    def __init__(self, publisher: str, title: str, url: str, parser_type: str = "html.parser"):
+    # Grace window for the watermark; see FeedWatermark
+    WATERMARK_GRACE = WATERMARK_GRACE_SECONDS
+
+    def __init__(
+        self,
+        publisher: str,
+        title: str,
+        url: str,
+        parser_type: str = HTML_PARSER,
+        validator_store: Optional[BaseStore] = None,
+        watermark_store: Optional[BaseStore] = None,
+        session: Optional[requests.Session] = None,
+        limiter: Optional[HostLimiter] = None,
+        retry: Optional[RetryPolicy] = None,
+        hedge: Optional[HedgePolicy] = None,
+        latency: Optional[LatencyTracker] = None,
+        parse_cache: Optional[ParseCache] = None,
+        max_bytes: Optional[int] = MAX_RESPONSE_BYTES,
+    ):
         """
         Initialize the reader.
 
         :param publisher: Name of the content publisher
         :param title: Title/name of the feed or page
         :param url: URL to fetch content from
-        :param parser_type: BeautifulSoup parser to use
+        :param parser_type: Name of the parser backend (see stonksfeed.parsers);
+                            html.parser is used if it isn't installed
+        :param validator_store: Store of ETag/Last-Modified validators keyed by URL,
+                                enables conditional GET when set
+        :param watermark_store: Store of per-feed watermarks keyed by URL,
+                                skips already-seen items when set
+        :param session: HTTP session to use (defaults to the shared pooled session)
+        :param limiter: Per-host limiter shared with other readers
+        :param retry: Retry policy for fetching ``url`` (no retries if None)
+        :param hedge: Hedging policy for fetching ``url`` (no hedging if None)
+        :param latency: Latency histograms that drive hedging
+        :param parse_cache: Cache of parse results by body hash, skips parsing
+                            a body identical to the URL's last one when set
+        :param max_bytes: Largest response body read from the source
+                          (unlimited if None)
         """
         self.author = publisher
         self.title = title
         self.url = url
-        self.parser = parser_type
-        self.soup = BeautifulSoup
-        self._raw_content: bytes | None = None
+        self.backend = get_backend(parser_type)
+        self.parser = self.backend.name
+        self.date_parser = PubdateParser()
+        self.validator_store = validator_store
+        self.watermark_store = watermark_store
+        self.skipped_seen = 0
+        self._session = session
+        self.limiter = limiter or host_limiter
+        self.retry = retry
+        self.hedge = hedge
+        self.latency = latency or latency_tracker
+        self.parse_cache = parse_cache
+        self.max_bytes = max_bytes
+        self.retries = 0
+        self.not_modified = False
+        self._pending_validators: dict | None = None
+        self._pending_watermark: FeedWatermark | None = None
+
+    @property
+    def session(self) -> requests.Session:
+        """HTTP session used for all of this reader's requests."""
+        return self._session or get_session()
+
+    def soup(self, markup: bytes, parse_only: Optional[SoupStrainer] = None) -> Tag:
+        """
+        Parse markup with the reader's parser backend.
+
+        :param parse_only: Build only the matching elements, if the backend can
+        """
+        return self.backend.parse(markup, parse_only)
+
+    def _conditional_headers(self) -> dict:
+        """Build If-None-Match/If-Modified-Since headers from stored validators."""
+        if self.validator_store is None:
+            return {}
+        validators = self.validator_store.get(self.url) or {}
+        headers = {}
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+        return headers
+
+    def _attempt(self, url: str, **kwargs) -> requests.Response:
+        """
+        Make a single GET within the host's limits, recording its latency.
+
+        The body is streamed in and capped at ``max_bytes``, all while
+        holding the host's request slot.
+
+        :raises ResponseTooLarge: if the body is over ``max_bytes``
+        """
+        with self.limiter.slot(url):
+            start = time.monotonic()
+            response = self.session.get(url, stream=True, **kwargs)
+            read_body(response, self.max_bytes)
+            self.latency.record(url, time.monotonic() - start)
+        self.limiter.observe(url, response)
+        return response
+
+    def _hedged_attempt(self, url: str, **kwargs) -> requests.Response:
+        """Make an attempt, hedging it once it runs past the URL's usual latency."""
+        if self.hedge is not None:
+            threshold = self.latency.quantile(url, self.hedge.quantile, self.hedge.min_samples)
+            if threshold is not None and math.isfinite(threshold):
+                after = max(threshold, self.hedge.min_delay)
+                return hedger.run(lambda: self._attempt(url, **kwargs), after)
+        return self._attempt(url, **kwargs)
+
+    def _get(self, url: str, **kwargs) -> requests.Response:
+        """
+        GET a URL using the reader's retry and hedging policies.
 
-    def _fetch_content(self) -> bytes:
-        """Fetch content from the URL."""
-        response = requests.get(self.url, timeout=30)
+        :param kwargs: Passed to ``requests.Session.get``
+        :return: The final response, which may still be an error status
+        :raises requests.RequestException: if the last attempt failed outright
+        """
+        attempt = 0
+        while True:
+            try:
+                response = self._hedged_attempt(url, **kwargs)
+            except requests.RequestException as e:
+                if self.retry is None or not self.retry.should_retry(attempt, error=e):
+                    raise
+            else:
+                if self.retry is None or not self.retry.should_retry(attempt, response=response):
+                    return response
+            self.retries += 1
+            self.retry.backoff(attempt, at_least=self.limiter.retry_after(url))
+            attempt += 1
+
+    def _fetch_content(self) -> Optional[bytes]:
+        """
+        Fetch content from the URL.
+
+        The body isn't kept on the reader, so it can be freed as soon as the
+        caller has parsed it.
+
+        :return: Response body, or None if the server answered 304 Not Modified
+        :raises ResponseTooLarge: if the body is over ``max_bytes``
+        """
+        response = self._get(self.url, headers=self._conditional_headers(), timeout=30)
+        self.not_modified = response.status_code == 304
+        if self.not_modified:
+            return None
         response.raise_for_status()
-        self._raw_content = response.content
-        return self._raw_content
+
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            self._pending_validators = {"etag": etag, "last_modified": last_modified}
+
+        return response.content
+
+    def _parse_cached(self, content: bytes, parse: Callable[[bytes], T]) -> T:
+        """
+        Parse the response body, reusing the result if it is unchanged.
+
+        :param parse: Turns the body into an immutable result (e.g. a tuple
+                      of tuples) that doesn't depend on the watermark
+        """
+        if self.parse_cache is None:
+            return parse(content)
+        return self.parse_cache.parse(self.url, content, parse)
+
+    def _load_watermark(self) -> Optional[FeedWatermark]:
+        """Load this feed's watermark, or None if watermarks are disabled."""
+        self.skipped_seen = 0
+        if self.watermark_store is None:
+            return None
+        return FeedWatermark.from_dict(self.watermark_store.get(self.url), self.WATERMARK_GRACE)
+
+    def _advance_watermark(
+        self, watermark: Optional[FeedWatermark], items: Iterable[tuple[int, str]]
+    ) -> None:
+        """Hold a watermark covering the given (position, key) items until commit."""
+        if watermark is not None:
+            self._pending_watermark = watermark.advance(items)
+
+    def commit_state(self) -> None:
+        """
+        Persist state learned during the last fetch.
+
+        Call this once the fetched articles have been handled (e.g. stored),
+        so that a failed run is retried in full on the next fetch instead
+        of being answered with 304 Not Modified or skipped as already seen.
+        """
+        if self.validator_store is not None and self._pending_validators:
+            self.validator_store.set(self.url, self._pending_validators)
+            self.validator_store.flush()
+        if self.watermark_store is not None and self._pending_watermark is not None:
+            self.watermark_store.set(self.url, self._pending_watermark.to_dict())
+            self.watermark_store.flush()
+        self._pending_validators = None
+        self._pending_watermark = None
 
     def get_articles(self) -> list:
         """
@@ -41,5 +235,4 @@ class BaseReader:
 
     def convert_pubdate_to_epoch(self, pubdate_string: str) -> int:
         """Convert a date string to Unix epoch timestamp."""
-        dt_object = parser.parse(pubdate_string)
-        return int(dt_object.timestamp())
+        return self.date_parser.to_epoch(pubdate_string)
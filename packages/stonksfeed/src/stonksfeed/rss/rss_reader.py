@@ -1,34 +1,131 @@
 """RSS feed reader."""
 
+import re
+import xml.etree.ElementTree as ET
+from typing import Iterable, Optional
+
 from stonksfeed.models.article import Article
 from stonksfeed.rss.base import BaseReader
+from stonksfeed.rss.streaming import iter_feed_items
+from stonksfeed.watermark import FeedWatermark
+
+# lxml and html5-parser read CDATA in <title> as literal text, not as markup
+_CDATA_RE = re.compile(r"^\s*<!\[CDATA\[(.*?)\]\]>\s*$", re.DOTALL)
+
+# html5-parser keeps the case of unknown tags, so <pubDate> isn't lowercased
+_PUBDATE_TAG = re.compile("^pubdate$", re.IGNORECASE)
+
+
+# A parsed feed item: (pubdate, key, headline, link, author). Entries are
+# immutable so a parse cache can hand the same ones to every fetch.
+FeedEntry = tuple[int, str, str, str, str]
+
+# A parsed feed: its entries, and how many pubdates each date format parsed
+ParsedFeed = tuple[tuple[FeedEntry, ...], tuple[tuple[str, int], ...]]
+
+
+def _text(tag) -> str:
+    """Return a tag's text, unwrapping a CDATA section left as text by the parser."""
+    text = tag.text
+    match = _CDATA_RE.match(text)
+    return match.group(1) if match else text
 
 
 class RSSReader(BaseReader):
     """Reader for RSS feeds."""
 
-    def __init__(self, publisher: str, feed_title: str, rss_url: str):
+    def __init__(self, publisher: str, feed_title: str, rss_url: str, **options):
         """
         Initialize the RSS reader.
 
         :param publisher: Name of the publisher
         :param feed_title: Title of the RSS feed
         :param rss_url: URL of the RSS feed
+        :param options: Passed to BaseReader (stores, session)
         """
-        super().__init__(publisher, feed_title, rss_url)
+        super().__init__(publisher, feed_title, rss_url, **options)
         self.source_type = "rss"
 
     def get_articles(self) -> list[Article]:
-        """Fetch and parse articles from the RSS feed."""
+        """
+        Fetch and parse articles from the RSS feed.
+
+        Feeds are parsed with the streaming XML parser; feeds that are not
+        well-formed XML fall back to BeautifulSoup. A body identical to the
+        last one is not parsed again if the reader has a parse cache, though
+        its pubdates still count in the date parser's stats. Items older
+        than the feed's watermark are skipped before any Article is built.
+        Returns an empty list if the feed hasn't changed since the
+        last committed fetch.
+        """
         feed = self._fetch_content()
-        soup = self.soup(feed, features=self.parser)
+        if feed is None:
+            return []
+        parsed = self.date_parser.stats.total()
+        entries, formats = self._parse_cached(feed, self._parse_entries)
+        if self.date_parser.stats.total() == parsed:
+            # A cache hit parses no dates; count them as if it had
+            self.date_parser.replay(formats)
+        watermark = self._load_watermark()
+        articles, marks = self._build_articles(entries, watermark)
+        self._advance_watermark(watermark, marks)
+        return articles
+
+    def _parse_entries(self, feed: bytes) -> ParsedFeed:
+        """Parse every item in the feed, falling back to BeautifulSoup for bad XML."""
+        before = self.date_parser.stats.copy()
+        try:
+            entries = self._streaming_entries(feed)
+        except ET.ParseError:
+            entries = self._soup_entries(feed)
+        return entries, tuple((self.date_parser.stats - before).items())
+
+    def _build_articles(
+        self, entries: Iterable[FeedEntry], watermark: Optional[FeedWatermark] = None
+    ) -> tuple[list[Article], list[tuple[int, str]]]:
+        """
+        Build Articles for the entries that are new to the watermark.
+
+        :return: New articles, and (pubdate, key) of each for the watermark
+        """
         articles = []
+        marks: list[tuple[int, str]] = []
+
+        for pubdate, key, headline, link, author in entries:
+            if watermark is not None and not watermark.is_new(pubdate, key):
+                self.skipped_seen += 1
+                continue
+            marks.append((pubdate, key))
+
+            article = Article(
+                publisher=self.author,
+                feed_title=self.title,
+                headline=headline,
+                link=link,
+                pubdate=pubdate,
+                source_type=self.source_type,
+                author=author,
+            )
+            articles.append(article)
+
+        return articles, marks
+
+    def _streaming_entries(self, feed: bytes) -> tuple[FeedEntry, ...]:
+        """Read every item with the streaming XML parser."""
+        entries = []
+        for item in iter_feed_items(feed):
+            pubdate = self.convert_pubdate_to_epoch(item.pubdate) if item.pubdate else 0
+            entries.append((pubdate, item.guid or item.link, item.title, item.link, item.author))
+        return tuple(entries)
+
+    def _soup_entries(self, feed: bytes) -> tuple[FeedEntry, ...]:
+        """Read every item from a BeautifulSoup tree of the feed."""
+        soup = self.soup(feed)
+        entries = []
 
         for item in soup.find_all("item"):
-            publisher = self.author
-            feed_title = self.title
-            headline = item.find("title").text
-            author = item.find("author").text if item.find("author") else ""
+            headline = _text(item.find("title"))
+            author = _text(item.find("author")) if item.find("author") else ""
 
             # Link handling - some feeds have link as text, others as next sibling
             link_tag = item.find("link")
@@ -39,18 +136,11 @@ class RSSReader(BaseReader):
             else:
                 link = ""
 
-            pubdate_tag = item.find("pubdate")
+            pubdate_tag = item.find(_PUBDATE_TAG)
             pubdate = self.convert_pubdate_to_epoch(pubdate_tag.text) if pubdate_tag else 0
 
-            article = Article(
-                publisher=publisher,
-                feed_title=feed_title,
-                headline=headline,
-                link=link,
-                pubdate=pubdate,
-                source_type=self.source_type,
-                author=author,
-            )
-            articles.append(article)
+            guid_tag = item.find("guid")
+            key = guid_tag.text.strip() if guid_tag else link
+            entries.append((pubdate, key, headline, link, author))
 
-        return articles
+        return tuple(entries)
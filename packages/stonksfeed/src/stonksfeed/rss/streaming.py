@@ -0,0 +1,109 @@
+"""Streaming RSS/Atom parser built on ElementTree's pull parser."""
+
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass
+from typing import Iterable, Iterator, Optional, Union, cast
+
+ATOM_NS = "http://www.w3.org/2005/Atom"
+
+# Elements that hold one feed item
+ITEM_TAGS = {"item", "entry"}
+
+# Item fields we read, by lowercase local name
+FIELD_TAGS = {"title", "link", "author", "pubdate", "published", "updated", "guid", "id"}
+
+# Feed bytes are handed to the parser in chunks of this size
+CHUNK_SIZE = 64 * 1024
+
+
+@dataclass
+class FeedItem:
+    """Raw fields of a single RSS item or Atom entry."""
+
+    title: str = ""
+    link: str = ""
+    author: str = ""
+    pubdate: Optional[str] = None
+    guid: Optional[str] = None
+
+
+def _split_tag(tag: str) -> tuple[str, str]:
+    """Split '{namespace}local' into (namespace, lowercase local name)."""
+    if tag.startswith("{"):
+        namespace, _, local = tag[1:].partition("}")
+        return namespace, local.lower()
+    return "", tag.lower()
+
+
+def _set_field(item: FeedItem, name: str, elem: ET.Element) -> None:
+    """Copy a completed child element of an item onto the FeedItem."""
+    text = "".join(elem.itertext()).strip()
+    if name == "title":
+        item.title = text
+    elif name == "link":
+        # Atom links carry the URL in href; only take the alternate link
+        href = elem.get("href")
+        if href is not None:
+            if elem.get("rel", "alternate") == "alternate" and not item.link:
+                item.link = href.strip()
+        elif not item.link:
+            item.link = text
+    elif name == "author":
+        item.author = text
+    elif name == "pubdate" or (name in ("published", "updated") and item.pubdate is None):
+        item.pubdate = text
+    elif name in ("guid", "id") and item.guid is None:
+        item.guid = text
+
+
+def _chunks(source: Union[bytes, Iterable[bytes]]) -> Iterator[bytes]:
+    if isinstance(source, (bytes, bytearray)):
+        for i in range(0, len(source), CHUNK_SIZE):
+            yield bytes(source[i : i + CHUNK_SIZE])
+    else:
+        yield from source
+
+
+def iter_feed_items(source: Union[bytes, Iterable[bytes]]) -> Iterator[FeedItem]:
+    """
+    Parse an RSS or Atom document incrementally, yielding one item at a time.
+
+    The document is fed to the parser in chunks and every item is
+    discarded as soon as it has been yielded, so memory use stays flat
+    no matter how many items the feed has.
+
+    :param source: Feed bytes, or an iterable of byte chunks
+    :raises xml.etree.ElementTree.ParseError: if the feed is not well-formed XML
+    """
+    parser: ET.XMLPullParser[ET.Element] = ET.XMLPullParser(events=("start", "end"))
+    stack: list[ET.Element] = []
+    item: Optional[FeedItem] = None
+    item_depth = 0
+
+    for chunk in _chunks(source):
+        parser.feed(chunk)
+        # Only start and end events were asked for, and both carry an element
+        events = cast(Iterator[tuple[str, ET.Element]], parser.read_events())
+        for event, elem in events:
+            namespace, name = _split_tag(elem.tag)
+            if event == "start":
+                stack.append(elem)
+                if item is None and name in ITEM_TAGS:
+                    item = FeedItem()
+                    item_depth = len(stack)
+                continue
+
+            depth = len(stack)
+            stack.pop()
+            if item is None:
+                continue
+            # Only plain RSS and Atom elements count as item fields
+            if depth == item_depth + 1 and name in FIELD_TAGS and namespace in ("", ATOM_NS):
+                _set_field(item, name, elem)
+            elif depth == item_depth:
+                yield item
+                item = None
+                # Drop the finished item so the tree never holds more than one
+                if stack:
+                    stack[-1].remove(elem)
+    parser.close()
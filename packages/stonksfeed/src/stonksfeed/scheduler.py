@@ -0,0 +1,175 @@
+"""Adaptive polling: learn how often each source changes and only fetch it when due."""
+
+import time
+from dataclasses import asdict, dataclass
+from typing import Callable, Iterable, Optional
+
+from stonksfeed.config import (
+    SCHEDULE_INITIAL_INTERVAL_SECONDS,
+    SCHEDULE_MAX_INTERVAL_SECONDS,
+    SCHEDULE_TICK_SECONDS,
+)
+from stonksfeed.fetch import FetchResult
+from stonksfeed.rss.base import BaseReader
+from stonksfeed.store import BaseStore
+
+
+@dataclass
+class SourceSchedule:
+    """Learned polling state for one source."""
+
+    interval: float = SCHEDULE_INITIAL_INTERVAL_SECONDS
+    next_due: float = 0.0
+    last_fetched: float = 0.0
+    fetches: int = 0
+    changes: int = 0
+    errors: int = 0
+
+    def to_dict(self) -> dict:
+        """Serialize for storage."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Optional[dict]) -> "SourceSchedule":
+        """Load stored state; a never-fetched source if nothing was stored."""
+        if not data:
+            return cls()
+        return cls(**{k: v for k, v in data.items() if k in cls.__dataclass_fields__})
+
+
+class AdaptiveScheduler:
+    """
+    Decide which sources are due on each scheduler tick.
+
+    Each source's interval tracks the average time between its new items:
+    after a fetch that found ``n`` new items ``t`` seconds after the last
+    one, the interval moves towards ``t / n`` (an exponentially weighted
+    average). Fetches that find nothing stretch the interval by
+    ``backoff``. Intervals are kept between one tick and ``max_interval``,
+    so busy feeds are polled every tick and quiet ones a few times a day.
+
+    The clock is injectable so the schedule can be tested without waiting.
+    """
+
+    def __init__(
+        self,
+        store: BaseStore,
+        clock: Callable[[], float] = time.time,
+        tick: float = SCHEDULE_TICK_SECONDS,
+        initial_interval: float = SCHEDULE_INITIAL_INTERVAL_SECONDS,
+        max_interval: float = SCHEDULE_MAX_INTERVAL_SECONDS,
+        smoothing: float = 0.5,
+        backoff: float = 1.5,
+    ) -> None:
+        """
+        Initialize the scheduler.
+
+        :param store: Where per-source schedules are kept, keyed by URL
+        :param clock: Returns the current time in epoch seconds
+        :param tick: How often the scheduler runs (also the minimum interval)
+        :param initial_interval: Interval for a source with no history
+        :param max_interval: Longest interval any source may have
+        :param smoothing: Weight given to the newest observation
+        :param backoff: Interval multiplier after a fetch with no new items
+        """
+        self.store = store
+        self.clock = clock
+        self.tick = tick
+        self.initial_interval = initial_interval
+        self.max_interval = max_interval
+        self.smoothing = smoothing
+        self.backoff = backoff
+
+    def _load(self, urls: list[str]) -> dict[str, SourceSchedule]:
+        stored = self.store.get_many(urls)
+        schedules = {}
+        for url in urls:
+            schedule = SourceSchedule.from_dict(stored.get(url))
+            if url not in stored:
+                schedule.interval = self.initial_interval
+            schedules[url] = schedule
+        return schedules
+
+    def is_due(self, schedule: SourceSchedule, now: float) -> bool:
+        """
+        Return True if a source should be fetched at ``now``.
+
+        Ticks don't fire at exactly the same offset each time, so a source
+        counts as due if it will be before the middle of the next tick.
+        """
+        return schedule.next_due <= now + self.tick / 2
+
+    def due(self, readers: Iterable[BaseReader]) -> list[BaseReader]:
+        """
+        Return the readers that are due, most overdue first.
+
+        Sources that have never been fetched are always due.
+        """
+        readers = list(readers)
+        now = self.clock()
+        schedules = self._load([r.url for r in readers])
+        due = [r for r in readers if self.is_due(schedules[r.url], now)]
+        return sorted(due, key=lambda r: schedules[r.url].next_due)
+
+    def _update(self, schedule: SourceSchedule, result: FetchResult, now: float) -> None:
+        if result.deferred:
+            # Ran out of time; due immediately so it goes first next run
+            schedule.next_due = 0.0
+            return
+        schedule.fetches += 1
+        if not result.ok:
+            # Retry on the next tick without learning anything from the failure
+            schedule.errors += 1
+            schedule.next_due = now + self.tick
+            return
+
+        new_items = len(result.articles)
+        if schedule.last_fetched:
+            elapsed = now - schedule.last_fetched
+            if new_items:
+                sample = elapsed / new_items
+                schedule.interval += self.smoothing * (sample - schedule.interval)
+            else:
+                schedule.interval *= self.backoff
+        if new_items:
+            schedule.changes += 1
+        schedule.interval = min(max(schedule.interval, self.tick), self.max_interval)
+        schedule.last_fetched = now
+        schedule.next_due = now + schedule.interval
+
+    def record(self, results: Iterable[FetchResult]) -> None:
+        """
+        Learn from a round of fetches and persist the updated schedules.
+
+        ``result.articles`` should hold only new items (i.e. the readers
+        use a watermark store), otherwise every fetch looks like a change.
+        """
+        results = list(results)
+        if not results:
+            return
+        now = self.clock()
+        schedules = self._load([r.reader.url for r in results])
+        for result in results:
+            self._update(schedules[result.reader.url], result, now)
+        self.store.set_many({url: s.to_dict() for url, s in schedules.items()})
+        self.store.flush()
+
+    def snapshot(self, readers: Iterable[BaseReader]) -> list[dict]:
+        """
+        Describe the schedule of each reader, for logging or inspection.
+
+        :return: One dict per reader with its title, URL, stored schedule
+            and whether it is due now
+        """
+        readers = list(readers)
+        now = self.clock()
+        schedules = self._load([r.url for r in readers])
+        return [
+            {
+                "title": r.title,
+                "url": r.url,
+                "due": self.is_due(schedules[r.url], now),
+                **schedules[r.url].to_dict(),
+            }
+            for r in readers
+        ]
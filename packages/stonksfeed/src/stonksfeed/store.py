@@ -0,0 +1,389 @@
+"""Persistent key-value stores for state kept between runs."""
+
+import json
+import os
+import random
+import sqlite3
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional
+
+# Environment variables that select where state is kept
+STATE_DIR_ENV = "STONKSFEED_STATE_DIR"
+STATE_TABLE_ENV = "STONKSFEED_STATE_TABLE"
+
+# Attempts at a DynamoDB batch request before giving up on its unprocessed part
+BATCH_ATTEMPTS = 8
+# Backoff between those attempts: full jitter, capped (seconds)
+BATCH_BASE_DELAY = 0.05
+BATCH_MAX_DELAY = 2.0
+
+
+class UnprocessedItemsError(RuntimeError):
+    """DynamoDB left part of a batch request unprocessed after every retry."""
+
+    def __init__(self, operation: str, remaining: int) -> None:
+        super().__init__(f"{operation}: {remaining} items still unprocessed after retries")
+        self.operation = operation
+        self.remaining = remaining
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss counters for a cache."""
+
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def __str__(self) -> str:
+        return f"{self.hits} hits, {self.misses} misses ({self.hit_rate:.0%})"
+
+
+class BaseStore:
+    """
+    Base class for key-value stores.
+
+    Keys are strings and values must be JSON serializable. Writes may be
+    buffered until ``flush()`` is called.
+    """
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the value for key, or None if missing."""
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, Any]:
+        """Return a dict of the keys that are present in the store."""
+        raise NotImplementedError("Subclasses must implement get_many()")
+
+    def set(self, key: str, value: Any) -> None:
+        """Set the value for key."""
+        self.set_many({key: value})
+
+    def set_many(self, items: dict[str, Any]) -> None:
+        """Set several values at once."""
+        raise NotImplementedError("Subclasses must implement set_many()")
+
+    def flush(self) -> None:
+        """Persist any buffered writes."""
+
+
+class MemoryStore(BaseStore):
+    """Store that only lives as long as the process."""
+
+    def __init__(self) -> None:
+        self._data: dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, Any]:
+        with self._lock:
+            return {k: self._data[k] for k in keys if k in self._data}
+
+    def set_many(self, items: dict[str, Any]) -> None:
+        with self._lock:
+            self._data.update(items)
+
+
+class JsonFileStore(MemoryStore):
+    """
+    Store backed by a single JSON file.
+
+    The file is loaded on first use and rewritten atomically on flush.
+    Suitable for small stores and for Lambda's ``/tmp``. With
+    ``ttl_seconds``, each key's expiry is saved alongside the values;
+    expired keys read as missing and are dropped when the file is loaded.
+    """
+
+    def __init__(self, path: str | Path, ttl_seconds: Optional[int] = None) -> None:
+        """
+        Initialize the store.
+
+        :param path: Path of the JSON file
+        :param ttl_seconds: If set, items expire this long after being written
+        """
+        super().__init__()
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        # Key -> epoch time it expires at, for keys written with a TTL
+        self._expires: dict[str, int] = {}
+        self._loaded = False
+        self._dirty = False
+
+    def _load(self) -> None:
+        if self._loaded:
+            return
+        try:
+            data = json.loads(self.path.read_text())
+        except (FileNotFoundError, ValueError):
+            data = {}
+        if data.get("version") == 2:
+            self._data, self._expires = data["values"], data["expires"]
+        else:
+            # Plain key -> value mapping, written before expiries were kept
+            self._data, self._expires = data, {}
+        now = int(time.time())
+        expired = [k for k, at in self._expires.items() if at <= now]
+        for key in expired:
+            self._data.pop(key, None)
+            del self._expires[key]
+        self._dirty = bool(expired)
+        self._loaded = True
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, Any]:
+        now = int(time.time())
+        with self._lock:
+            self._load()
+            return {
+                k: self._data[k]
+                for k in keys
+                if k in self._data and self._expires.get(k, now + 1) > now
+            }
+
+    def set_many(self, items: dict[str, Any]) -> None:
+        with self._lock:
+            self._load()
+            self._data.update(items)
+            if self.ttl_seconds is not None:
+                expires = int(time.time()) + self.ttl_seconds
+                self._expires.update(dict.fromkeys(items, expires))
+            else:
+                for key in items:
+                    self._expires.pop(key, None)
+            self._dirty = True
+
+    def flush(self) -> None:
+        with self._lock:
+            if not self._dirty:
+                return
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump({"version": 2, "values": self._data, "expires": self._expires}, f)
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+
+
+# One connection (and the lock serializing it) per database file, shared by
+# every namespace in it, so one namespace's open write doesn't lock out another
+_sqlite_connections: dict[Path, tuple[sqlite3.Connection, threading.Lock]] = {}
+_sqlite_connections_lock = threading.Lock()
+
+
+def _sqlite_connection(path: Path) -> tuple[sqlite3.Connection, threading.Lock]:
+    """Return the shared connection to a database file, opening it if needed."""
+    path = path.resolve()
+    with _sqlite_connections_lock:
+        if path not in _sqlite_connections:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(path, check_same_thread=False)
+            _sqlite_connections[path] = (conn, threading.Lock())
+        return _sqlite_connections[path]
+
+
+class SQLiteStore(BaseStore):
+    """
+    Store backed by a table in a local SQLite database.
+
+    Stores on the same file share one connection, so ``flush()`` on any of
+    them commits the buffered writes of all of them. With ``ttl_seconds``,
+    each row records when it expires; expired rows read as missing and
+    are deleted on flush.
+    """
+
+    def __init__(self, path: str | Path, namespace: str, ttl_seconds: Optional[int] = None) -> None:
+        """
+        Initialize the store.
+
+        :param path: Path of the SQLite database file
+        :param namespace: Name of the table holding this store's keys
+        :param ttl_seconds: If set, items expire this long after being written
+        """
+        self.path = Path(path)
+        self.namespace = namespace
+        self.ttl_seconds = ttl_seconds
+        self._conn, self._lock = _sqlite_connection(self.path)
+        with self._lock:
+            self._conn.execute(
+                f'CREATE TABLE IF NOT EXISTS "{namespace}" '
+                "(key TEXT PRIMARY KEY, value TEXT, expires INTEGER)"
+            )
+            columns = {row[1] for row in self._conn.execute(f'PRAGMA table_info("{namespace}")')}
+            if "expires" not in columns:
+                # Table created before expiries were kept; its rows never expire
+                self._conn.execute(f'ALTER TABLE "{namespace}" ADD COLUMN expires INTEGER')
+            self._conn.commit()
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, Any]:
+        keys = list(keys)
+        result: dict[str, Any] = {}
+        with self._lock:
+            # Stay well below SQLite's host parameter limit
+            for i in range(0, len(keys), 500):
+                chunk = keys[i : i + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f'SELECT key, value FROM "{self.namespace}" WHERE key IN ({placeholders}) '
+                    "AND (expires IS NULL OR expires > ?)",
+                    [*chunk, int(time.time())],
+                )
+                result.update((k, json.loads(v)) for k, v in rows)
+        return result
+
+    def set_many(self, items: dict[str, Any]) -> None:
+        expires = None if self.ttl_seconds is None else int(time.time()) + self.ttl_seconds
+        with self._lock:
+            self._conn.executemany(
+                f'INSERT OR REPLACE INTO "{self.namespace}" (key, value, expires) VALUES (?, ?, ?)',
+                [(k, json.dumps(v), expires) for k, v in items.items()],
+            )
+
+    def flush(self) -> None:
+        with self._lock:
+            self._conn.execute(
+                f'DELETE FROM "{self.namespace}" WHERE expires <= ?', (int(time.time()),)
+            )
+            self._conn.commit()
+
+
+class DynamoDBStore(BaseStore):
+    """
+    Store backed by a DynamoDB table.
+
+    The table uses ``namespace`` (S) as partition key and ``key`` (S) as
+    sort key; each value is kept as a JSON string. Writes are buffered
+    and sent with BatchWriteItem on flush.
+
+    Keys or items DynamoDB leaves unprocessed (when throttled) are resent
+    with jittered exponential backoff, up to ``attempts`` requests per
+    batch; if some are still left, UnprocessedItemsError is raised.
+    """
+
+    def __init__(
+        self,
+        table_name: str,
+        namespace: str,
+        client=None,
+        ttl_seconds: Optional[int] = None,
+        attempts: int = BATCH_ATTEMPTS,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """
+        Initialize the store.
+
+        :param table_name: Name of the DynamoDB state table
+        :param namespace: Partition key shared by this store's items
+        :param client: boto3 DynamoDB client (created if not given)
+        :param ttl_seconds: If set, items expire this long after being written
+        :param attempts: Requests per batch before giving up on unprocessed items
+        :param sleep: Function used to wait between attempts
+        """
+        if client is None:
+            import boto3
+
+            client = boto3.client("dynamodb")
+        self.client = client
+        self.table_name = table_name
+        self.namespace = namespace
+        self.ttl_seconds = ttl_seconds
+        self.attempts = attempts
+        self.sleep = sleep
+        self._rng = random.Random()
+        self._pending: dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def _key(self, key: str) -> dict:
+        return {"namespace": {"S": self.namespace}, "key": {"S": key}}
+
+    def _backoff(self, attempt: int) -> None:
+        """Wait before resending the unprocessed part of a batch."""
+        self.sleep(self._rng.uniform(0, min(BATCH_MAX_DELAY, BATCH_BASE_DELAY * 2**attempt)))
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, Any]:
+        keys = list(dict.fromkeys(keys))
+        result: dict[str, Any] = {}
+        with self._lock:
+            result.update({k: self._pending[k] for k in keys if k in self._pending})
+        remaining = [k for k in keys if k not in result]
+        for i in range(0, len(remaining), 100):
+            request: dict[str, Any] = {
+                self.table_name: {"Keys": [self._key(k) for k in remaining[i : i + 100]]}
+            }
+            for attempt in range(self.attempts):
+                if attempt:
+                    self._backoff(attempt - 1)
+                response = self.client.batch_get_item(RequestItems=request)
+                for item in response["Responses"].get(self.table_name, []):
+                    result[item["key"]["S"]] = json.loads(item["value"]["S"])
+                request = response.get("UnprocessedKeys") or {}
+                if not request:
+                    break
+            else:
+                raise UnprocessedItemsError("BatchGetItem", len(request[self.table_name]["Keys"]))
+        return result
+
+    def set_many(self, items: dict[str, Any]) -> None:
+        with self._lock:
+            self._pending.update(items)
+
+    def flush(self) -> None:
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        extra: dict[str, dict[str, str]] = {}
+        if self.ttl_seconds is not None:
+            extra["ttl"] = {"N": str(int(time.time()) + self.ttl_seconds)}
+        writes = [
+            {"PutRequest": {"Item": {**self._key(k), "value": {"S": json.dumps(v)}, **extra}}}
+            for k, v in pending.items()
+        ]
+        for i in range(0, len(writes), 25):
+            request: dict[str, Any] = {self.table_name: writes[i : i + 25]}
+            for attempt in range(self.attempts):
+                if attempt:
+                    self._backoff(attempt - 1)
+                response = self.client.batch_write_item(RequestItems=request)
+                request = response.get("UnprocessedItems") or {}
+                if not request:
+                    break
+            else:
+                raise UnprocessedItemsError("BatchWriteItem", len(request[self.table_name]))
+
+
+def default_state_dir() -> Path:
+    """
+    Return the directory used for local state.
+
+    ``$STONKSFEED_STATE_DIR`` if set, ``/tmp/stonksfeed`` on Lambda,
+    otherwise ``~/.cache/stonksfeed``.
+    """
+    if os.environ.get(STATE_DIR_ENV):
+        return Path(os.environ[STATE_DIR_ENV])
+    if os.environ.get("AWS_LAMBDA_FUNCTION_NAME"):
+        return Path(tempfile.gettempdir()) / "stonksfeed"
+    return Path.home() / ".cache" / "stonksfeed"
+
+
+def open_store(namespace: str, ttl_seconds: Optional[int] = None) -> BaseStore:
+    """
+    Open the persistent store for a namespace in the current environment.
+
+    - ``$STONKSFEED_STATE_TABLE`` set: DynamoDBStore
+    - Running on Lambda: JsonFileStore under ``/tmp``
+    - Otherwise: SQLiteStore in the local state directory
+
+    :param namespace: Name of the store (e.g. ``"si_post_dates"``)
+    :param ttl_seconds: How long items are kept after being written (forever if None)
+    """
+    table_name = os.environ.get(STATE_TABLE_ENV)
+    if table_name:
+        return DynamoDBStore(table_name, namespace, ttl_seconds=ttl_seconds)
+    if os.environ.get("AWS_LAMBDA_FUNCTION_NAME"):
+        return JsonFileStore(default_state_dir() / f"{namespace}.json", ttl_seconds)
+    return SQLiteStore(default_state_dir() / "state.db", namespace, ttl_seconds)
@@ -0,0 +1,69 @@
+"""Per-feed high-water marks so only new items are materialized."""
+
+from typing import Any, Iterable, Optional
+
+from stonksfeed.config import WATERMARK_GRACE_SECONDS
+
+
+class FeedWatermark:
+    """
+    Newest position seen in a feed, plus the keys of the items around it.
+
+    ``position`` is whatever orders the feed: the pubdate for RSS items,
+    the message ID for forum posts. An item is new if its position is not
+    older than the mark minus ``grace`` and its key (GUID or link) has not
+    been seen. The grace window lets slightly back-dated items through
+    while keys stop them from being reported twice.
+    """
+
+    def __init__(
+        self,
+        position: int = 0,
+        keys: Optional[dict[str, int]] = None,
+        grace: int = WATERMARK_GRACE_SECONDS,
+    ) -> None:
+        """
+        Initialize the watermark.
+
+        :param position: Highest position seen so far
+        :param keys: Position of each recently seen item, by key
+        :param grace: How far behind ``position`` an unseen item may be
+        """
+        self.position = position
+        self.keys = keys or {}
+        self.grace = grace
+
+    def is_new(self, position: int, key: str) -> bool:
+        """Return True if an item has not been seen before."""
+        if self.position and position < self.position - self.grace:
+            return False
+        return key not in self.keys
+
+    def advance(self, items: Iterable[tuple[int, str]]) -> "FeedWatermark":
+        """
+        Return a watermark that also covers the given items.
+
+        Keys that fall out of the grace window are dropped, so the
+        watermark stays small however long the feed has been polled.
+
+        :param items: (position, key) of each item handed out this run
+        """
+        keys = dict(self.keys)
+        keys.update((key, position) for position, key in items)
+        position = max([self.position, *keys.values()])
+        cutoff = position - self.grace
+        keys = {key: p for key, p in keys.items() if p >= cutoff}
+        return FeedWatermark(position, keys, self.grace)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize for storage."""
+        return {"position": self.position, "keys": self.keys}
+
+    @classmethod
+    def from_dict(
+        cls, data: Optional[dict], grace: int = WATERMARK_GRACE_SECONDS
+    ) -> "FeedWatermark":
+        """Load a stored watermark; an empty one if nothing was stored."""
+        if not data:
+            return cls(grace=grace)
+        return cls(data.get("position", 0), data.get("keys"), grace)
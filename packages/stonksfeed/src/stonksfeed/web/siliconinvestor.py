@@ -1,16 +1,19 @@
 """Silicon Investor forum scraper."""
 
 import re
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, wait
+from datetime import datetime, timedelta
 from typing import Optional
 
 import pytz
 import requests
-from bs4 import BeautifulSoup
-from dateutil import parser as date_parser
+from bs4 import SoupStrainer, Tag
 
+from stonksfeed.config import POST_FETCH_WORKERS
 from stonksfeed.models.article import Article
+from stonksfeed.net.download import read_body
 from stonksfeed.rss.base import BaseReader
+from stonksfeed.store import BaseStore, CacheStats
 
 
 class SiliconInvestorPage(BaseReader):
@@ -19,15 +22,57 @@ class SiliconInvestorPage(BaseReader):
     ROOT_URL = "http://www.siliconinvestor.com/"
     TIMEZONE = pytz.timezone("US/Pacific")
 
-    def __init__(self, title: str, url: str):
+    # Upper bound on how long a page waits for its post dates, in seconds
+    POST_DATES_TIMEOUT = 30.0
+
+    # Message IDs only ever increase, so the watermark needs no grace window
+    WATERMARK_GRACE = 0
+
+    # The only parts of each page we read; everything else is never built
+    MESSAGE_ROWS = SoupStrainer("tr", attrs={"align": "left"})
+    POST_CONTENT = SoupStrainer("div", attrs={"id": "msgcontentDiv"})
+
+    # List page timestamps precise and stable enough to use as the post date:
+    # times of day ("1 AM", "10:42 PM") and full dates. Relative ones ("3 hours
+    # ago") give a different date on every run, and vague ones ("yesterday",
+    # "2/27/2024") aren't precise, so both are left to the post page.
+    TIME_OF_DAY = re.compile(r"^(\d{1,2})(?::(\d{2}))? ?([AP]M)$", re.IGNORECASE)
+    FULL_DATE = re.compile(r"^\d{1,2}/\d{1,2}/\d{4} \d{1,2}:\d{2}")
+
+    def __init__(
+        self,
+        title: str,
+        url: str,
+        max_workers: int = POST_FETCH_WORKERS,
+        date_cache: Optional[BaseStore] = None,
+        scoped_parsing: bool = True,
+        list_dates: bool = True,
+        **options,
+    ):
         """
         Initialize the Silicon Investor scraper.
 
         :param title: Name of the forum/thread
         :param url: URL of the forum page
+        :param max_workers: Maximum number of post pages fetched concurrently
+        :param date_cache: Store of post dates keyed by message ID
+        :param scoped_parsing: Build only the message rows and message div
+                               instead of the whole page (falls back to a
+                               full parse when that finds nothing)
+        :param list_dates: Take post dates from the list page's timestamps,
+                           fetching post pages only where those are too
+                           vague (e.g. "yesterday")
+        :param options: Passed to BaseReader (stores, session, limiter)
         """
         self.source_type = "forum post"
-        super().__init__("Silicon Investor", title, url)
+        self.max_workers = max_workers
+        self.date_cache = date_cache
+        self.scoped_parsing = scoped_parsing
+        self.list_dates = list_dates
+        self.cache_stats = CacheStats()
+        self.dates_from_list = 0
+        self.post_fetches = 0
+        super().__init__("Silicon Investor", title, url, **options)
 
     def _build_link(self, partial: str) -> str:
         """Build full URL from partial path."""
@@ -44,61 +89,79 @@ class SiliconInvestorPage(BaseReader):
         """
         Fetch the actual post date from an individual post page.
 
-        The date location varies:
-        - Original posts: date is next to "From:" row
-        - Reply posts: date is next to "To:" row, "From:" row has message number
-
         :param post_url: URL of the individual post
-        :return: Unix epoch timestamp or None if parsing fails
+        :return: Unix epoch timestamp or None if fetching or parsing fails
         """
         try:
-            response = requests.get(post_url, timeout=15)
+            response = self.session.get(post_url, timeout=15, stream=True)
+            content = read_body(response, self.max_bytes)
+            self.limiter.observe(post_url, response)
             response.raise_for_status()
-            soup = BeautifulSoup(response.content, features=self.parser)
+            return self._extract_post_date(content)
+        except (requests.RequestException, ValueError, AttributeError):
+            return None
 
-            # Find the div containing the message content
+    def _find_post_content(self, content: bytes) -> Optional[Tag]:
+        """Return the post page's message div, parsing only that div if possible."""
+        if self.scoped_parsing:
+            soup = self.soup(content, parse_only=self.POST_CONTENT)
             msg_div = soup.find("div", id="msgcontentDiv")
-            if not msg_div:
-                return None
-
-            # Find the table inside the message div
-            table = msg_div.find("table")
-            if not table:
-                return None
-
-            # Look through rows for the date
-            # Priority: "To:" row (for replies), then "From:" row (for original posts)
-            date_text = None
-
-            for row in table.find_all("tr"):
-                cells = row.find_all("td")
-                if len(cells) >= 2:
-                    first_cell_text = cells[0].get_text(strip=True)
-
-                    # For replies, the date is in the "To:" row
-                    if first_cell_text.startswith("To:"):
-                        candidate = cells[1].get_text(strip=True)
-                        # Verify it looks like a date (contains / and numbers)
-                        if "/" in candidate and any(c.isdigit() for c in candidate):
-                            date_text = candidate
-                            break
-
-                    # For original posts, the date is in the "From:" row
-                    # But only if it's not a message number (contains "of")
-                    if first_cell_text.startswith("From:"):
-                        candidate = cells[1].get_text(strip=True)
-                        # Check if it looks like a date, not message number
-                        if "/" in candidate and "of" not in candidate:
-                            date_text = candidate
-                            break
-
-            if date_text:
-                return self._parse_post_date(date_text)
+            if msg_div is not None:
+                return msg_div
+        return self.soup(content).find("div", id="msgcontentDiv")
+
+    def _extract_post_date(self, content: bytes) -> Optional[int]:
+        """
+        Read the post date from a post page.
+
+        The date location varies:
+        - Original posts: date is next to "From:" row
+        - Reply posts: date is next to "To:" row, "From:" row has message number
 
+        :param content: Post page HTML
+        :return: Unix epoch timestamp or None if no date is found
+        """
+        # Find the div containing the message content
+        msg_div = self._find_post_content(content)
+        if not msg_div:
             return None
-        except (requests.RequestException, ValueError, AttributeError):
+
+        # Find the table inside the message div
+        table = msg_div.find("table")
+        if not table:
             return None
 
+        # Look through rows for the date
+        # Priority: "To:" row (for replies), then "From:" row (for original posts)
+        date_text = None
+
+        for row in table.find_all("tr"):
+            cells = row.find_all("td")
+            if len(cells) >= 2:
+                first_cell_text = cells[0].get_text(strip=True)
+
+                # For replies, the date is in the "To:" row
+                if first_cell_text.startswith("To:"):
+                    candidate = cells[1].get_text(strip=True)
+                    # Verify it looks like a date (contains / and numbers)
+                    if "/" in candidate and any(c.isdigit() for c in candidate):
+                        date_text = candidate
+                        break
+
+                # For original posts, the date is in the "From:" row
+                # But only if it's not a message number (contains "of")
+                if first_cell_text.startswith("From:"):
+                    candidate = cells[1].get_text(strip=True)
+                    # Check if it looks like a date, not message number
+                    if "/" in candidate and "of" not in candidate:
+                        date_text = candidate
+                        break
+
+        if date_text:
+            return self._parse_post_date(date_text)
+
+        return None
+
     def _parse_post_date(self, date_text: str) -> Optional[int]:
         """
         Parse a date string like "1/16/2026 10:29:34 AM" to epoch timestamp.
@@ -107,8 +170,8 @@ class SiliconInvestorPage(BaseReader):
         :return: Unix epoch timestamp or None if parsing fails
         """
         try:
-            # Parse the date string (dateutil handles various formats)
-            dt = date_parser.parse(date_text)
+            # Fast path for "M/D/YYYY h:mm:ss AM", dateutil for anything else
+            dt = self.date_parser.parse(date_text)
             # Localize to Pacific time if no timezone info
             if dt.tzinfo is None:
                 dt = self.TIMEZONE.localize(dt)
@@ -116,26 +179,130 @@ class SiliconInvestorPage(BaseReader):
         except (ValueError, TypeError):
             return None
 
-    def get_articles(self) -> list[Article]:
+    def _parse_list_date(self, text: str, now: datetime) -> Optional[int]:
         """
-        Fetch and parse forum posts from Silicon Investor.
+        Resolve a list page timestamp to an epoch, or None if it is unusable.
 
-        This method:
-        1. Fetches the forum list page
-        2. Extracts post links from the table
-        3. Fetches each individual post page to get the accurate date
+        A time of day is today in TIMEZONE, or yesterday if that would be
+        in the future, so it resolves the same on every run while the post
+        is listed with it. Relative and vague timestamps give None.
+
+        :param text: The row's date cell, e.g. "1 AM" or "3 hours ago"
+        :param now: Current time in TIMEZONE
         """
-        page = self._fetch_content()
-        soup = self.soup(page, features=self.parser)
-        articles = []
-        seen_msg_ids = set()
+        text = " ".join(text.split())
+        match = self.TIME_OF_DAY.match(text)
+        if match:
+            hour, minute, meridiem = match.groups()
+            hour = int(hour) % 12 + (12 if meridiem.upper() == "PM" else 0)
+            local_now = now.replace(tzinfo=None)
+            when = local_now.replace(hour=hour, minute=int(minute or 0), second=0, microsecond=0)
+            if when > local_now:
+                when -= timedelta(days=1)
+            return int(self.TIMEZONE.localize(when).timestamp())
+
+        if self.FULL_DATE.match(text):
+            return self._parse_post_date(text)
+        return None
+
+    def _fetch_post_date_limited(self, post_url: str) -> Optional[int]:
+        """Fetch a post date while holding a per-host request slot."""
+        with self.limiter.slot(post_url):
+            return self._fetch_post_date(post_url)
+
+    def _fetch_post_dates(self, post_urls: list[str]) -> list[Optional[int]]:
+        """
+        Fetch the dates of several posts concurrently.
 
-        # Fallback timestamp if we can't get the real date
-        now = datetime.now(self.TIMEZONE)
-        fallback_timestamp = int(now.timestamp())
+        Posts that fail, or that have not finished within
+        POST_DATES_TIMEOUT, come back as None so that a single slow post
+        never holds up the rest of the page.
 
-        # Find all rows in the message table
-        for row in soup.find_all("tr", align="left"):
+        :param post_urls: URLs of the individual posts
+        :return: Epoch timestamps (or None) in the same order as post_urls
+        """
+        if not post_urls:
+            return []
+
+        pool = ThreadPoolExecutor(
+            max_workers=max(1, min(self.max_workers, len(post_urls))),
+            thread_name_prefix="stonksfeed-si-post",
+        )
+        try:
+            futures = [pool.submit(self._fetch_post_date_limited, url) for url in post_urls]
+            wait(futures, timeout=self.POST_DATES_TIMEOUT)
+            return [
+                f.result() if f.done() and not f.cancelled() and f.exception() is None else None
+                for f in futures
+            ]
+        finally:
+            # Don't block on stragglers; they finish against their own timeout
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _lookup_post_dates(self, rows: list[tuple]) -> list[Optional[int]]:
+        """
+        Resolve post dates for message rows, using the date cache first.
+
+        Post dates never change, so only messages missing from the cache
+        are looked up: from the list page timestamp if it is precise and stable,
+        otherwise by fetching the post page. Only fetched dates are written
+        back, as list page dates are approximate.
+
+        :param rows: (msg_id, headline, link, author, listed) tuples, where
+                     ``listed`` is the list page date or None
+        :return: Epoch timestamps (or None) in the same order as rows
+        """
+        msg_ids = [row[0] for row in rows]
+        cached = {}
+        if self.date_cache is not None:
+            cached = self.date_cache.get_many([m for m in msg_ids if m])
+
+        missing = [i for i, msg_id in enumerate(msg_ids) if msg_id not in cached]
+        self.cache_stats.hits += len(rows) - len(missing)
+        self.cache_stats.misses += len(missing)
+
+        pubdates = [cached.get(msg_id) for msg_id in msg_ids]
+        if self.list_dates:
+            for i in missing:
+                pubdates[i] = rows[i][4]
+            self.dates_from_list += sum(1 for i in missing if rows[i][4] is not None)
+            missing = [i for i in missing if rows[i][4] is None]
+
+        self.post_fetches += len(missing)
+        fetched = self._fetch_post_dates([rows[i][2] for i in missing])
+        new_dates = {}
+        for i, pubdate in zip(missing, fetched):
+            pubdates[i] = pubdate
+            if pubdate is not None and msg_ids[i]:
+                new_dates[msg_ids[i]] = pubdate
+
+        if self.date_cache is not None and new_dates:
+            self.date_cache.set_many(new_dates)
+            self.date_cache.flush()
+
+        return pubdates
+
+    def _find_message_rows(self, page: bytes) -> list[Tag]:
+        """Return the list page's message rows, parsing only those rows if possible."""
+        if self.scoped_parsing:
+            soup = self.soup(page, parse_only=self.MESSAGE_ROWS)
+            rows = soup.find_all("tr", align="left")
+            if rows:
+                return rows
+        return self.soup(page).find_all("tr", align="left")
+
+    def _parse_messages(self, page: bytes) -> tuple[tuple[Optional[str], str, str, str, str], ...]:
+        """
+        Read every message row on the list page.
+
+        :return: (msg_id, headline, link, author, date text) per message, in
+                 page order, without duplicates or rows lacking a headline;
+                 msg_id is None if the link doesn't carry one
+        """
+        messages = []
+        seen_msg_ids = set()
+
+        for row in self._find_message_rows(page):
             cells = row.find_all("td")
             if len(cells) < 4:
                 continue
@@ -166,17 +333,62 @@ class SiliconInvestorPage(BaseReader):
             author_tag = author_cell.find("a", href=re.compile(r"profile"))
             author = author_tag.get_text(strip=True) if author_tag else ""
 
-            # Fetch the actual date from the individual post page
-            pubdate = self._fetch_post_date(link)
-            if pubdate is None:
-                pubdate = fallback_timestamp
+            # Message timestamp (cell 4), e.g. "an hour ago" or "yesterday"
+            date_text = cells[3].get_text(strip=True)
 
+            messages.append((msg_id, headline, link, author, date_text))
+
+        return tuple(messages)
+
+    def get_articles(self) -> list[Article]:
+        """
+        Fetch and parse forum posts from Silicon Investor.
+
+        This method:
+        1. Fetches the forum list page
+        2. Extracts post links from the table (reusing the last parse if the
+           page is unchanged and the reader has a parse cache), skipping
+           messages at or below the forum's watermark
+        3. Looks up post dates already known to the date cache
+        4. Takes the remaining dates from the list page where they are precise
+           and don't depend on when the page was fetched (with ``list_dates``)
+        5. Fetches the remaining post pages concurrently to get accurate dates
+        """
+        page = self._fetch_content()
+        if page is None:
+            return []
+        rows = []
+        watermark = self._load_watermark()
+        marks = []
+
+        # Fallback timestamp if we can't get the real date
+        now = datetime.now(self.TIMEZONE)
+        fallback_timestamp = int(now.timestamp())
+
+        for msg_id, headline, link, author, date_text in self._parse_cached(
+            page, self._parse_messages
+        ):
+            # Skip messages already handed out by a previous run
+            if msg_id and watermark is not None:
+                if not watermark.is_new(int(msg_id), msg_id):
+                    self.skipped_seen += 1
+                    continue
+                marks.append((int(msg_id), msg_id))
+
+            listed = self._parse_list_date(date_text, now) if self.list_dates else None
+            rows.append((msg_id, headline, link, author, listed))
+
+        self._advance_watermark(watermark, marks)
+        pubdates = self._lookup_post_dates(rows)
+
+        articles = []
+        for (_, headline, link, author, _), pubdate in zip(rows, pubdates):
             article = Article(
                 publisher=self.author,
                 feed_title=self.title,
                 headline=headline,
                 link=link,
-                pubdate=pubdate,
+                pubdate=pubdate if pubdate is not None else fallback_timestamp,
                 source_type=self.source_type,
                 author=author,
             )
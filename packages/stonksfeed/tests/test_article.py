@@ -1,5 +1,10 @@
 """Tests for Article model."""
 
+import dataclasses
+import json
+
+import pytest
+
 from stonksfeed.models.article import Article
 
 
@@ -58,3 +63,76 @@ def test_article_repr():
 
     assert "This is a very long headl" in repr_str
     assert "Test Publisher" in repr_str
+
+
+def _enriched_article() -> Article:
+    return Article(
+        publisher="Test Publisher",
+        feed_title="Test Feed",
+        headline="NVDA beats estimates",
+        link="https://example.com",
+        pubdate=1234567890,
+        source_type="rss",
+        author="Test Author",
+        sentiment_score=0.42,
+        sentiment_label="positive",
+        tickers=["NVDA"],
+    )
+
+
+def test_article_is_slotted():
+    """Test that articles carry no per-instance __dict__."""
+    article = _enriched_article()
+
+    assert not hasattr(article, "__dict__")
+    with pytest.raises(AttributeError):
+        article.sentiment = 1.0
+
+
+def test_asdict_matches_dataclass_fields():
+    """Test that the hand-written encoder covers every field, like dataclasses.asdict."""
+    article = _enriched_article()
+
+    result = article.asdict()
+
+    assert result == dataclasses.asdict(article)
+    assert list(result) == [f.name for f in dataclasses.fields(Article)]
+    result["tickers"].append("AMD")
+    assert article.tickers == ["NVDA"]
+
+
+def test_to_json():
+    """Test that the JSON encoding round-trips to asdict()."""
+    article = _enriched_article()
+
+    assert json.loads(article.to_json()) == article.asdict()
+
+
+def test_to_dynamodb_item():
+    """Test the DynamoDB attribute value encoding."""
+    item = _enriched_article().to_dynamodb_item(ttl=1700000000)
+
+    assert item["headline"] == {"S": "NVDA beats estimates"}
+    assert item["pubdate"] == {"N": "1234567890"}
+    assert item["author"] == {"S": "Test Author"}
+    assert item["ttl"] == {"N": "1700000000"}
+    assert item["sentiment_score"] == {"N": "0.42"}
+    assert item["sentiment_label"] == {"S": "positive"}
+    assert item["tickers"] == {"SS": ["NVDA"]}
+
+
+def test_to_dynamodb_item_before_enrichment():
+    """Test that unset NLP fields are left out of the item."""
+    article = Article(
+        publisher="Test Publisher",
+        feed_title="Test Feed",
+        headline="Test Headline",
+        link="https://example.com",
+        pubdate=1234567890,
+        source_type="rss",
+    )
+
+    item = article.to_dynamodb_item(ttl=1700000000)
+
+    assert item["author"] == {"S": ""}
+    assert not {"sentiment_score", "sentiment_label", "tickers"} & item.keys()
@@ -0,0 +1,96 @@
+"""Tests for the columnar ArticleBatch."""
+
+import json
+
+import pytest
+
+from stonksfeed.models import Article, ArticleBatch
+
+
+def _article(i: int, **fields) -> Article:
+    defaults = {
+        "publisher": "MarketWatch" if i % 2 else "Silicon Investor",
+        "feed_title": f"Feed {i % 3}",
+        "headline": f"Headline {i}",
+        "link": f"https://example.com/{i}",
+        "pubdate": 1700000000 + i,
+        "source_type": "rss" if i % 2 else "forum",
+        "author": None if i % 4 else f"Author {i}",
+    }
+    return Article(**{**defaults, **fields})
+
+
+def _articles(n: int) -> list[Article]:
+    articles = [_article(i) for i in range(n)]
+    articles[1].sentiment_score = -0.5
+    articles[1].sentiment_label = "negative"
+    articles[1].tickers = ["NVDA", "AMD"]
+    return articles
+
+
+def test_round_trips_articles():
+    """Test that rows come back as the articles that went in."""
+    articles = _articles(6)
+
+    batch = ArticleBatch.from_articles(articles)
+
+    assert len(batch) == 6
+    assert [a.asdict() for a in batch] == [a.asdict() for a in articles]
+    assert batch.tickers(1) == ["NVDA", "AMD"]
+    assert batch.tickers(2) == []
+
+
+def test_repeated_strings_are_stored_once():
+    """Test that categorical columns share one interned table."""
+    batch = ArticleBatch.from_articles(_articles(100))
+
+    # 2 publishers, 3 feed titles, 2 source types, 1 label, 2 tickers
+    assert len(batch._strings) == 10
+    assert batch[3].publisher is batch[5].publisher
+
+
+def test_filters():
+    """Test filtering by age, source and publisher."""
+    batch = ArticleBatch.from_articles(_articles(10))
+
+    assert batch.newer_than(1700000007).pubdate.tolist() == [1700000007, 1700000008, 1700000009]
+    assert [a.source_type for a in batch.from_source("forum")] == ["forum"] * 5
+    assert [a.link for a in batch.from_publisher("MarketWatch")][:2] == [
+        "https://example.com/1",
+        "https://example.com/3",
+    ]
+    assert len(batch.from_publisher("Nobody")) == 0
+
+
+def test_select_keeps_tickers_aligned():
+    """Test that a filtered batch keeps each article's own tickers."""
+    batch = ArticleBatch.from_articles(_articles(4))
+
+    selected = batch.select([False, True, False, True])
+
+    assert [a.asdict() for a in selected] == [batch[1].asdict(), batch[3].asdict()]
+
+
+def test_set_enrichment():
+    """Test replacing the NLP columns in bulk."""
+    batch = ArticleBatch.from_articles(_articles(3))
+
+    batch.set_enrichment([0.1, None, -0.2], ["positive", None, "negative"], [["AAPL"], [], ["X"]])
+
+    assert batch[0].sentiment_score == 0.1
+    assert batch[1].sentiment_label is None
+    assert [batch.tickers(i) for i in range(3)] == [["AAPL"], [], ["X"]]
+    with pytest.raises(ValueError):
+        batch.set_enrichment([0.1], ["positive"], [[]])
+
+
+def test_bulk_serialization_matches_articles():
+    """Test that the bulk encoders agree with the per-article ones."""
+    articles = _articles(6)
+    batch = ArticleBatch.from_articles(articles)
+
+    assert batch.to_dicts() == [a.asdict() for a in articles]
+    assert json.loads(batch.to_json()) == [a.asdict() for a in articles]
+    assert batch.to_dynamodb_items(ttl=1800000000) == [
+        a.to_dynamodb_item(ttl=1800000000) for a in articles
+    ]
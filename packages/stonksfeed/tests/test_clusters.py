@@ -0,0 +1,81 @@
+"""Tests for near-duplicate headline clustering."""
+
+import pytest
+
+from stonksfeed.models import Article, ArticleBatch
+from stonksfeed.nlp.clusters import HeadlineClusterer, shingles
+
+
+def test_shingles():
+    """Test that headlines are reduced to stemmed content words and tickers."""
+    assert shingles("NVDA stock jumps 5% on earnings beat", ["NVDA"]) == {
+        "nvda",
+        "stock",
+        "jump",
+        "5",
+        "earning",
+        "beat",
+    }
+    assert shingles("Nvidia shares soar") == {"nvidia", "stock", "jump"}
+
+
+def test_reworded_headlines_share_a_cluster():
+    """Test that the same story in different words gets one cluster id."""
+    clusterer = HeadlineClusterer()
+
+    first = clusterer.assign("Nvidia shares jump 5% after earnings", "a", ["NVDA"], now=0)
+    second = clusterer.assign("NVDA stock jumps 5% on earnings beat", "b", ["NVDA"], now=1)
+    other = clusterer.assign("Fed holds rates steady as inflation cools", "c", now=2)
+
+    assert first == second
+    assert other != first
+
+
+def test_cluster_id_comes_from_first_article():
+    """Test that a new cluster's id is stable for the same article."""
+    assert HeadlineClusterer().assign("Apple unveils new iPhone", "https://a.com/1") == (
+        HeadlineClusterer().assign("Apple unveils new iPhone", "https://a.com/1")
+    )
+
+
+def test_old_headlines_leave_the_window():
+    """Test that headlines outside the window are forgotten."""
+    clusterer = HeadlineClusterer(window=3600)
+    first = clusterer.assign("Nvidia shares jump after earnings", "a", now=0)
+
+    later = clusterer.assign("Nvidia shares jump after earnings", "b", now=3601)
+
+    assert later != first
+    assert len(clusterer) == 1
+    assert all(len(bucket) == 1 for bucket in clusterer._buckets.values())
+
+
+def test_window_is_bounded():
+    """Test that at most max_items headlines are held."""
+    clusterer = HeadlineClusterer(max_items=10)
+
+    for i in range(50):
+        clusterer.assign(f"Headline number {i} about something", str(i), now=i)
+
+    assert len(clusterer) == 10
+
+
+def test_bands_must_divide_permutations():
+    """Test that an uneven banding is rejected."""
+    with pytest.raises(ValueError):
+        HeadlineClusterer(num_perm=64, bands=10)
+
+
+def test_assign_batch():
+    """Test tagging a batch, with clusters carried into its serialized form."""
+    batch = ArticleBatch.from_articles(
+        Article("Pub", "Feed", headline, f"https://a.com/{i}", 1700000000, "rss")
+        for i, headline in enumerate(
+            ["Tesla recalls 2 million cars", "Tesla recalls 2 million cars over autopilot"]
+        )
+    )
+
+    HeadlineClusterer().assign_batch(batch, now=0)
+
+    assert batch.cluster_id[0] == batch.cluster_id[1] is not None
+    assert batch.to_dynamodb_items(ttl=1)[1]["cluster_id"] == {"S": batch.cluster_id[0]}
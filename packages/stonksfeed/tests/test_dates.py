@@ -0,0 +1,66 @@
+"""Tests for fast pubdate parsing."""
+
+import pytest
+from dateutil import parser as date_parser
+
+from stonksfeed.dates import PubdateParser, parse_rfc822, parse_us_datetime
+
+SAMPLES = [
+    "Wed, 18 Nov 2020 06:00:00 GMT",
+    "Wed, 18 Nov 2020 06:00:00 +0000",
+    "Tue, 13 Jan 2026 16:45:12 -0500",
+    "13 Jan 2026 16:45 +0530",
+    "Wed, 18 Nov 2020 06:00:00",
+    "2020-11-18T06:00:00Z",
+    "2026-01-13T16:45:12-05:00",
+    "2026-01-13 16:45:12",
+    "1/16/2026 10:29:34 AM",
+    "12/1/2025 12:05:00 PM",
+    "12/1/2025 12:05:00 AM",
+]
+
+
+@pytest.mark.parametrize("text", SAMPLES)
+def test_fast_formats_match_dateutil(text):
+    """Test that the fast path agrees with dateutil on common formats."""
+    parser = PubdateParser()
+
+    assert parser.parse(text) == date_parser.parse(text)
+    assert parser.stats["dateutil"] == 0
+
+
+def test_named_rfc822_zones():
+    """Test that US zone names are honored instead of being ignored."""
+    dt = parse_rfc822("Wed, 18 Nov 2020 06:00:00 EST")
+
+    assert dt.utcoffset().total_seconds() == -5 * 3600
+
+
+def test_invalid_dates_are_misses():
+    """Test that impossible dates fall through rather than raise."""
+    assert parse_rfc822("31 Feb 2020 06:00:00 GMT") is None
+    assert parse_us_datetime("13/45/2020 10:00:00 AM") is None
+
+
+def test_last_format_is_tried_first():
+    """Test that the parser remembers the format that last matched."""
+    parser = PubdateParser()
+
+    parser.parse("1/16/2026 10:29:34 AM")
+    assert parser.last_format == "us_datetime"
+    parser.parse("1/17/2026 9:00:00 PM")
+    parser.parse("Wed, 18 Nov 2020 06:00:00 GMT")
+
+    assert parser.last_format == "rfc822"
+    assert parser.stats == {"us_datetime": 2, "rfc822": 1}
+
+
+def test_dateutil_fallback_and_failure():
+    """Test that unknown formats go to dateutil and garbage still raises."""
+    parser = PubdateParser()
+
+    assert parser.to_epoch("November 18, 2020 06:00 UTC") == 1605679200
+    with pytest.raises(ValueError):
+        parser.parse("not a date")
+
+    assert parser.stats == {"dateutil": 1, "failed": 1}
@@ -0,0 +1,119 @@
+"""Tests for cross-feed deduplication."""
+
+from unittest.mock import patch
+
+from stonksfeed.dedup import DedupIndex, identity_keys, normalize_headline, normalize_link
+from stonksfeed.models import Article, ArticleBatch
+from stonksfeed.store import MemoryStore
+
+HEADLINE = "Nvidia beats estimates as data center sales soar"
+
+
+def _batch(*rows: tuple[str, str]) -> ArticleBatch:
+    return ArticleBatch.from_articles(
+        Article("Pub", "Feed", headline, link, 1700000000, "rss") for headline, link in rows
+    )
+
+
+def test_normalize_link():
+    """Test that tracking parameters and cosmetic differences are dropped."""
+    assert (
+        normalize_link("http://WWW.Example.com/story/?utm_source=rss&b=2&a=1&fbclid=x#top")
+        == "https://example.com/story?a=1&b=2"
+    )
+    assert normalize_link("https://example.com/Story") != normalize_link(
+        "https://example.com/story"
+    )
+
+
+def test_normalize_headline():
+    """Test that case, punctuation and spacing don't change a headline."""
+    assert normalize_headline("  Nvidia Beats  Estimates — as Sales SOAR! ") == (
+        "nvidia beats estimates as sales soar"
+    )
+
+
+def test_short_headlines_are_not_keys():
+    """Test that generic headlines only identify an article by link."""
+    assert len(identity_keys("Market update", "https://a.com/1")) == 1
+    assert len(identity_keys(HEADLINE, "https://a.com/1")) == 2
+
+
+def test_syndicated_story_is_dropped():
+    """Test that the same headline under another publisher's link is a duplicate."""
+    index = DedupIndex()
+    index.add(_batch((HEADLINE, "https://marketwatch.com/story/1")))
+
+    new = index.select_new(
+        _batch(
+            (HEADLINE.upper() + "!", "https://biztoc.com/x/abc"),
+            ("Something else entirely happened today", "https://biztoc.com/x/def"),
+        )
+    )
+
+    assert new.link == ["https://biztoc.com/x/def"]
+
+
+def test_same_link_is_dropped():
+    """Test that a re-fetched link with new tracking params is a duplicate."""
+    index = DedupIndex()
+    index.add(_batch(("Old title", "https://a.com/story?utm_medium=rss")))
+
+    assert len(index.select_new(_batch(("Edited title", "https://a.com/story")))) == 0
+
+
+def test_duplicates_within_a_batch_keep_the_first():
+    """Test that only the first copy of a story in one batch is kept."""
+    new = DedupIndex().select_new(
+        _batch((HEADLINE, "https://a.com/1"), (HEADLINE, "https://b.com/2"))
+    )
+
+    assert new.link == ["https://a.com/1"]
+
+
+def test_unstored_articles_are_not_remembered():
+    """Test that selecting articles doesn't mark them seen until add()."""
+    index = DedupIndex()
+    batch = _batch((HEADLINE, "https://a.com/1"))
+
+    index.select_new(batch)
+
+    assert len(index.select_new(batch)) == 1
+
+
+def test_identities_persist_between_runs():
+    """Test that a new index finds keys flushed by a previous one."""
+    store = MemoryStore()
+    first = DedupIndex(store)
+    first.add(_batch((HEADLINE, "https://a.com/1")))
+    first.flush()
+
+    second = DedupIndex(store)
+
+    assert len(second.select_new(_batch((HEADLINE, "https://b.com/2")))) == 0
+
+
+def test_identities_expire():
+    """Test that keys older than the window no longer count."""
+    store = MemoryStore()
+    with patch("stonksfeed.dedup.time.time", return_value=1_000_000):
+        DedupIndex(store, window=3600).add(_batch((HEADLINE, "https://a.com/1")))
+
+    with patch("stonksfeed.dedup.time.time", return_value=1_000_000 + 3601):
+        assert len(DedupIndex(store, window=3600).select_new(_batch((HEADLINE, "x")))) == 1
+
+
+def test_recurring_headline_is_kept_on_a_later_day():
+    """Test that a daily headline with a new link isn't a duplicate the next day."""
+    headline = "Stocks making the biggest moves premarket"
+    store = MemoryStore()
+    with patch("stonksfeed.dedup.time.time", return_value=1_000_000):
+        DedupIndex(store).add(_batch((headline, "https://cnbc.com/2024/05/01/moves")))
+
+    later = _batch((headline, "https://cnbc.com/2024/05/02/moves"))
+    with patch("stonksfeed.dedup.time.time", return_value=1_000_000 + 3600):
+        assert len(DedupIndex(store).select_new(later)) == 0
+    with patch("stonksfeed.dedup.time.time", return_value=1_000_000 + 24 * 3600):
+        assert DedupIndex(store).select_new(later).link == later.link
+        again = _batch(("Other headline", "https://cnbc.com/2024/05/01/moves"))
+        assert len(DedupIndex(store).select_new(again)) == 0
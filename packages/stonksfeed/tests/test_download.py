@@ -0,0 +1,113 @@
+"""Tests for size-capped downloads."""
+
+import gzip
+
+import pytest
+import requests
+import responses
+
+from stonksfeed.config import MAX_RESPONSE_BYTES
+from stonksfeed.fetch import build_rss_readers
+from stonksfeed.net.download import ResponseTooLarge, read_body
+from stonksfeed.net.hosts import HostLimiter
+from stonksfeed.rss.rss_reader import RSSReader
+
+FEED_URL = "https://foo.com/feed"
+
+RSS_CONTENT = """<rss version="2.0"><channel><title>Foo</title>
+<item><title>Foo Article</title><link>https://foo.com/a</link>
+<pubDate>Wed, 18 Nov 2020 06:00:00 GMT</pubDate></item>
+</channel></rss>"""
+
+
+def _reader(**options) -> RSSReader:
+    limiter = HostLimiter(rate=1000, host_rates={})
+    return RSSReader("foo", "foo-feed", FEED_URL, limiter=limiter, **options)
+
+
+@responses.activate
+def test_body_within_limit_is_read():
+    """Test that a body under the cap is returned and kept on the response."""
+    responses.get(FEED_URL, body=b"x" * 1000)
+    response = requests.get(FEED_URL, stream=True)
+
+    assert read_body(response, max_bytes=1000) == b"x" * 1000
+    assert response.content == b"x" * 1000
+
+
+@responses.activate
+def test_declared_length_over_limit_aborts_before_reading():
+    """Test that a Content-Length over the cap fails without reading the body."""
+    responses.get(FEED_URL, body=b"x" * 1000, auto_calculate_content_length=True)
+    response = requests.get(FEED_URL, stream=True)
+
+    with pytest.raises(ResponseTooLarge, match="1000 bytes"):
+        read_body(response, max_bytes=999)
+
+
+@responses.activate
+def test_undeclared_length_over_limit_aborts():
+    """Test that a body without Content-Length is cut off once it passes the cap."""
+    responses.get(FEED_URL, body=b"x" * 200_000)
+    response = requests.get(FEED_URL, stream=True)
+
+    with pytest.raises(ResponseTooLarge):
+        read_body(response, max_bytes=100_000)
+
+
+@responses.activate
+def test_limit_applies_to_decompressed_size():
+    """Test that a small gzip body that inflates past the cap is rejected."""
+    compressed = gzip.compress(b"\0" * 1_000_000)
+    responses.get(FEED_URL, body=compressed, headers={"Content-Encoding": "gzip"})
+
+    with pytest.raises(ResponseTooLarge):
+        _reader(max_bytes=100_000).get_articles()
+    assert len(compressed) < 100_000
+
+
+@responses.activate
+def test_reader_decompresses_gzip():
+    """Test that compressed feeds are decoded while streaming."""
+    responses.get(
+        FEED_URL, body=gzip.compress(RSS_CONTENT.encode()), headers={"Content-Encoding": "gzip"}
+    )
+
+    assert _reader().get_articles()[0].headline == "Foo Article"
+
+
+@responses.activate
+def test_oversized_feed_is_not_retried():
+    """Test that a body over the cap is final, not a transient error."""
+    responses.get(FEED_URL, body=b"x" * 10_000)
+
+    with pytest.raises(ResponseTooLarge):
+        _reader(max_bytes=1000).get_articles()
+    assert len(responses.calls) == 1
+
+
+@responses.activate
+def test_reader_keeps_no_body():
+    """Test that readers don't hold on to the bytes they downloaded."""
+    responses.get(FEED_URL, body=RSS_CONTENT)
+    reader = _reader()
+
+    reader.get_articles()
+
+    assert not any(
+        isinstance(value, (bytes, bytearray)) and len(value) > 100
+        for value in vars(reader).values()
+    )
+
+
+def test_byte_cap_is_set_per_source():
+    """Test that a source's ``max_bytes`` config reaches its reader."""
+    feeds = [
+        {"publisher": "a", "feed_title": "a", "rss_url": "https://a.com/", "max_bytes": 1024},
+        {"publisher": "b", "feed_title": "b", "rss_url": "https://b.com/"},
+    ]
+
+    small, default = build_rss_readers(feeds)
+
+    assert small.max_bytes == 1024
+    assert default.max_bytes == MAX_RESPONSE_BYTES
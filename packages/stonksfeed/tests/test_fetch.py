@@ -0,0 +1,156 @@
+"""Tests for the concurrent fetch engine."""
+
+import threading
+import time
+
+from stonksfeed.config import RSS_FEEDS, SI_FORUMS
+from stonksfeed.deadline import Deadline
+from stonksfeed.fetch import build_forum_readers, build_rss_readers, commit_all, fetch_all
+from stonksfeed.models.article import Article
+from stonksfeed.rss.base import BaseReader
+
+
+class FakeReader(BaseReader):
+    """Reader that returns canned articles after an optional delay."""
+
+    def __init__(self, title: str, delay: float = 0.0, fail: bool = False):
+        super().__init__("Fake", title, f"https://example.com/{title}")
+        self.delay = delay
+        self.fail = fail
+
+    def get_articles(self) -> list[Article]:
+        time.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError(f"{self.title} is down")
+        return [
+            Article(
+                publisher=self.author,
+                feed_title=self.title,
+                headline=f"{self.title} headline",
+                link=self.url,
+                pubdate=1234567890,
+                source_type="rss",
+            )
+        ]
+
+
+def test_fetch_all_preserves_order():
+    """Test that results come back in reader order, not completion order."""
+    readers = [FakeReader("slow", delay=0.1), FakeReader("fast")]
+
+    results = fetch_all(readers)
+
+    assert [r.reader.title for r in results] == ["slow", "fast"]
+    assert results[0].articles[0].headline == "slow headline"
+
+
+def test_fetch_all_isolates_errors():
+    """Test that one failing source does not affect the others."""
+    readers = [FakeReader("a"), FakeReader("b", fail=True), FakeReader("c")]
+
+    results = fetch_all(readers)
+
+    assert [r.ok for r in results] == [True, False, True]
+    assert isinstance(results[1].error, RuntimeError)
+    assert results[1].articles == []
+    assert len(results[2].articles) == 1
+
+
+def test_fetch_all_runs_concurrently():
+    """Test that sources are fetched at the same time."""
+    readers = [FakeReader(str(i), delay=0.2) for i in range(5)]
+
+    start = time.monotonic()
+    fetch_all(readers, max_workers=5)
+
+    assert time.monotonic() - start < 0.6
+
+
+def test_fetch_all_respects_max_workers():
+    """Test that no more than max_workers sources are in flight."""
+    in_flight = 0
+    peak = 0
+    lock = threading.Lock()
+
+    class CountingReader(FakeReader):
+        def get_articles(self):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            try:
+                return super().get_articles()
+            finally:
+                with lock:
+                    in_flight -= 1
+
+    fetch_all([CountingReader(str(i), delay=0.05) for i in range(6)], max_workers=2)
+
+    assert peak == 2
+
+
+def test_build_readers_from_config():
+    """Test that readers are built for every configured source."""
+    assert len(build_rss_readers()) == len(RSS_FEEDS)
+    assert len(build_forum_readers()) == len(SI_FORUMS)
+    assert fetch_all([]) == []
+
+
+def test_fetch_all_defers_stragglers_at_deadline():
+    """Test that sources unfinished at the deadline are deferred, not waited for."""
+    readers = [FakeReader("fast"), FakeReader("slow", delay=2.0), FakeReader("queued")]
+
+    start = time.monotonic()
+    results = fetch_all(readers, max_workers=2, deadline=Deadline(0.3))
+    elapsed = time.monotonic() - start
+
+    assert elapsed < 1.0
+    assert [r.deferred for r in results] == [False, True, False]
+    assert results[0].ok
+    assert not results[1].ok
+    assert results[1].articles == []
+
+
+def test_fetch_all_cancels_queued_sources_at_deadline():
+    """Test that sources still queued at the deadline are never started."""
+    started = []
+
+    class RecordingReader(FakeReader):
+        def get_articles(self) -> list[Article]:
+            started.append(self.title)
+            return super().get_articles()
+
+    readers = [RecordingReader("slow", delay=0.5), RecordingReader("queued")]
+    results = fetch_all(readers, max_workers=1, deadline=Deadline(0.1))
+    time.sleep(0.6)
+
+    assert [r.deferred for r in results] == [True, True]
+    assert started == ["slow"]
+
+
+def test_commit_all_skips_deferred():
+    """Test that deferred sources keep their old state so they are refetched."""
+    committed = []
+
+    class CommittingReader(FakeReader):
+        def commit_state(self):
+            committed.append(self.title)
+
+    readers = [CommittingReader("done"), CommittingReader("late", delay=1.0)]
+    commit_all(fetch_all(readers, deadline=Deadline(0.2)))
+
+    assert committed == ["done"]
+
+
+def test_deadline_minus():
+    """Test that phase deadlines are carved off the end of the budget."""
+    now = [100.0]
+    deadline = Deadline(60, clock=lambda: now[0])
+    store_by = deadline.minus(5)
+
+    assert deadline.remaining() == 60
+    assert store_by.remaining() == 55
+    now[0] += 56
+    assert store_by.expired()
+    assert not deadline.expired()
+    assert store_by.remaining() == 0
@@ -0,0 +1,121 @@
+"""Tests for per-host rate limiting and Retry-After handling."""
+
+import pytest
+import requests
+import responses
+
+from stonksfeed.net.hosts import HostLimiter, parse_retry_after
+from stonksfeed.rss.rss_reader import RSSReader
+
+FEED_URL = "https://foo.com/feed"
+
+
+class FakeTime:
+    """Clock whose sleep just moves time forward."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def clock(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def _limiter(fake: FakeTime, **kwargs) -> HostLimiter:
+    return HostLimiter(clock=fake.clock, sleep=fake.sleep, host_rates={}, **kwargs)
+
+
+def test_burst_then_steady_rate():
+    """Test that a host gets ``burst`` requests at once, then ``rate`` per second."""
+    fake = FakeTime()
+    limiter = _limiter(fake, rate=2.0, burst=3)
+
+    for _ in range(7):
+        with limiter.slot("https://foo.com/a"):
+            pass
+
+    # Three requests free, then one every half second
+    assert fake.now == pytest.approx(2.0)
+    assert limiter.stats["foo.com waits"] == 4
+
+
+def test_hosts_are_limited_independently():
+    """Test that one busy host doesn't slow down another."""
+    fake = FakeTime()
+    limiter = _limiter(fake, rate=1.0, burst=1)
+
+    with limiter.slot("https://foo.com/a"):
+        pass
+    with limiter.slot("https://bar.com/a"):
+        pass
+
+    assert fake.sleeps == []
+
+
+def test_host_rate_overrides():
+    """Test that configured hosts get their own rate."""
+    fake = FakeTime()
+    limiter = HostLimiter(
+        rate=100.0, burst=1, host_rates={"slow.com": 1.0}, clock=fake.clock, sleep=fake.sleep
+    )
+
+    for _ in range(3):
+        with limiter.slot("https://slow.com/a"):
+            pass
+
+    assert fake.now == pytest.approx(2.0)
+
+
+def test_retry_after_pauses_host():
+    """Test that a 429 with Retry-After holds back the next request to that host."""
+    fake = FakeTime()
+    limiter = _limiter(fake, rate=100.0)
+    response = requests.Response()
+    response.status_code = 429
+    response.headers["Retry-After"] = "30"
+
+    limiter.observe("https://foo.com/a", response)
+    assert limiter.retry_after("https://foo.com/b") == 30
+    with limiter.slot("https://foo.com/b"):
+        pass
+
+    assert fake.now == pytest.approx(30)
+    assert limiter.retry_after("https://bar.com/") == 0
+
+
+def test_retry_after_is_capped():
+    """Test that an absurd Retry-After can't stall a host indefinitely."""
+    fake = FakeTime()
+    limiter = _limiter(fake, max_retry_after=60)
+    response = requests.Response()
+    response.status_code = 503
+    response.headers["Retry-After"] = "86400"
+
+    limiter.observe("https://foo.com/a", response)
+
+    assert limiter.retry_after("https://foo.com/a") == 60
+
+
+def test_parse_retry_after():
+    """Test both forms of the Retry-After header."""
+    assert parse_retry_after("120") == 120
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+    assert parse_retry_after("soon") is None
+
+
+@responses.activate
+def test_reader_reports_throttling():
+    """Test that readers feed throttling responses back to the limiter."""
+    fake = FakeTime()
+    limiter = _limiter(fake)
+    responses.get(FEED_URL, status=429, headers={"Retry-After": "5"})
+    reader = RSSReader("foo", "foo-feed", FEED_URL, limiter=limiter)
+
+    with pytest.raises(requests.HTTPError):
+        reader.get_articles()
+
+    assert limiter.retry_after(FEED_URL) == 5
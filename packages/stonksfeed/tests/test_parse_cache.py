@@ -0,0 +1,131 @@
+"""Tests for the content-hash parse cache."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import responses
+
+from stonksfeed.net.hosts import HostLimiter
+from stonksfeed.parse_cache import ParseCache, content_hash
+from stonksfeed.rss.rss_reader import RSSReader
+from stonksfeed.store import MemoryStore
+from stonksfeed.web.siliconinvestor import SiliconInvestorPage
+
+FEED_URL = "https://foo.com/feed"
+FORUM_URL = "https://www.siliconinvestor.com/subject.aspx?subjectid=58128"
+DATA_DIR = Path(__file__).parent / "data"
+
+RSS_CONTENT = """<rss version="2.0"><channel><title>Foo</title>
+<item><title>Foo Article</title><link>https://foo.com/a</link><guid>a</guid>
+<pubDate>Wed, 18 Nov 2020 06:00:00 GMT</pubDate></item>
+<item><title>Bar Article</title><link>https://foo.com/b</link><guid>b</guid>
+<pubDate>Wed, 18 Nov 2020 07:00:00 GMT</pubDate></item>
+</channel></rss>"""
+
+
+def _reader(cache: ParseCache, **options) -> RSSReader:
+    limiter = HostLimiter(rate=1000, host_rates={})
+    return RSSReader("foo", "foo-feed", FEED_URL, limiter=limiter, parse_cache=cache, **options)
+
+
+@responses.activate
+def test_unchanged_body_is_not_parsed_again():
+    """Test that an identical body reuses the last parse."""
+    responses.get(FEED_URL, body=RSS_CONTENT)
+    cache = ParseCache()
+    reader = _reader(cache)
+
+    first = reader.get_articles()
+    with patch.object(reader, "_parse_entries") as parse:
+        second = reader.get_articles()
+
+    parse.assert_not_called()
+    assert [a.asdict() for a in second] == [a.asdict() for a in first]
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+
+@responses.activate
+def test_cache_hits_count_pubdate_formats():
+    """Test that dates served from the cache still count in the format stats."""
+    responses.get(FEED_URL, body=RSS_CONTENT)
+    reader = _reader(ParseCache())
+
+    reader.get_articles()
+    reader.date_parser.last_format = None
+    reader.get_articles()
+
+    assert reader.date_parser.stats == {"rfc822": 4}
+    assert reader.date_parser.last_format == "rfc822"
+
+
+@responses.activate
+def test_changed_body_is_parsed():
+    """Test that a different body replaces the cached parse."""
+    responses.get(FEED_URL, body=RSS_CONTENT)
+    responses.get(FEED_URL, body=RSS_CONTENT.replace("Foo Article", "Baz Article"))
+    reader = _reader(ParseCache())
+
+    assert reader.get_articles()[0].headline == "Foo Article"
+    assert reader.get_articles()[0].headline == "Baz Article"
+
+
+@responses.activate
+def test_cached_parse_still_respects_watermark():
+    """Test that items committed by the last run are skipped on a cache hit."""
+    responses.get(FEED_URL, body=RSS_CONTENT)
+    reader = _reader(ParseCache(), watermark_store=MemoryStore())
+
+    assert len(reader.get_articles()) == 2
+    reader.commit_state()
+
+    assert reader.get_articles() == []
+    assert reader.skipped_seen == 2
+
+
+@responses.activate
+def test_cached_articles_are_fresh_objects():
+    """Test that enriching returned articles can't change what the cache hands out."""
+    responses.get(FEED_URL, body=RSS_CONTENT)
+    reader = _reader(ParseCache())
+
+    reader.get_articles()[0].sentiment_score = 0.9
+
+    assert reader.get_articles()[0].sentiment_score is None
+
+
+def test_least_recently_used_url_is_evicted():
+    """Test that the cache holds at most max_urls URLs, dropping the stalest."""
+    cache = ParseCache(max_urls=2)
+    digest = content_hash(b"body")
+    cache.put("a", digest, ("a",))
+    cache.put("b", digest, ("b",))
+    assert cache.get("a", digest) == ("a",)
+
+    cache.put("c", digest, ("c",))
+
+    assert len(cache) == 2
+    assert cache.get("b", digest) is None
+    assert cache.get("a", digest) == ("a",)
+    assert cache.get("a", content_hash(b"other body")) is None
+
+
+def test_forum_page_parse_is_cached():
+    """Test that an unchanged forum list page isn't parsed again."""
+    page = SiliconInvestorPage(
+        title="AMD",
+        url=FORUM_URL,
+        parse_cache=ParseCache(),
+        list_dates=False,
+        limiter=HostLimiter(rate=1000, host_rates={}),
+    )
+
+    with responses.RequestsMock() as mock:
+        mock.get(FORUM_URL, body=(DATA_DIR / "siliconinvestor.html").read_bytes())
+        with patch.object(page, "_fetch_post_date", return_value=1700000000):
+            first = page.get_articles()
+            with patch.object(page, "_find_message_rows") as find_rows:
+                second = page.get_articles()
+
+    find_rows.assert_not_called()
+    assert len(second) == 25
+    assert [a.asdict() for a in second] == [a.asdict() for a in first]
@@ -0,0 +1,139 @@
+"""Tests for the HTML parser backends."""
+
+import warnings
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import responses
+from bs4 import XMLParsedAsHTMLWarning
+
+from stonksfeed.config import HTML_PARSER
+from stonksfeed.fetch import build_forum_readers, build_rss_readers
+from stonksfeed.net.hosts import HostLimiter
+from stonksfeed.parsers import BACKENDS, ParserBackend, available_backends, get_backend
+from stonksfeed.rss.rss_reader import RSSReader
+from stonksfeed.web.siliconinvestor import SiliconInvestorPage
+
+DATA_DIR = Path(__file__).parent / "data"
+FORUM_URL = "https://www.siliconinvestor.com/subject.aspx?subjectid=58128"
+
+# Things HTML parsers disagree on: CDATA, <link> as a void element, tag case
+RSS_CONTENT = """<?xml version="1.0"?>
+<rss version="2.0">
+<channel>
+    <title>Foo Feed</title>
+    <item>
+        <title><![CDATA[Stocks rally & bonds slip]]></title>
+        <link>https://foo.com/a</link>
+        <guid isPermaLink="false">a</guid>
+        <description><![CDATA[<p>Body with <b>markup</b></p>]]></description>
+        <pubDate>Wed, 18 Nov 2020 06:00:00 GMT</pubDate>
+    </item>
+    <item>
+        <title>Second story</title>
+        <link>https://foo.com/b</link>
+        <author>John Roe</author>
+        <pubDate>Wed, 18 Nov 2020 07:30:00 +0000</pubDate>
+    </item>
+    <item>
+        <title>Undated story</title>
+        <link>https://foo.com/c</link>
+    </item>
+</channel>
+</rss>
+"""
+
+# Every installed backend is checked against html.parser's output
+BACKEND_NAMES = [pytest.param(name, id=name) for name in available_backends()]
+
+
+@pytest.fixture(autouse=True)
+def quiet_xml_warning():
+    """Parsing RSS with an HTML parser is what the soup fallback does on purpose."""
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", XMLParsedAsHTMLWarning)
+        yield
+
+
+def _rss_articles(parser_type: str) -> list[dict]:
+    reader = RSSReader("foo", "foo-feed", "https://foo.com/feed", parser_type=parser_type)
+    entries = reader._soup_entries(RSS_CONTENT.encode())
+    return [a.asdict() for a in reader._build_articles(entries)[0]]
+
+
+def _si_articles(parser_type: str, scoped: bool) -> list[dict]:
+    page = SiliconInvestorPage(
+        title="AMD",
+        url=FORUM_URL,
+        parser_type=parser_type,
+        scoped_parsing=scoped,
+        list_dates=False,
+        limiter=HostLimiter(rate=1000, host_rates={}),
+    )
+    with responses.RequestsMock() as mock:
+        mock.get(FORUM_URL, body=(DATA_DIR / "siliconinvestor.html").read_bytes())
+        with patch.object(page, "_fetch_post_date", return_value=1700000000):
+            return [a.asdict() for a in page.get_articles()]
+
+
+@pytest.mark.parametrize("parser_type", BACKEND_NAMES)
+def test_rss_output_matches_across_backends(parser_type):
+    """Test that the RSS soup parser builds the same articles with every backend."""
+    articles = _rss_articles(parser_type)
+
+    assert get_backend(parser_type).name == parser_type
+    assert articles == _rss_articles("html.parser")
+    assert articles[0]["headline"] == "Stocks rally & bonds slip"
+    assert [a["pubdate"] for a in articles] == [1605679200, 1605684600, 0]
+
+
+@pytest.mark.parametrize("parser_type", BACKEND_NAMES)
+@pytest.mark.parametrize("scoped", [True, False], ids=["scoped", "full"])
+def test_si_output_matches_across_backends(parser_type, scoped):
+    """Test that forum pages give the same articles with every backend."""
+    articles = _si_articles(parser_type, scoped)
+
+    assert len(articles) == 25
+    assert articles == _si_articles("html.parser", scoped=True)
+
+
+@pytest.mark.parametrize("parser_type", BACKEND_NAMES)
+def test_post_date_matches_across_backends(parser_type):
+    """Test that every backend finds the same date on a post page."""
+    page = SiliconInvestorPage(title="AMD", url=FORUM_URL, parser_type=parser_type)
+    content = (DATA_DIR / "siliconinvestor_post.html").read_bytes()
+
+    assert page._extract_post_date(content) == 1709338375
+
+
+def test_unknown_backend_is_rejected():
+    """Test that a typo in config fails loudly instead of parsing with a default."""
+    with pytest.raises(ValueError, match="Unknown parser backend"):
+        RSSReader("foo", "foo-feed", "https://foo.com/feed", parser_type="lxm")
+
+
+def test_missing_backend_falls_back_to_html_parser():
+    """Test that a configured backend that isn't installed degrades to html.parser."""
+    missing = ParserBackend("lxml", BACKENDS["lxml"].build, requires="no_such_module")
+    with patch.dict(BACKENDS, {"lxml": missing}):
+        reader = RSSReader("foo", "foo-feed", "https://foo.com/feed", parser_type="lxml")
+
+    assert reader.parser == "html.parser"
+
+
+def test_parser_is_chosen_per_source():
+    """Test that a source's ``parser`` config key reaches its reader."""
+    feeds = [
+        {"publisher": "a", "feed_title": "a", "rss_url": "https://a.com/", "parser": "html.parser"},
+        {"publisher": "b", "feed_title": "b", "rss_url": "https://b.com/"},
+    ]
+    forums = [{"title": "c", "url": FORUM_URL, "parser": "html.parser"}]
+
+    readers = build_rss_readers(feeds) + build_forum_readers(forums)
+    forced = build_rss_readers(feeds, parser_type="html.parser")
+
+    assert readers[0].parser == "html.parser"
+    assert readers[1].backend == get_backend(HTML_PARSER)
+    assert readers[2].parser == "html.parser"
+    assert all(r.parser == "html.parser" for r in forced)
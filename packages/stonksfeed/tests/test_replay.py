@@ -0,0 +1,83 @@
+"""Tests for the record/replay HTTP transport."""
+
+import time
+from functools import partial
+
+import pytest
+import requests
+import responses
+
+from stonksfeed.net.replay import Corpus, RecordedResponse, RecordingAdapter, ReplayAdapter
+from stonksfeed.net.session import SessionManager
+from stonksfeed.rss.rss_reader import RSSReader
+from stonksfeed.store import MemoryStore
+
+FEED_URL = "https://foo.com/feed"
+
+RSS_CONTENT = b"""<rss version="2.0"><channel><title>Foo</title>
+<item><title>Foo Article</title><link>https://foo.com/a</link>
+<pubDate>Wed, 18 Nov 2020 06:00:00 GMT</pubDate></item>
+</channel></rss>"""
+
+
+def _session(adapter_factory) -> requests.Session:
+    return SessionManager(adapter_factory=adapter_factory).session
+
+
+@responses.activate
+def test_record_then_replay_offline(tmp_path):
+    """Test that a recorded fetch replays to the same articles without the network."""
+    responses.get(FEED_URL, body=RSS_CONTENT, headers={"ETag": '"v1"'})
+    corpus = Corpus(tmp_path)
+    recorder = RSSReader(
+        "foo", "foo-feed", FEED_URL, session=_session(partial(RecordingAdapter, corpus))
+    )
+    recorded = [a.asdict() for a in recorder.get_articles()]
+    responses.reset()
+
+    replayer = RSSReader(
+        "foo", "foo-feed", FEED_URL, session=_session(partial(ReplayAdapter, corpus))
+    )
+    replayed = [a.asdict() for a in replayer.get_articles()]
+
+    assert replayed == recorded
+    assert corpus.urls() == [FEED_URL]
+    assert corpus.load("GET", FEED_URL).headers["ETag"] == '"v1"'
+
+
+def test_replay_answers_conditional_get(tmp_path):
+    """Test that replay honours validators, so conditional GET can be benchmarked."""
+    corpus = Corpus(tmp_path)
+    corpus.save("GET", RecordedResponse(FEED_URL, 200, {"ETag": '"v1"'}, RSS_CONTENT))
+    session = _session(partial(ReplayAdapter, corpus))
+    reader = RSSReader("foo", "foo-feed", FEED_URL, validator_store=MemoryStore(), session=session)
+
+    assert len(reader.get_articles()) == 1
+    reader.commit_state()
+
+    assert reader.get_articles() == []
+    assert reader.not_modified
+
+
+def test_replay_missing_request_fails(tmp_path):
+    """Test that requests absent from the corpus fail like a network error."""
+    session = _session(partial(ReplayAdapter, Corpus(tmp_path)))
+
+    with pytest.raises(requests.ConnectionError):
+        session.get(FEED_URL)
+
+
+def test_replay_synthetic_latency_and_bandwidth(tmp_path):
+    """Test that responses are delayed by latency plus size over bandwidth."""
+    corpus = Corpus(tmp_path)
+    corpus.save("GET", RecordedResponse(FEED_URL, 200, {}, b"x" * 10_000))
+    session = _session(partial(ReplayAdapter, corpus, latency=0.05, bandwidth=100_000))
+
+    start = time.monotonic()
+    response = session.get(FEED_URL)
+    elapsed = time.monotonic() - start
+
+    assert response.content == b"x" * 10_000
+    assert 0.15 <= elapsed < 0.5
+    adapter = session.get_adapter(FEED_URL)
+    assert (adapter.requests, adapter.bytes_sent) == (1, 10_000)
@@ -0,0 +1,187 @@
+"""Tests for retries, hedged requests and latency histograms."""
+
+import random
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+import requests
+import responses
+
+from stonksfeed.net.hosts import HostLimiter
+from stonksfeed.net.latency import LatencyHistogram, LatencyTracker
+from stonksfeed.net.retry import HedgePolicy, Hedger, RetryPolicy
+from stonksfeed.rss.rss_reader import RSSReader
+from stonksfeed.store import MemoryStore
+
+FEED_URL = "https://foo.com/feed"
+
+RSS_CONTENT = """<rss version="2.0"><channel><title>Foo</title>
+<item><title>Foo Article</title><link>https://foo.com/a</link>
+<pubDate>Wed, 18 Nov 2020 06:00:00 GMT</pubDate></item>
+</channel></rss>"""
+
+
+def _reader(**options) -> RSSReader:
+    limiter = HostLimiter(rate=1000, host_rates={})
+    return RSSReader("foo", "foo-feed", FEED_URL, limiter=limiter, **options)
+
+
+def _retry_policy(sleeps: list) -> RetryPolicy:
+    return RetryPolicy(attempts=3, rng=random.Random(1), sleep=sleeps.append)
+
+
+@responses.activate
+def test_retries_transient_errors():
+    """Test that 5xx responses and connection errors are retried with backoff."""
+    responses.get(FEED_URL, status=503)
+    responses.get(FEED_URL, body=requests.ConnectionError("reset"))
+    responses.get(FEED_URL, body=RSS_CONTENT)
+    sleeps = []
+    reader = _reader(retry=_retry_policy(sleeps))
+
+    articles = reader.get_articles()
+
+    assert len(articles) == 1
+    assert reader.retries == 2
+    assert len(sleeps) == 2
+    assert 0 <= sleeps[0] <= 0.5
+    assert 0 <= sleeps[1] <= 1.0
+
+
+@responses.activate
+def test_gives_up_after_attempts():
+    """Test that the last failure is surfaced once attempts run out."""
+    responses.get(FEED_URL, status=502)
+    reader = _reader(retry=_retry_policy([]))
+
+    with pytest.raises(requests.HTTPError):
+        reader.get_articles()
+
+    assert len(responses.calls) == 3
+
+
+@responses.activate
+def test_client_errors_are_not_retried():
+    """Test that a 404 is final."""
+    responses.get(FEED_URL, status=404)
+    reader = _reader(retry=_retry_policy([]))
+
+    with pytest.raises(requests.HTTPError):
+        reader.get_articles()
+
+    assert len(responses.calls) == 1
+
+
+@responses.activate
+def test_no_retries_by_default():
+    """Test that retrying is opt-in."""
+    responses.get(FEED_URL, status=503)
+
+    with pytest.raises(requests.HTTPError):
+        _reader().get_articles()
+
+    assert len(responses.calls) == 1
+
+
+def test_backoff_is_exponential_with_jitter():
+    """Test that waits are random but bounded by the doubling cap."""
+    sleeps = []
+    policy = RetryPolicy(base_delay=1.0, max_delay=5.0, rng=random.Random(7), sleep=sleeps.append)
+
+    for attempt in range(6):
+        policy.backoff(attempt)
+
+    caps = [1.0, 2.0, 4.0, 5.0, 5.0, 5.0]
+    assert all(0 <= s <= cap for s, cap in zip(sleeps, caps))
+    assert len(set(sleeps)) == 6
+    assert policy.backoff(0, at_least=30.0) == 30.0
+
+
+def test_histogram_quantiles():
+    """Test that quantiles come from the log-scale buckets."""
+    histogram = LatencyHistogram()
+    for _ in range(95):
+        histogram.record(0.1)
+    for _ in range(5):
+        histogram.record(2.0)
+
+    assert 0.1 <= histogram.quantile(0.95) < 0.125
+    assert 2.0 <= histogram.quantile(0.99) < 2.5
+    assert LatencyHistogram().quantile(0.95) is None
+
+
+def test_histogram_decays():
+    """Test that old observations are halved away."""
+    histogram = LatencyHistogram(max_count=100)
+    for _ in range(99):
+        histogram.record(5.0)
+    for _ in range(60):
+        histogram.record(0.05)
+
+    assert histogram.quantile(0.5) < 0.1
+
+
+def test_latency_tracker_persists():
+    """Test that histograms round-trip through a store."""
+    store = MemoryStore()
+    tracker = LatencyTracker(store)
+    tracker.record(FEED_URL, 0.2)
+    tracker.flush()
+
+    reloaded = LatencyTracker(store)
+    assert reloaded.quantile(FEED_URL, 0.95) == tracker.quantile(FEED_URL, 0.95)
+    assert reloaded.quantile(FEED_URL, 0.95, min_samples=2) is None
+
+
+@responses.activate
+def test_slow_request_is_hedged():
+    """Test that a request slower than the feed's p95 is raced by a duplicate."""
+    calls = 0
+    lock = threading.Lock()
+
+    def first_call_stalls(request):
+        nonlocal calls
+        with lock:
+            calls += 1
+            n = calls
+        if n == 1:
+            time.sleep(1.0)
+        return 200, {}, RSS_CONTENT
+
+    responses.add_callback(responses.GET, FEED_URL, callback=first_call_stalls)
+    tracker = LatencyTracker()
+    for _ in range(20):
+        tracker.record(FEED_URL, 0.05)
+    hedger = Hedger(max_workers=4)
+    reader = _reader(hedge=HedgePolicy(min_delay=0.1), latency=tracker)
+
+    start = time.monotonic()
+    with patch("stonksfeed.rss.base.hedger", hedger):
+        articles = reader.get_articles()
+    elapsed = time.monotonic() - start
+
+    assert len(articles) == 1
+    assert elapsed < 0.8
+    assert (hedger.hedges, hedger.hedge_wins) == (1, 1)
+
+
+def test_hedger_skips_fast_requests():
+    """Test that requests finishing within the threshold are not duplicated."""
+    hedger = Hedger(max_workers=2)
+    calls = []
+
+    result = hedger.run(lambda: calls.append(1) or "ok", after=1.0)
+
+    assert result == "ok"
+    assert calls == [1]
+    assert hedger.hedges == 0
+
+
+def test_no_hedging_without_history():
+    """Test that feeds without enough latency samples are never hedged."""
+    tracker = LatencyTracker()
+    tracker.record(FEED_URL, 0.05)
+
+    assert tracker.quantile(FEED_URL, 0.95, min_samples=20) is None
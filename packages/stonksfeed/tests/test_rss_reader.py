@@ -0,0 +1,207 @@
+"""Tests for the RSS reader."""
+
+from unittest.mock import patch
+
+import responses
+
+from stonksfeed.models.article import Article
+from stonksfeed.rss.rss_reader import RSSReader
+from stonksfeed.rss.streaming import iter_feed_items
+from stonksfeed.store import MemoryStore
+
+FEED_URL = "https://foo.com/feed"
+
+RSS_CONTENT = """
+<rss version="2.0">
+<channel>
+    <title>Foo Feed</title>
+    <item>
+    <title>Foo Article</title>
+    <link>https://foo.com/article</link>
+    <author>Jane Doe</author>
+    <pubDate>Wed, 18 Nov 2020 06:00:00 GMT</pubDate>
+    </item>
+</channel>
+</rss>
+"""
+
+
+@responses.activate
+def test_rss_reader_parses_items():
+    """Test that feed items become Articles."""
+    responses.get(FEED_URL, body=RSS_CONTENT)
+    reader = RSSReader(publisher="foo", feed_title="foo-feed", rss_url=FEED_URL)
+
+    articles = reader.get_articles()
+
+    assert isinstance(articles[0], Article)
+    article = articles[0].asdict()
+    assert article["headline"] == "Foo Article"
+    assert article["link"] == "https://foo.com/article"
+    assert article["author"] == "Jane Doe"
+    assert article["pubdate"] == 1605679200
+    assert article["source_type"] == "rss"
+    assert article["feed_title"] == "foo-feed"
+
+
+@responses.activate
+def test_conditional_get_after_commit():
+    """Test that committed validators are sent and a 304 skips parsing."""
+    store = MemoryStore()
+    reader = RSSReader(
+        publisher="foo", feed_title="foo-feed", rss_url=FEED_URL, validator_store=store
+    )
+    responses.get(
+        FEED_URL,
+        body=RSS_CONTENT,
+        headers={"ETag": '"abc"', "Last-Modified": "Wed, 18 Nov 2020 06:00:00 GMT"},
+    )
+
+    assert len(reader.get_articles()) == 1
+    assert "If-None-Match" not in responses.calls[0].request.headers
+    reader.commit_state()
+
+    responses.replace(responses.GET, FEED_URL, status=304)
+    with patch.object(reader, "soup") as soup_mock:
+        assert reader.get_articles() == []
+        soup_mock.assert_not_called()
+
+    request = responses.calls[1].request
+    assert request.headers["If-None-Match"] == '"abc"'
+    assert request.headers["If-Modified-Since"] == "Wed, 18 Nov 2020 06:00:00 GMT"
+    assert reader.not_modified
+
+
+@responses.activate
+def test_validators_not_stored_without_commit():
+    """Test that an uncommitted fetch is retried in full next time."""
+    store = MemoryStore()
+    reader = RSSReader(
+        publisher="foo", feed_title="foo-feed", rss_url=FEED_URL, validator_store=store
+    )
+    responses.get(FEED_URL, body=RSS_CONTENT, headers={"ETag": '"abc"'})
+
+    reader.get_articles()
+    reader.get_articles()
+
+    assert store.get(FEED_URL) is None
+    assert "If-None-Match" not in responses.calls[1].request.headers
+
+
+MULTI_ITEM_RSS = """<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0" xmlns:media="http://search.yahoo.com/mrss/">
+<channel>
+    <title>Foo Feed</title>
+    <link>https://foo.com</link>
+    <item>
+        <title><![CDATA[Stocks rally & bonds slip]]></title>
+        <link>https://foo.com/a</link>
+        <media:title>Not the headline</media:title>
+        <guid>a</guid>
+        <pubDate>Wed, 18 Nov 2020 06:00:00 GMT</pubDate>
+    </item>
+    <item>
+        <title>Second story</title>
+        <link>https://foo.com/b</link>
+        <author>John Roe</author>
+        <pubDate>Wed, 18 Nov 2020 07:30:00 +0000</pubDate>
+    </item>
+    <item>
+        <title>Undated story</title>
+        <link>https://foo.com/c</link>
+    </item>
+</channel>
+</rss>
+"""
+
+ATOM_FEED = """<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+    <title>Atom Feed</title>
+    <entry>
+        <title>Atom story</title>
+        <link rel="self" href="https://foo.com/self"/>
+        <link href="https://foo.com/atom"/>
+        <author><name>Ann Writer</name></author>
+        <id>urn:1</id>
+        <published>2020-11-18T06:00:00Z</published>
+        <updated>2020-11-19T06:00:00Z</updated>
+    </entry>
+</feed>
+"""
+
+
+def test_streaming_matches_soup_parser():
+    """Test that the streaming parser produces the same articles as BeautifulSoup."""
+    reader = RSSReader(publisher="foo", feed_title="foo-feed", rss_url=FEED_URL)
+    content = MULTI_ITEM_RSS.encode()
+
+    assert reader._streaming_entries(content) == reader._soup_entries(content)
+
+    streamed = [a.asdict() for a in reader._build_articles(reader._parse_entries(content)[0])[0]]
+    assert streamed[0]["headline"] == "Stocks rally & bonds slip"
+    assert streamed[1]["pubdate"] == 1605684600
+    assert streamed[2]["pubdate"] == 0
+
+
+def test_iter_feed_items_reads_atom():
+    """Test that Atom entries are parsed, preferring the alternate link."""
+    items = list(iter_feed_items(ATOM_FEED.encode()))
+
+    assert len(items) == 1
+    assert items[0].title == "Atom story"
+    assert items[0].link == "https://foo.com/atom"
+    assert items[0].author == "Ann Writer"
+    assert items[0].pubdate == "2020-11-18T06:00:00Z"
+    assert items[0].guid == "urn:1"
+
+
+def test_iter_feed_items_accepts_chunks():
+    """Test that items split across chunk boundaries are parsed correctly."""
+    content = MULTI_ITEM_RSS.encode()
+    chunks = [content[i : i + 7] for i in range(0, len(content), 7)]
+
+    assert [i.title for i in iter_feed_items(chunks)] == [
+        "Stocks rally & bonds slip",
+        "Second story",
+        "Undated story",
+    ]
+
+
+@responses.activate
+def test_malformed_feed_falls_back_to_soup():
+    """Test that feeds that aren't well-formed XML still parse."""
+    malformed = RSS_CONTENT.replace("Foo Article", "Foo&nbsp;Article <br>")
+    responses.get(FEED_URL, body=malformed)
+    reader = RSSReader(publisher="foo", feed_title="foo-feed", rss_url=FEED_URL)
+
+    articles = reader.get_articles()
+
+    assert len(articles) == 1
+    assert articles[0].link == "https://foo.com/article"
+
+
+@responses.activate
+def test_watermark_skips_seen_items():
+    """Test that items seen by a committed run are not materialized again."""
+    store = MemoryStore()
+    reader = RSSReader(
+        publisher="foo", feed_title="foo-feed", rss_url=FEED_URL, watermark_store=store
+    )
+    responses.get(FEED_URL, body=MULTI_ITEM_RSS)
+
+    assert len(reader.get_articles()) == 3
+    reader.commit_state()
+
+    newer = MULTI_ITEM_RSS.replace(
+        "<item>",
+        "<item><title>Breaking</title><link>https://foo.com/d</link>"
+        "<pubDate>Wed, 18 Nov 2020 08:00:00 GMT</pubDate></item><item>",
+        1,
+    )
+    responses.replace(responses.GET, FEED_URL, body=newer)
+    with patch("stonksfeed.rss.rss_reader.Article", wraps=Article) as article_cls:
+        articles = reader.get_articles()
+
+    assert [a.headline for a in articles] == ["Breaking"]
+    assert article_cls.call_count == 1
+    assert reader.skipped_seen == 3
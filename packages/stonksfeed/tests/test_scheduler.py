@@ -0,0 +1,150 @@
+"""Tests for the adaptive polling scheduler."""
+
+from stonksfeed.fetch import FetchResult
+from stonksfeed.models.article import Article
+from stonksfeed.rss.base import BaseReader
+from stonksfeed.scheduler import AdaptiveScheduler
+from stonksfeed.store import MemoryStore
+
+MINUTE = 60
+TICK = 15 * MINUTE
+
+
+class FakeClock:
+    """Clock that only moves when told to."""
+
+    def __init__(self, now: float = 1_700_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+def _reader(title: str) -> BaseReader:
+    return BaseReader("Fake", title, f"https://example.com/{title}")
+
+
+def _result(reader: BaseReader, new_items: int = 0, error: Exception = None) -> FetchResult:
+    articles = [
+        Article(
+            publisher="Fake",
+            feed_title=reader.title,
+            headline=f"{reader.title} {i}",
+            link=f"{reader.url}/{i}",
+            pubdate=0,
+            source_type="rss",
+        )
+        for i in range(new_items)
+    ]
+    return FetchResult(reader=reader, articles=articles, error=error)
+
+
+def _scheduler(clock: FakeClock) -> AdaptiveScheduler:
+    return AdaptiveScheduler(
+        MemoryStore(),
+        clock=clock,
+        tick=TICK,
+        initial_interval=60 * MINUTE,
+        max_interval=360 * MINUTE,
+    )
+
+
+def test_unknown_sources_are_due():
+    """Test that sources with no history are fetched on the first tick."""
+    scheduler = _scheduler(FakeClock())
+    readers = [_reader("a"), _reader("b")]
+
+    assert scheduler.due(readers) == readers
+
+
+def test_busy_feed_polled_every_tick_quiet_feed_backs_off():
+    """Test that intervals follow each feed's observed rate of new items."""
+    clock = FakeClock()
+    scheduler = _scheduler(clock)
+    busy, quiet = _reader("busy"), _reader("quiet")
+    scheduler.record([_result(busy, 5), _result(quiet, 5)])
+
+    fetched = {"busy": 0, "quiet": 0}
+    last_busy_fetch = clock.now
+    for _ in range(4 * 24):  # one day of ticks
+        clock.advance(TICK)
+        due = scheduler.due([busy, quiet])
+        for reader in due:
+            fetched[reader.title] += 1
+        # The busy feed publishes every 5 minutes, the quiet one never
+        busy_items = int((clock.now - last_busy_fetch) // (5 * MINUTE))
+        scheduler.record(_result(r, busy_items if r is busy else 0) for r in due)
+        if busy in due:
+            last_busy_fetch = clock.now
+
+    # Only the first hour is spent on the initial interval
+    assert fetched["busy"] >= 96 - 4
+    assert fetched["quiet"] <= 8
+    states = {s["title"]: s for s in scheduler.snapshot([busy, quiet])}
+    assert states["busy"]["interval"] == TICK
+    assert states["quiet"]["interval"] == 360 * MINUTE
+
+
+def test_interval_converges_to_update_rate():
+    """Test that a feed publishing hourly settles near an hourly interval."""
+    clock = FakeClock()
+    scheduler = _scheduler(clock)
+    reader = _reader("hourly")
+    scheduler.record([_result(reader, 1)])
+
+    last_fetch = clock.now
+    for _ in range(4 * 48):
+        clock.advance(TICK)
+        if scheduler.due([reader]):
+            published = int((clock.now - last_fetch) // (60 * MINUTE))
+            scheduler.record([_result(reader, published)])
+            last_fetch = clock.now if published else last_fetch
+
+    interval = scheduler.snapshot([reader])[0]["interval"]
+    assert 45 * MINUTE <= interval <= 2 * 60 * MINUTE
+
+
+def test_failed_fetch_is_retried_next_tick():
+    """Test that an error doesn't push a source's next fetch out."""
+    clock = FakeClock()
+    scheduler = _scheduler(clock)
+    reader = _reader("flaky")
+    scheduler.record([_result(reader, 1)])
+    clock.advance(60 * MINUTE)
+    scheduler.record([_result(reader, error=RuntimeError("down"))])
+
+    clock.advance(TICK)
+    assert scheduler.due([reader]) == [reader]
+    state = scheduler.snapshot([reader])[0]
+    assert state["errors"] == 1
+    assert state["interval"] == 60 * MINUTE
+
+
+def test_due_orders_most_overdue_first():
+    """Test that the longest-waiting sources come first."""
+    clock = FakeClock()
+    scheduler = _scheduler(clock)
+    a, b = _reader("a"), _reader("b")
+    scheduler.record([_result(b, 1)])
+    clock.advance(TICK)
+    scheduler.record([_result(a, 1)])
+    clock.advance(2 * 60 * MINUTE)
+
+    assert scheduler.due([a, b]) == [b, a]
+
+
+def test_deferred_source_goes_first_next_run():
+    """Test that a source cut off by the deadline is due at once, ahead of others."""
+    clock = FakeClock()
+    scheduler = _scheduler(clock)
+    a, b = _reader("a"), _reader("b")
+    scheduler.record([_result(a, 1), _result(b, 1)])
+    clock.advance(2 * 60 * MINUTE)
+    scheduler.record([_result(a, 1), FetchResult(reader=b, deferred=True)])
+
+    clock.advance(TICK)
+    assert scheduler.due([a, b]) == [b]
+    assert scheduler.snapshot([b])[0]["fetches"] == 1
@@ -0,0 +1,101 @@
+"""Tests for batched sentiment scoring."""
+
+from unittest.mock import patch
+
+from stonksfeed.models import Article, ArticleBatch
+from stonksfeed.nlp import SentimentAnalyzer, TickerExtractor, enrich_batch
+from stonksfeed.nlp.sentiment import compile_lexicon
+
+GOOD = "Nvidia beats estimates as profits soar"
+BAD = "Tesla shares crash after terrible recall"
+
+
+def test_analyze_many_matches_analyze():
+    """Test that batched results are the same as scoring one at a time."""
+    analyzer = SentimentAnalyzer()
+
+    results = analyzer.analyze_many([GOOD, BAD, "Fed meets on Tuesday"])
+
+    assert results == [analyzer.analyze(t) for t in [GOOD, BAD, "Fed meets on Tuesday"]]
+    assert [r["label"] for r in results] == ["bullish", "bearish", "neutral"]
+
+
+def test_repeats_are_scored_once():
+    """Test that duplicates within and across calls don't reach VADER again."""
+    analyzer = SentimentAnalyzer()
+
+    with patch.object(analyzer, "analyze", wraps=analyzer.analyze) as analyze:
+        analyzer.analyze_many([GOOD, BAD, GOOD, f"  {GOOD} "])
+        analyzer.analyze_many([BAD])
+
+    assert analyze.call_count == 2
+    assert (analyzer.stats.hits, analyzer.stats.misses) == (3, 2)
+    assert analyzer.scored == 2
+    assert analyzer.throughput > 0
+
+
+def test_case_is_part_of_the_key():
+    """Test that texts VADER scores differently aren't merged."""
+    analyzer = SentimentAnalyzer()
+
+    quiet, loud = analyzer.analyze_many(["stocks are good", "stocks are GOOD!!!"])
+
+    assert loud["score"] > quiet["score"]
+
+
+def test_cache_is_bounded():
+    """Test that the least recently used texts are evicted."""
+    analyzer = SentimentAnalyzer(cache_size=2)
+
+    analyzer.analyze_many(["one", "two", "three"])
+    analyzer.analyze_many(["one"])
+
+    assert list(analyzer._cache) == ["three", "one"]
+    assert analyzer.stats.hits == 0
+
+
+def test_vader_is_loaded_on_first_use(tmp_path):
+    """Test that creating an analyzer doesn't load VADER."""
+    analyzer = SentimentAnalyzer(lexicon=tmp_path / "missing.bin")
+
+    assert analyzer._vader is None
+    assert analyzer.analyze(GOOD)["label"] == "bullish"
+    assert analyzer._vader is not None
+
+
+def test_compiled_lexicon_skips_parsing(tmp_path):
+    """Test that a compiled lexicon scores the same without parsing VADER's text files."""
+    compiled = compile_lexicon(tmp_path / "vader_lexicon.bin")
+    analyzer = SentimentAnalyzer(lexicon=compiled)
+
+    with patch(
+        "vaderSentiment.vaderSentiment.SentimentIntensityAnalyzer.make_lex_dict"
+    ) as make_lex_dict:
+        results = analyzer.analyze_many([GOOD, BAD, "stocks are GOOD!!! :)"])
+
+    make_lex_dict.assert_not_called()
+    assert results == SentimentAnalyzer(lexicon=None).analyze_many(
+        [GOOD, BAD, "stocks are GOOD!!! :)"]
+    )
+
+
+def test_corrupt_lexicon_is_ignored(tmp_path):
+    """Test that an unreadable compiled lexicon falls back to the text files."""
+    compiled = tmp_path / "vader_lexicon.bin"
+    compiled.write_bytes(b"garbage")
+
+    assert SentimentAnalyzer(lexicon=compiled).analyze(BAD)["label"] == "bearish"
+
+
+def test_enrich_batch(tmp_path):
+    """Test that a batch gets sentiment and tickers for every headline."""
+    batch = ArticleBatch.from_articles(
+        Article("Pub", "Feed", headline, f"https://a.com/{i}", 1700000000, "rss")
+        for i, headline in enumerate([GOOD + " for NVDA", BAD])
+    )
+
+    enrich_batch(batch, SentimentAnalyzer(), TickerExtractor(cache_dir=tmp_path))
+
+    assert batch[0].sentiment_label == "bullish"
+    assert batch[0].tickers == ["NVDA"]
+    assert batch[1].sentiment_label == "bearish"
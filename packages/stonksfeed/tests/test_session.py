@@ -0,0 +1,48 @@
+"""Tests for the shared HTTP session layer."""
+
+import responses
+
+from stonksfeed.net.session import SessionManager, get_session
+from stonksfeed.rss.rss_reader import RSSReader
+from stonksfeed.web.siliconinvestor import SiliconInvestorPage
+
+
+def test_readers_share_one_session():
+    """Test that all readers use the process-wide session by default."""
+    rss = RSSReader(publisher="foo", feed_title="foo", rss_url="https://foo.com/feed")
+    forum = SiliconInvestorPage(title="foo", url="https://www.siliconinvestor.com/x")
+
+    assert rss.session is get_session()
+    assert forum.session is get_session()
+
+
+def test_session_pool_settings():
+    """Test that pool size and compression settings are applied."""
+    manager = SessionManager(pool_connections=3, pool_maxsize=7, compression=False)
+    session = manager.session
+    adapter = session.get_adapter("https://example.com")
+
+    assert manager.session is session
+    assert adapter._pool_connections == 3
+    assert adapter._pool_maxsize == 7
+    assert session.headers["Accept-Encoding"] == "identity"
+
+    manager.configure(compression=True)
+    assert manager.session is not session
+    assert "gzip" in manager.session.headers["Accept-Encoding"]
+
+
+@responses.activate
+def test_reader_uses_given_session():
+    """Test that a reader can be given its own session."""
+    responses.get("https://foo.com/feed", body="<rss><channel></channel></rss>")
+    manager = SessionManager()
+    reader = RSSReader(
+        publisher="foo",
+        feed_title="foo",
+        rss_url="https://foo.com/feed",
+        session=manager.session,
+    )
+
+    assert reader.get_articles() == []
+    assert "stonksfeed" in responses.calls[0].request.headers["User-Agent"]
@@ -0,0 +1,298 @@
+"""Tests for the Silicon Investor forum scraper."""
+
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import responses
+from bs4 import SoupStrainer
+
+from stonksfeed.net.hosts import HostLimiter
+from stonksfeed.store import CacheStats, MemoryStore
+from stonksfeed.web.siliconinvestor import SiliconInvestorPage
+
+DATA_DIR = Path(__file__).parent / "data"
+FORUM_URL = "https://www.siliconinvestor.com/subject.aspx?subjectid=58128"
+
+
+@pytest.fixture(autouse=True)
+def unthrottled():
+    """Lift the Silicon Investor rate limit so tests don't wait on it."""
+    with patch("stonksfeed.rss.base.host_limiter", HostLimiter(rate=1000, host_rates={})):
+        yield
+
+
+@pytest.fixture
+def forum_page() -> bytes:
+    """Recorded Silicon Investor forum list page."""
+    return (DATA_DIR / "siliconinvestor.html").read_bytes()
+
+
+def _serve_list_page(content: bytes) -> responses.RequestsMock:
+    mock = responses.RequestsMock(assert_all_requests_are_fired=False)
+    mock.get(FORUM_URL, body=content)
+    return mock
+
+
+def test_get_articles_parses_rows(forum_page):
+    """Test that every message row becomes an article with its post date."""
+    page = SiliconInvestorPage(title="AMD, ARMH, INTC, NVDA", url=FORUM_URL, list_dates=False)
+
+    with _serve_list_page(forum_page):
+        with patch.object(page, "_fetch_post_date", return_value=1700000000):
+            articles = page.get_articles()
+
+    assert len(articles) == 25
+    article = articles[0].asdict()
+    assert article["headline"] == "Hey. It's all about percentages."
+    assert article["link"] == "http://www.siliconinvestor.com/readmsg.aspx?msgid=34589932"
+    assert article["author"] == "Pravin Kamdar"
+    assert article["pubdate"] == 1700000000
+    assert article["source_type"] == "forum post"
+
+
+def test_post_dates_fetched_concurrently(forum_page):
+    """Test that post pages are fetched in parallel, not one after another."""
+    page = SiliconInvestorPage(title="AMD", url=FORUM_URL, max_workers=25, list_dates=False)
+    page.limiter = HostLimiter(max_per_host=25, rate=1000, host_rates={})
+
+    def slow_post_date(url):
+        time.sleep(0.1)
+        return 1700000000
+
+    start = time.monotonic()
+    with _serve_list_page(forum_page):
+        with patch.object(page, "_fetch_post_date", side_effect=slow_post_date):
+            articles = page.get_articles()
+
+    assert len(articles) == 25
+    assert time.monotonic() - start < 1.0
+
+
+def test_post_dates_respect_host_limit(forum_page):
+    """Test that no more than max_per_host post pages are in flight."""
+    page = SiliconInvestorPage(title="AMD", url=FORUM_URL, max_workers=10, list_dates=False)
+    page.limiter = HostLimiter(max_per_host=3, rate=1000, host_rates={})
+    in_flight = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def counting_post_date(url):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.02)
+        with lock:
+            in_flight -= 1
+        return 1700000000
+
+    with _serve_list_page(forum_page):
+        with patch.object(page, "_fetch_post_date", side_effect=counting_post_date):
+            page.get_articles()
+
+    assert peak == 3
+
+
+def test_slow_or_failed_posts_fall_back(forum_page):
+    """Test that slow and failing posts use the fallback timestamp."""
+    page = SiliconInvestorPage(title="AMD", url=FORUM_URL, max_workers=25, list_dates=False)
+    page.limiter = HostLimiter(max_per_host=25, rate=1000, host_rates={})
+    page.POST_DATES_TIMEOUT = 0.2
+
+    def flaky_post_date(url):
+        if url.endswith("34589932"):
+            time.sleep(1)
+            return 1
+        if url.endswith("34589925"):
+            raise RuntimeError("boom")
+        return 1700000000
+
+    start = time.monotonic()
+    with _serve_list_page(forum_page):
+        with patch.object(page, "_fetch_post_date", side_effect=flaky_post_date):
+            articles = page.get_articles()
+
+    assert time.monotonic() - start < 0.8
+    assert articles[0].pubdate not in (1, 1700000000)
+    assert articles[1].pubdate == articles[0].pubdate
+    assert all(a.pubdate == 1700000000 for a in articles[2:])
+
+
+def test_post_date_cache_skips_known_messages(forum_page):
+    """Test that cached message IDs are not fetched again."""
+    cache = MemoryStore()
+    cache.set("34589932", 1600000000)
+    page = SiliconInvestorPage(title="AMD", url=FORUM_URL, date_cache=cache, list_dates=False)
+    fetched = []
+
+    def record_post_date(url):
+        fetched.append(url)
+        return 1700000000
+
+    with _serve_list_page(forum_page):
+        with patch.object(page, "_fetch_post_date", side_effect=record_post_date):
+            articles = page.get_articles()
+
+    assert articles[0].pubdate == 1600000000
+    assert len(fetched) == 24
+    assert page.cache_stats.hits == 1
+    assert page.cache_stats.misses == 24
+    assert cache.get("34589925") == 1700000000
+
+    # A second run is served entirely from the cache
+    page.cache_stats = CacheStats()
+    fetched.clear()
+    with _serve_list_page(forum_page):
+        with patch.object(page, "_fetch_post_date", side_effect=record_post_date):
+            page.get_articles()
+
+    assert fetched == []
+    assert page.cache_stats.hits == 25
+
+
+def test_post_date_cache_ignores_failed_fetches(forum_page):
+    """Test that fallback timestamps are never cached."""
+    cache = MemoryStore()
+    page = SiliconInvestorPage(title="AMD", url=FORUM_URL, date_cache=cache, list_dates=False)
+
+    with _serve_list_page(forum_page):
+        with patch.object(page, "_fetch_post_date", return_value=None):
+            page.get_articles()
+
+    assert cache.get("34589932") is None
+
+
+def test_watermark_skips_seen_messages(forum_page):
+    """Test that messages at or below the watermark are skipped before any post fetch."""
+    store = MemoryStore()
+    store.set(FORUM_URL, {"position": 34589803, "keys": {"34589803": 34589803}})
+    page = SiliconInvestorPage(title="AMD", url=FORUM_URL, watermark_store=store, list_dates=False)
+    fetched = []
+
+    def record_post_date(url):
+        fetched.append(url)
+        return 1700000000
+
+    with _serve_list_page(forum_page):
+        with patch.object(page, "_fetch_post_date", side_effect=record_post_date):
+            articles = page.get_articles()
+    page.commit_state()
+
+    assert [a.link.rsplit("=", 1)[1] for a in articles] == [
+        "34589932",
+        "34589925",
+        "34589905",
+        "34589823",
+    ]
+    assert len(fetched) == 4
+    assert page.skipped_seen == 21
+    assert store.get(FORUM_URL)["position"] == 34589932
+
+
+@pytest.fixture
+def post_page() -> bytes:
+    """Silicon Investor post page (reply) with the site's full page chrome."""
+    return (DATA_DIR / "siliconinvestor_post.html").read_bytes()
+
+
+def test_scoped_parse_matches_full_parse(forum_page):
+    """Test that parsing only the message rows gives the same articles."""
+    articles = {}
+    for scoped in (True, False):
+        page = SiliconInvestorPage(
+            title="AMD", url=FORUM_URL, scoped_parsing=scoped, list_dates=False
+        )
+        with _serve_list_page(forum_page):
+            with patch.object(page, "_fetch_post_date", return_value=1700000000):
+                articles[scoped] = [a.asdict() for a in page.get_articles()]
+
+    assert len(articles[True]) == 25
+    assert articles[True] == articles[False]
+
+
+def test_extract_post_date_scoped_and_full(post_page):
+    """Test that the post date is read the same way from a scoped or full parse."""
+    scoped = SiliconInvestorPage(title="AMD", url=FORUM_URL)
+    full = SiliconInvestorPage(title="AMD", url=FORUM_URL, scoped_parsing=False)
+
+    # 3/1/2024 4:12:55 PM Pacific
+    assert scoped._extract_post_date(post_page) == 1709338375
+    assert full._extract_post_date(post_page) == 1709338375
+
+
+def test_scoped_parse_falls_back_to_full(forum_page):
+    """Test that a scoped parse that finds nothing is redone on the full page."""
+    page = SiliconInvestorPage(title="AMD", url=FORUM_URL)
+    page.MESSAGE_ROWS = SoupStrainer("tr", attrs={"class": "not-on-the-page"})
+
+    assert len(page._find_message_rows(forum_page)) == 25
+
+
+def test_parse_list_date():
+    """Test that precise list page timestamps resolve and vague ones don't."""
+    page = SiliconInvestorPage(title="AMD", url=FORUM_URL)
+    now = page.TIMEZONE.localize(datetime(2024, 3, 1, 9, 30))
+    epoch = int(now.timestamp())
+
+    # Relative times move with the clock, so they are left to the post page
+    assert page._parse_list_date("just now", now) is None
+    assert page._parse_list_date("an hour ago", now) is None
+    assert page._parse_list_date("3 hours ago", now) is None
+    # Times of day are today, or yesterday if still to come
+    assert page._parse_list_date("1 AM", now) == epoch - 8 * 3600 - 1800
+    assert page._parse_list_date("12 AM", now) == epoch - 9 * 3600 - 1800
+    assert page._parse_list_date("10:42 PM", now) == epoch - 10 * 3600 - 48 * 60
+    assert page._parse_list_date("3/1/2024 4:12:55 PM", now) == 1709338375
+    assert page._parse_list_date("yesterday", now) is None
+    assert page._parse_list_date("2/27/2024", now) is None
+
+
+def test_list_dates_are_stable_between_runs():
+    """Test that a post resolves to the same date on each run that lists it."""
+    page = SiliconInvestorPage(title="AMD", url=FORUM_URL)
+
+    def at(*args):
+        return page.TIMEZONE.localize(datetime(2024, *args))
+
+    # (label, first run, later run), both after the post was made
+    runs = [
+        ("10:42 PM", at(2, 29, 22, 50), at(3, 1, 9, 30)),
+        ("1 AM", at(3, 1, 1, 5), at(3, 1, 23, 55)),
+        ("3/1/2024 4:12:55 PM", at(3, 1, 16, 20), at(3, 2, 8, 0)),
+    ]
+
+    for label, first, later in runs:
+        resolved = page._parse_list_date(label, first)
+        assert resolved == page._parse_list_date(label, later)
+        assert resolved <= int(first.timestamp())
+
+
+def test_list_dates_skip_post_fetches(forum_page):
+    """Test that only rows with relative or vague list page dates fetch their post page."""
+    cache = MemoryStore()
+    cache.set("34589932", 1600000000)
+    page = SiliconInvestorPage(title="AMD", url=FORUM_URL, date_cache=cache)
+    fetched = []
+
+    def record_post_date(url):
+        fetched.append(url)
+        return 1700000000
+
+    with _serve_list_page(forum_page):
+        with patch.object(page, "_fetch_post_date", side_effect=record_post_date):
+            articles = page.get_articles()
+
+    # Cached dates win; "1 AM" and "12 AM" come from the list; "an hour ago"
+    # and "yesterday" are fetched
+    assert articles[0].pubdate == 1600000000
+    assert all(a.pubdate == 1700000000 for a in articles[1:9] + articles[11:])
+    assert articles[9].pubdate != 1700000000
+    assert len(fetched) == 22
+    assert (page.dates_from_list, page.post_fetches) == (2, 22)
+    # Only exact dates from post pages are cached
+    assert cache.get(articles[9].link.split("=")[-1]) is None
+    assert cache.get("34589925") == 1700000000
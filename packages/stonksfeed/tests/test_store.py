@@ -0,0 +1,208 @@
+"""Tests for persistent key-value stores."""
+
+from unittest.mock import patch
+
+import boto3
+import pytest
+from moto import mock_aws
+
+from stonksfeed.store import (
+    CacheStats,
+    DynamoDBStore,
+    JsonFileStore,
+    MemoryStore,
+    SQLiteStore,
+    UnprocessedItemsError,
+    open_store,
+)
+
+
+@pytest.fixture
+def state_table():
+    """Create a mock DynamoDB state table."""
+    with mock_aws():
+        client = boto3.client("dynamodb", region_name="us-east-1")
+        client.create_table(
+            TableName="state",
+            KeySchema=[
+                {"AttributeName": "namespace", "KeyType": "HASH"},
+                {"AttributeName": "key", "KeyType": "RANGE"},
+            ],
+            AttributeDefinitions=[
+                {"AttributeName": "namespace", "AttributeType": "S"},
+                {"AttributeName": "key", "AttributeType": "S"},
+            ],
+            BillingMode="PAY_PER_REQUEST",
+        )
+        yield client
+
+
+def test_memory_store_roundtrip():
+    """Test basic get/set on the in-memory store."""
+    store = MemoryStore()
+    store.set("a", 1)
+    store.set_many({"b": {"x": [1, 2]}, "c": "three"})
+
+    assert store.get("a") == 1
+    assert store.get("missing") is None
+    assert store.get_many(["a", "b", "missing"]) == {"a": 1, "b": {"x": [1, 2]}}
+
+
+def test_json_file_store_persists(tmp_path):
+    """Test that the JSON file store survives reopening after flush."""
+    path = tmp_path / "state" / "dates.json"
+    store = JsonFileStore(path)
+    store.set_many({"123": 1700000000, "456": 1700000100})
+    store.flush()
+
+    reopened = JsonFileStore(path)
+    assert reopened.get_many(["123", "456"]) == {"123": 1700000000, "456": 1700000100}
+
+
+def test_sqlite_store_persists(tmp_path):
+    """Test that the SQLite store survives reopening and isolates namespaces."""
+    path = tmp_path / "state.db"
+    store = SQLiteStore(path, "dates")
+    store.set_many({str(i): i for i in range(1200)})
+    store.flush()
+
+    reopened = SQLiteStore(path, "dates")
+    other = SQLiteStore(path, "other")
+    assert len(reopened.get_many(str(i) for i in range(1200))) == 1200
+    assert other.get("1") is None
+
+
+def test_sqlite_namespaces_write_before_flush(tmp_path):
+    """Test that two namespaces on one file can both write before either flushes."""
+    path = tmp_path / "state.db"
+    dates = SQLiteStore(path, "dates")
+    marks = SQLiteStore(path, "marks")
+
+    dates.set("a", 1)
+    marks.set("b", 2)
+    marks.flush()
+    dates.set("c", 3)
+    dates.flush()
+
+    assert SQLiteStore(path, "dates").get_many(["a", "c"]) == {"a": 1, "c": 3}
+    assert SQLiteStore(path, "marks").get("b") == 2
+
+
+@pytest.mark.parametrize(
+    "open_file_store",
+    [
+        lambda path, ttl: JsonFileStore(path / "dates.json", ttl),
+        lambda path, ttl: SQLiteStore(path / "state.db", "dates", ttl),
+    ],
+    ids=["json", "sqlite"],
+)
+def test_file_stores_expire_items(tmp_path, open_file_store):
+    """Test that local stores forget items once their TTL has passed."""
+    with patch("stonksfeed.store.time.time", return_value=1_000_000):
+        store = open_file_store(tmp_path, 60)
+        store.set_many({"old": 1, "kept": 2})
+        store.flush()
+    with patch("stonksfeed.store.time.time", return_value=1_000_050):
+        store = open_file_store(tmp_path, 60)
+        store.set("kept", 3)
+        store.flush()
+
+    with patch("stonksfeed.store.time.time", return_value=1_000_061):
+        reopened = open_file_store(tmp_path, 60)
+        assert reopened.get_many(["old", "kept"]) == {"kept": 3}
+        reopened.set("new", 4)
+        reopened.flush()
+
+    with patch("stonksfeed.store.time.time", return_value=1_000_000):
+        # Expired items were dropped from disk, not just hidden
+        assert open_file_store(tmp_path, 60).get_many(["old", "kept", "new"]) == {
+            "kept": 3,
+            "new": 4,
+        }
+
+
+def test_dynamodb_store_roundtrip(state_table):
+    """Test that the DynamoDB store buffers writes until flush."""
+    store = DynamoDBStore("state", "dates", client=state_table, ttl_seconds=60)
+    store.set_many({str(i): i for i in range(150)})
+
+    # Pending writes are visible before flush
+    assert store.get("1") == 1
+
+    store.flush()
+    reopened = DynamoDBStore("state", "dates", client=state_table)
+    assert len(reopened.get_many(str(i) for i in range(150))) == 150
+    assert DynamoDBStore("state", "other", client=state_table).get("1") is None
+
+    item = state_table.get_item(
+        TableName="state", Key={"namespace": {"S": "dates"}, "key": {"S": "1"}}
+    )["Item"]
+    assert "ttl" in item
+
+
+class ThrottledClient:
+    """DynamoDB client that leaves everything unprocessed for a few calls."""
+
+    def __init__(self, throttled_calls: int) -> None:
+        self.throttled_calls = throttled_calls
+        self.calls = 0
+
+    def batch_write_item(self, RequestItems):
+        self.calls += 1
+        if self.calls <= self.throttled_calls:
+            return {"UnprocessedItems": RequestItems}
+        return {"UnprocessedItems": {}}
+
+    def batch_get_item(self, RequestItems):
+        self.calls += 1
+        if self.calls <= self.throttled_calls:
+            return {"Responses": {}, "UnprocessedKeys": RequestItems}
+        return {"Responses": {"state": []}, "UnprocessedKeys": {}}
+
+
+def test_dynamodb_store_backs_off_when_throttled():
+    """Test that unprocessed items are resent after growing, bounded waits."""
+    delays = []
+    client = ThrottledClient(throttled_calls=3)
+    store = DynamoDBStore("state", "dates", client=client, sleep=delays.append)
+    store.set("a", 1)
+
+    store.flush()
+
+    assert client.calls == 4
+    assert len(delays) == 3
+    assert all(0 <= d <= 0.05 * 2**n for n, d in enumerate(delays))
+
+
+def test_dynamodb_store_gives_up_when_throttled():
+    """Test that a batch still unprocessed after every attempt raises."""
+    client = ThrottledClient(throttled_calls=100)
+    store = DynamoDBStore("state", "dates", client=client, attempts=4, sleep=lambda s: None)
+    store.set_many({"a": 1, "b": 2})
+
+    with pytest.raises(UnprocessedItemsError) as excinfo:
+        store.flush()
+    assert excinfo.value.remaining == 2
+    assert client.calls == 4
+
+    with pytest.raises(UnprocessedItemsError):
+        store.get("a")
+
+
+def test_open_store_selects_backend(tmp_path, monkeypatch):
+    """Test that open_store picks a backend from the environment."""
+    monkeypatch.setenv("STONKSFEED_STATE_DIR", str(tmp_path))
+    monkeypatch.delenv("STONKSFEED_STATE_TABLE", raising=False)
+    monkeypatch.delenv("AWS_LAMBDA_FUNCTION_NAME", raising=False)
+    assert isinstance(open_store("dates"), SQLiteStore)
+
+    monkeypatch.setenv("AWS_LAMBDA_FUNCTION_NAME", "fetch-rss")
+    store = open_store("dates")
+    assert isinstance(store, JsonFileStore)
+    assert store.path == tmp_path / "dates.json"
+
+
+def test_cache_stats_hit_rate():
+    """Test hit rate calculation."""
+    assert CacheStats().hit_rate == 0.0
+    assert CacheStats(hits=3, misses=1).hit_rate == 0.75
@@ -0,0 +1,125 @@
+"""Tests for ticker extraction with the ticker universe."""
+
+from unittest.mock import patch
+
+import pytest
+
+from stonksfeed.nlp.tickers import (
+    TickerExtractor,
+    TickerMatcher,
+    compile_universe,
+    load_universe,
+)
+
+UNIVERSE = """# symbol, then aliases
+NVDA\tNvidia
+GOOGL\tAlphabet\tGoogle
+BAC\tBank of America
+MMM\t3M
+ON\tonsemi
+JNJ\tJohnson & Johnson
+MCD\tMcDonald's
+"""
+
+
+@pytest.fixture
+def universe(tmp_path):
+    path = tmp_path / "universe.tsv"
+    path.write_text(UNIVERSE)
+    return path
+
+
+@pytest.fixture
+def extractor(universe, tmp_path):
+    return TickerExtractor(universe=universe, cache_dir=tmp_path / "cache")
+
+
+def test_load_universe(universe):
+    """Test reading symbols and aliases, skipping comments."""
+    loaded = load_universe(universe)
+
+    assert loaded["GOOGL"] == ["Alphabet", "Google"]
+    assert loaded["NVDA"] == ["Nvidia"]
+    assert len(loaded) == 7
+
+
+def test_aliases_map_to_symbols(extractor):
+    """Test that company names are reported as their symbol."""
+    assert extractor.extract("Nvidia and Bank of America rise; Google falls") == [
+        "BAC",
+        "GOOGL",
+        "NVDA",
+    ]
+
+
+def test_aliases_with_punctuation(extractor):
+    """Test that aliases match word by word, whatever punctuation separates them."""
+    assert extractor.extract("McDonald's and Johnson & Johnson report") == ["JNJ", "MCD"]
+    assert extractor.extract("Johnson and Johnson; mcdonald's") == []
+
+
+def test_lowercase_aliases_match_in_any_case(extractor, universe, tmp_path):
+    """Test that a brand written in lowercase in the universe is found however it's written."""
+    assert extractor.extract("onsemi cuts its outlook") == ["ON"]
+    assert extractor.extract("Shares of Onsemi and ONSEMI slide") == ["ON"]
+    assert extractor.extract("nonsemimetal onsemiconductor") == []
+    # The lowercase aliases survive the compiled cache
+    compiled = TickerMatcher.loads(TickerMatcher.load(universe, tmp_path).dumps())
+    assert compiled.find("onsemi beats") == {"ON"}
+
+
+def test_symbols_must_be_capitalized_whole_words(extractor):
+    """Test that lowercase or embedded symbols aren't matched."""
+    assert extractor.extract("nvda is up, NVDAX is not, but (NVDA) is") == ["NVDA"]
+    assert extractor.extract("alphabet soup at Bank of Americana") == []
+
+
+def test_false_positives_are_ignored(extractor):
+    """Test that symbols that are common words need a $ prefix."""
+    assert extractor.extract("Shares rise ON the news") == []
+    assert extractor.extract("$XYZ and 3M") == ["MMM", "XYZ"]
+
+
+def test_compiled_universe_is_loaded_from_cache(universe, tmp_path):
+    """Test that a second load uses the compiled matcher instead of rebuilding."""
+    cache = tmp_path / "cache"
+    first = TickerMatcher.load(universe, cache)
+
+    with patch.object(TickerMatcher, "build") as build:
+        second = TickerMatcher.load(universe, cache)
+
+    build.assert_not_called()
+    assert first.source == "built"
+    assert second.source.startswith(str(cache))
+    assert second.find("Nvidia") == {"NVDA"}
+
+
+def test_changed_universe_is_rebuilt(universe, tmp_path):
+    """Test that editing the universe file invalidates the cache."""
+    cache = tmp_path / "cache"
+    TickerMatcher.load(universe, cache)
+    universe.write_text(UNIVERSE + "AMD\tAdvanced Micro Devices\n")
+
+    matcher = TickerMatcher.load(universe, cache)
+
+    assert matcher.source == "built"
+    assert matcher.find("Advanced Micro Devices beats") == {"AMD"}
+
+
+def test_corrupt_cache_is_rebuilt(universe, tmp_path):
+    """Test that an unreadable cache file is ignored."""
+    compiled = compile_universe(universe, tmp_path)
+    compiled.write_bytes(b"garbage")
+
+    assert TickerMatcher.load(universe, tmp_path).find("NVDA") == {"NVDA"}
+
+
+def test_bundled_universe(tmp_path):
+    """Test that the default universe covers the common names."""
+    extractor = TickerExtractor(cache_dir=tmp_path)
+
+    assert extractor.extract("Nvidia, Alphabet and $TSLA lead the Nasdaq") == [
+        "GOOGL",
+        "NVDA",
+        "TSLA",
+    ]
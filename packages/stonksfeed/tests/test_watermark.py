@@ -0,0 +1,44 @@
+"""Tests for per-feed watermarks."""
+
+from stonksfeed.watermark import FeedWatermark
+
+
+def test_empty_watermark_accepts_everything():
+    """Test that a feed with no history treats every item as new."""
+    watermark = FeedWatermark()
+
+    assert watermark.is_new(0, "a")
+    assert watermark.is_new(1700000000, "b")
+
+
+def test_advance_skips_seen_and_old_items():
+    """Test that seen keys and items older than the grace window are skipped."""
+    watermark = FeedWatermark(grace=100).advance([(1000, "a"), (950, "b")])
+
+    assert watermark.position == 1000
+    assert not watermark.is_new(1000, "a")
+    assert not watermark.is_new(950, "b")
+    # Back-dated but unseen items within the grace window are new
+    assert watermark.is_new(920, "c")
+    # Anything older than the window is not
+    assert not watermark.is_new(899, "d")
+    assert watermark.is_new(1001, "e")
+
+
+def test_advance_prunes_keys_outside_grace():
+    """Test that the key set only covers the grace window."""
+    watermark = FeedWatermark(grace=100).advance([(1000, "a")]).advance([(1200, "b")])
+
+    assert watermark.keys == {"b": 1200}
+
+
+def test_roundtrip_dict():
+    """Test serialization for storage."""
+    watermark = FeedWatermark(grace=0).advance([(34589932, "34589932")])
+
+    restored = FeedWatermark.from_dict(watermark.to_dict(), grace=0)
+
+    assert restored.position == 34589932
+    assert not restored.is_new(34589932, "34589932")
+    assert not restored.is_new(34589931, "34589931")
+    assert FeedWatermark.from_dict(None).position == 0
@@ -18,14 +18,25 @@ rm -rf "$LAMBDA_DIR/stonksfeed-"*.dist-info 2>/dev/null || true
 echo "    Copying stonksfeed package..."
 cp -r "$PACKAGE_DIR/src/stonksfeed" "$LAMBDA_DIR/"
 
+# Compile the ticker universe and VADER lexicon so cold starts load them instead of parsing
+echo "    Compiling ticker universe and sentiment lexicon..."
+(cd "$PACKAGE_DIR" && uv run python -c \
+    "import sys; from stonksfeed.nlp.tickers import compile_universe; compile_universe(cache_dir=sys.argv[1])" \
+    "$LAMBDA_DIR/stonksfeed/nlp/data")
+(cd "$PACKAGE_DIR" && uv run python -c \
+    "import sys; from stonksfeed.nlp.sentiment import compile_lexicon; compile_lexicon(sys.argv[1])" \
+    "$LAMBDA_DIR/stonksfeed/nlp/data/vader_lexicon.bin")
+
 # Update requirements.txt to include stonksfeed dependencies
 echo "    Updating Lambda requirements.txt..."
 cat > "$LAMBDA_DIR/requirements.txt" << 'EOF'
 requests>=2.31.0
 beautifulsoup4>=4.12.0
+lxml>=5.0.0
 python-dateutil>=2.8.0
 pytz>=2024.1
 boto3>=1.34.0
+vaderSentiment>=3.3.2
 EOF
 
 echo "==> Build complete!"
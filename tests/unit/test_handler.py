@@ -128,3 +128,207 @@ def test_lambda_handler_handles_missing_table_env():
 
     # Restore env for other tests
     os.environ["DYNAMODB_TABLE"] = "test-articles-table"
+
+
+class CannedReader:
+    """Stand-in for a feed reader that returns fixed articles."""
+
+    def __init__(self, title, headlines, delay=0.0):
+        from stonksfeed.dates import PubdateParser
+
+        self.title = title
+        self.url = f"https://example.com/{title}"
+        self.headlines = headlines
+        self.delay = delay
+        self.date_parser = PubdateParser()
+        self.skipped_seen = 0
+        self.retries = 0
+        self.not_modified = False
+        self.committed = False
+
+    def get_articles(self):
+        import time
+
+        from stonksfeed.models import Article
+
+        time.sleep(self.delay)
+        now = int(time.time())
+        return [
+            Article(self.title, self.title, headline, f"{self.url}/{i}", now, "rss")
+            for i, headline in enumerate(self.headlines)
+        ]
+
+    def commit_state(self):
+        self.committed = True
+
+
+@pytest.fixture
+def fresh_state(dynamodb_table):
+    """Point the handler at the mock table, with empty dedup and schedule state."""
+    import handler
+    from stonksfeed.dedup import DedupIndex
+    from stonksfeed.scheduler import AdaptiveScheduler
+    from stonksfeed.store import MemoryStore
+
+    with (
+        patch.object(handler, "dynamodb_client", dynamodb_table),
+        patch.object(handler, "TABLE_NAME", "test-articles-table"),
+        patch.object(handler, "dedup_index", DedupIndex()),
+        patch.object(handler, "scheduler", AdaptiveScheduler(MemoryStore())),
+    ):
+        yield handler
+
+
+def _fetched(*readers):
+    from stonksfeed.fetch import FetchResult
+
+    return [FetchResult(reader, reader.get_articles()) for reader in readers]
+
+
+def _stored_headlines(client):
+    items = client.scan(TableName="test-articles-table")["Items"]
+    return sorted(item["headline"]["S"] for item in items)
+
+
+STORY = "Nvidia beats estimates as data center sales soar"
+
+
+def test_store_results_drops_cross_source_duplicates(fresh_state):
+    """Test that a story from a second source never reaches put_item."""
+    handler = fresh_state
+    results = _fetched(
+        CannedReader("first", [STORY, "Apple unveils new chips for its laptops"]),
+        CannedReader("second", [STORY + "!", "Tesla recalls cars over faulty seat belts"]),
+    )
+
+    with patch.object(handler, "insert_item", wraps=handler.insert_item) as insert:
+        _, counts = handler.store_results(results)
+
+    assert insert.call_count == 3
+    assert counts["inserted"] == 3
+    assert counts["same_story"] == 1
+    assert _stored_headlines(handler.dynamodb_client).count(STORY) == 1
+
+
+def test_store_results_marks_only_inserted_rows_seen(fresh_state):
+    """Test that a row the table already held isn't added to the dedup index."""
+    from stonksfeed.models import ArticleBatch
+
+    handler = fresh_state
+    results = _fetched(CannedReader("feed", [STORY, "Apple unveils new chips for its laptops"]))
+
+    with patch.object(handler, "insert_item", side_effect=[True, False]):
+        _, counts = handler.store_results(results)
+
+    assert counts == {"inserted": 1, "duplicates": 1, "too_old": 0, "same_story": 0}
+    new = handler.dedup_index.select_new(ArticleBatch.from_articles(results[0].articles))
+    assert new.headline == ["Apple unveils new chips for its laptops"]
+
+
+def test_store_results_failed_insert_is_not_seen(fresh_state):
+    """Test that articles after a failed insert are still new next run."""
+    from stonksfeed.models import ArticleBatch
+
+    handler = fresh_state
+    headlines = [STORY, "Apple unveils new chips for its laptops", "Tesla recalls cars again"]
+    results = _fetched(CannedReader("feed", headlines))
+
+    with patch.object(handler, "insert_item", side_effect=[True, RuntimeError("throttled")]):
+        with pytest.raises(RuntimeError):
+            handler.store_results(results)
+
+    new = handler.dedup_index.select_new(ArticleBatch.from_articles(results[0].articles))
+    assert new.headline == headlines[1:]
+
+
+class FakeContext:
+    """Lambda context with a fixed amount of time left."""
+
+    def __init__(self, remaining_ms):
+        self.remaining_ms = remaining_ms
+
+    def get_remaining_time_in_millis(self):
+        return self.remaining_ms
+
+
+def _ticking_deadline(seconds):
+    """A deadline whose clock moves one second on every insert, and the insert stub."""
+    from stonksfeed.deadline import Deadline
+
+    now = [0.0]
+
+    def insert(client, table_name, item):
+        now[0] += 1
+        return True
+
+    return Deadline(seconds, clock=lambda: now[0]), insert
+
+
+def test_store_results_defers_remaining_inserts_at_deadline(fresh_state):
+    """Test that a source cut off mid-insert is deferred along with those after it."""
+    from stonksfeed.models import ArticleBatch
+
+    handler = fresh_state
+    first = CannedReader("first", ["Apple unveils new chips for its laptops", STORY])
+    second = CannedReader("second", ["Tesla recalls cars over seat belts", "Intel cuts jobs"])
+    third = CannedReader("third", ["Amazon opens new warehouse in Ohio"])
+    results = _fetched(first, second, third)
+    deadline, insert = _ticking_deadline(2.5)
+
+    with patch.object(handler, "insert_item", side_effect=insert):
+        stored, counts = handler.store_results(results, deadline)
+
+    assert [r.deferred for r in stored] == [False, True, True]
+    assert all(r.articles for r in stored)
+    assert counts["inserted"] == 3
+    # The insert that didn't happen is still new, so the next run stores it
+    new = handler.dedup_index.select_new(ArticleBatch.from_articles(results[1].articles))
+    assert new.headline == ["Intel cuts jobs"]
+
+
+def test_store_results_checks_deadline_before_enriching(fresh_state):
+    """Test that a source reached after the deadline isn't enriched."""
+    handler = fresh_state
+    results = _fetched(
+        CannedReader("first", ["Apple unveils new chips for its laptops", STORY]),
+        CannedReader("second", ["Tesla recalls cars over seat belts"]),
+    )
+    deadline, insert = _ticking_deadline(2)
+
+    with (
+        patch.object(handler, "insert_item", side_effect=insert),
+        patch.object(handler, "enrich_batch", wraps=handler.enrich_batch) as enrich,
+    ):
+        stored, counts = handler.store_results(results, deadline)
+
+    assert enrich.call_count == 1
+    assert [r.deferred for r in stored] == [False, True]
+    assert counts["inserted"] == 2
+
+
+def test_lambda_handler_defers_slow_sources_to_next_run(fresh_state):
+    """Test that a source cut off by the deadline is fetched first next run."""
+    handler = fresh_state
+    fast = CannedReader("fast", ["Apple unveils new chips for its laptops"])
+    slow = CannedReader("slow", ["Tesla recalls cars over seat belts"], delay=1.0)
+
+    with (
+        patch.object(handler, "build_readers", return_value=([fast, slow], [])),
+        patch.object(handler, "FINALIZE_RESERVE_SECONDS", 0),
+        patch.object(handler, "STORE_RESERVE_SECONDS", 10),
+    ):
+        # 0.3s left for fetching, 10s for storing
+        first = handler.lambda_handler({"force": True}, FakeContext(10_300))
+        slow.delay = 0
+        second = handler.lambda_handler({}, FakeContext(60_000))
+
+    assert first["deferred"] == ["slow"]
+    assert fast.committed
+    assert _stored_headlines(handler.dynamodb_client) == [
+        "Apple unveils new chips for its laptops",
+        "Tesla recalls cars over seat belts",
+    ]
+    # Only the deferred source was due again, and it was stored this time
+    assert second["deferred"] == []
+    assert "Inserted 1 new" in second["body"]
+    assert slow.committed